@@ -0,0 +1,79 @@
+"""
+JSONコーデックのマイクロベンチマーク
+
+在庫サマリの大きな一覧ページを想定し、requestsの response.json() と
+各コーデックによるデコード、および一括登録ペイロードのエンコードの所要時間を比較します。
+
+使い方:
+    python benchmarks/bench_json_codec.py [--rows 5000] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+try:
+    import pylogiless  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pylogiless"))
+
+from pylogiless.api.codec import CODECS, orjson
+from pylogiless.api.session import build_response
+
+
+def make_page(rows: int) -> dict:
+    return {
+        "items": [
+            {
+                "id": i,
+                "article_id": f"A{i:06d}",
+                "article_code": f"CODE-{i:06d}",
+                "warehouse_id": f"W{i % 8}",
+                "quantity": i % 97,
+                "allocated_quantity": i % 13,
+                "updated_at": "2024-01-01T00:00:00+09:00",
+            }
+            for i in range(rows)
+        ],
+        "total": rows,
+    }
+
+
+def make_orders(rows: int) -> dict:
+    return {
+        "orders": [
+            {"code": f"SO-{i}", "lines": [{"article_id": f"A{j}", "quantity": j + 1} for j in range(5)]}
+            for i in range(rows // 5)
+        ]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = json.dumps(make_page(args.rows)).encode("utf-8")
+    orders = make_orders(args.rows)
+    print(f"本文サイズ: {len(body) / 1024:.0f} KiB（{args.rows}件）, 試行回数: {args.repeat}")
+
+    def decode_requests():
+        build_response(200, {"Content-Type": "application/json"}, body).json()
+
+    results = [("requests response.json()", timeit.timeit(decode_requests, number=args.repeat))]
+    for name, codec_class in CODECS.items():
+        if name == "orjson" and orjson is None:
+            print("orjson: 未インストールのためスキップ")
+            continue
+        codec = codec_class()
+        results.append((f"{name} loads", timeit.timeit(lambda: codec.loads(body), number=args.repeat)))
+        results.append((f"{name} dumps", timeit.timeit(lambda: codec.dumps(orders), number=args.repeat)))
+
+    for label, seconds in results:
+        print(f"{label:<28} {seconds / args.repeat * 1000:8.2f} ms/回")
+
+
+if __name__ == "__main__":
+    main()
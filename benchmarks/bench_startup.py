@@ -0,0 +1,68 @@
+"""
+起動時間のベンチマーク
+
+新しいPythonプロセスごとに import と LogilessClient の生成にかかる時間を計測します。
+「全て読み込み」は全ての公開名を読み込んだ場合（遅延読み込みを行わない場合に相当）の時間です。
+
+使い方:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("requests", "urllib3", "httpx", "numpy", "orjson", "sqlite3")
+
+SCENARIOS = [
+    ("import pylogiless", "import pylogiless"),
+    ("クライアント生成", "from pylogiless import LogilessClient\nclient = LogilessClient('token', 'merchant')"),
+    (
+        "全リソースへのアクセス",
+        "from pylogiless import LogilessClient\nfrom pylogiless.api.client import RESOURCES\n"
+        "client = LogilessClient('token', 'merchant')\nfor name in RESOURCES:\n    getattr(client, name)",
+    ),
+    (
+        "セッション生成（初回リクエスト前）",
+        "from pylogiless import LogilessClient\nclient = LogilessClient('token', 'merchant')\nclient.session",
+    ),
+    ("全て読み込み", "from pylogiless import *"),
+]
+
+TEMPLATE = """
+import sys, time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+print(elapsed * 1000, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(code: str, runs: int):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pylogiless")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    samples, loaded = [], ""
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", TEMPLATE.format(code=code, heavy=HEAVY_MODULES)], env=env, text=True
+        )
+        elapsed, _, loaded = output.strip().partition(" ")
+        samples.append(float(elapsed))
+    return statistics.median(samples), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"試行回数: {args.runs}（中央値）")
+    for label, code in SCENARIOS:
+        median, loaded = measure(code, args.runs)
+        print(f"{median:8.1f} ms  {label}（読み込まれた重いモジュール: {loaded or 'なし'}）")
+
+
+if __name__ == "__main__":
+    main()
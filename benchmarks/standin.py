@@ -0,0 +1,160 @@
+"""
+ベンチマーク用のLOGILESS APIの代替サーバー
+
+同じ応答ロジックを、ソケットを使わないrequestsのアダプタ（inproc）と
+ローカルのHTTPサーバー（http）の2通りで提供します。
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from pylogiless.api.session import build_response
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class StandInAPI:
+    """
+    一覧・取得・作成・更新に応答する代替API
+
+    URLは merchant/{merchant_id}/{endpoint}[/{id}] の形式を受け付けます。
+    """
+
+    def __init__(self, records: int = 1000):
+        """
+        StandInAPIクラスの初期化
+
+        Args:
+            records (int, optional): 各エンドポイントが返すレコード数
+        """
+        self.records = [
+            {
+                "id": str(i),
+                "code": f"CODE-{i:06d}",
+                "name": f"商品{i}",
+                "article_id": f"A{i:06d}",
+                "warehouse_id": f"W{i % 4}",
+                "quantity": i % 97,
+                "updated_at": "2024-01-01T00:00:00+09:00",
+            }
+            for i in range(1, records + 1)
+        ]
+        self._bodies: Dict[Tuple[int, int], bytes] = {}
+        self._next_id = records + 1
+        self._lock = threading.Lock()
+
+    def handle(self, method: str, url: str, body: Optional[bytes]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        リクエストに応答する
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL（クエリを含む）
+            body (Optional[bytes]): リクエストボディ
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: ステータスコード、ヘッダー、本文
+        """
+        parts = urlsplit(url)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        index = segments.index("merchant") if "merchant" in segments else -1
+        if index < 0 or len(segments) < index + 3:
+            return 404, JSON_HEADERS, b'{"error": "not_found"}'
+        resource_id = segments[index + 3] if len(segments) > index + 3 else None
+
+        if method == "GET" and resource_id is None:
+            query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            return 200, JSON_HEADERS, self._page(int(query.get("page", 1)), int(query.get("limit", 100)))
+        if method == "GET":
+            position = int(resource_id) - 1 if resource_id.isdigit() else -1
+            if not 0 <= position < len(self.records):
+                return 404, JSON_HEADERS, b'{"error": "not_found"}'
+            return 200, JSON_HEADERS, json.dumps(self.records[position]).encode("utf-8")
+        if method in ("POST", "PUT"):
+            data = json.loads(body or b"{}")
+            with self._lock:
+                new_id = resource_id or str(self._next_id)
+                self._next_id += resource_id is None
+            status = 201 if method == "POST" else 200
+            return status, JSON_HEADERS, json.dumps({**data, "id": new_id}).encode("utf-8")
+        return 405, JSON_HEADERS, b'{"error": "method_not_allowed"}'
+
+    def _page(self, page: int, limit: int) -> bytes:
+        # 一覧の本文はページごとに1回だけ生成する（サーバー側のコストを計測に含めない）
+        key = (page, limit)
+        body = self._bodies.get(key)
+        if body is None:
+            items = self.records[(page - 1) * limit:page * limit]
+            body = json.dumps({"items": items, "total": len(self.records)}).encode("utf-8")
+            self._bodies[key] = body
+        return body
+
+
+class StandInAdapter(BaseAdapter):
+    """
+    ソケットを使わずに StandInAPI へ送信するrequestsのアダプタ
+    """
+
+    def __init__(self, api: StandInAPI):
+        super().__init__()
+        self.api = api
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        status, headers, content = self.api.handle(request.method, request.url, body)
+        response = build_response(status, headers, content, url=request.url)
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class StandInServer:
+    """
+    StandInAPI をローカルのHTTPサーバーとして起動するクラス
+    """
+
+    def __init__(self, api: StandInAPI):
+        api_ref = api
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # ヘッダーと本文が別々に送られるため、Nagleアルゴリズムによる遅延を避ける
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, content = api_ref.handle(self.command, self.path, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
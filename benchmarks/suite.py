@@ -0,0 +1,272 @@
+"""
+クライアントのホットパスのマイクロベンチマーク
+
+代替サーバー（standin.py）に対して get/list/create と、その内訳となる処理
+（ヘッダー生成、URL生成、エラー変換、レスポンス解析）を計測し、
+1回あたりの所要時間・スループット・メモリ割り当てを表示します。
+
+使い方:
+    python benchmarks/suite.py                      # 計測して表示
+    python benchmarks/suite.py --save-baseline      # 結果を baselines.json に保存
+    python benchmarks/suite.py --compare            # baselines.json と比較し、劣化があれば終了コード1
+    python benchmarks/suite.py --transport http -k list
+    python benchmarks/suite.py --cassette day.jsonl.gz  # 記録したGETを再生して実際のペイロードで計測
+
+ベースラインは計測したマシンに依存します。比較は同じ環境で保存したベースラインに対して行ってください。
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import pylogiless  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pylogiless"))
+
+from pylogiless import Cassette, LogilessClient
+from pylogiless.api.cassette import read_cassette
+from pylogiless.api.client import build_request_headers, parse_response
+from pylogiless.api.errors import LogilessError, raise_for_error
+from pylogiless.api.session import build_response
+
+from standin import StandInAdapter, StandInAPI, StandInServer
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+# 劣化と判定する指標（値が大きいほど悪い）
+REGRESSION_METRICS = ("median_us", "alloc_peak_bytes")
+# 計測のばらつきとみなす差（1µs未満の処理で率だけが大きく変わるのを避ける）
+ABSOLUTE_TOLERANCE = {"median_us": 1.0, "alloc_peak_bytes": 256}
+
+Scenario = Tuple[str, Callable[[], Any]]
+
+
+def build_scenarios(client: LogilessClient) -> List[Scenario]:
+    """
+    計測するシナリオを生成する
+
+    Args:
+        client (LogilessClient): 代替サーバーに接続したクライアント
+
+    Returns:
+        List[Scenario]: シナリオ名と1回分の処理の組
+    """
+    article = client.article
+    order = {"code": "SO-1", "lines": [{"article_id": "A000001", "quantity": 1}]}
+    list_body = build_response(200, {"Content-Type": "application/json"}, json.dumps(
+        {"items": StandInAPI(100).records, "total": 100}
+    ).encode("utf-8"))
+    error_body = {"error": "rate_limited", "error_description": "too many requests"}
+
+    def raise_error() -> None:
+        try:
+            raise_for_error(429, error_body, {"Retry-After": "1"})
+        except LogilessError:
+            pass
+
+    return [
+        ("get", lambda: article.get("1")),
+        ("list", lambda: article.list(page=1, limit=100)),
+        ("create", lambda: client.sales_order.create(order)),
+        ("component.build_request_headers", lambda: build_request_headers(client.auth, None)),
+        ("component.make_url", lambda: article._make_url("123")),
+        ("component.raise_for_error", raise_error),
+        ("component.parse_response.list", lambda: parse_response(list_body)),
+    ]
+
+
+def build_cassette_scenarios(client: LogilessClient, path: str) -> List[Scenario]:
+    """
+    カセットに記録されたGETを順に再生するシナリオを生成する
+
+    Args:
+        client (LogilessClient): カセットを組み込んだクライアント
+        path (str): カセットファイルのパス
+
+    Returns:
+        List[Scenario]: シナリオ名と1回分の処理の組（1回ごとに次の記録を送信）
+    """
+    urls = [entry["url"] for entry in read_cassette(path) if entry["method"] == "GET" and entry["status"] < 400]
+    if not urls:
+        raise SystemExit(f"{path} に再生できるGETの記録がありません")
+    position = [0]
+
+    def replay() -> Any:
+        url = urls[position[0] % len(urls)]
+        position[0] += 1
+        return client.request("GET", url)
+
+    return [("cassette.get", replay)]
+
+
+def measure(func: Callable[[], Any], iterations: int, warmup: int, alloc_iterations: int) -> Dict[str, float]:
+    """
+    1つのシナリオを計測する
+
+    Args:
+        func (Callable[[], Any]): 1回分の処理
+        iterations (int): 計測する回数
+        warmup (int): 計測前に実行する回数
+        alloc_iterations (int): メモリ割り当てを計測する回数（tracemalloc使用）
+
+    Returns:
+        Dict[str, float]: median_us、p95_us、ops_per_sec、alloc_peak_bytes、alloc_blocks を含む辞書
+    """
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    gc.disable()
+    try:
+        samples = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            t0 = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - t0)
+        total = time.perf_counter() - started
+    finally:
+        gc.enable()
+    samples.sort()
+
+    # 1回の処理中の最大使用量と、処理後に残っている（戻り値を含む）ブロック数
+    peaks, blocks = [], []
+    for _ in range(alloc_iterations):
+        gc.collect()
+        tracemalloc.start()
+        result = func()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        blocks.append(sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename")))
+        tracemalloc.stop()
+        del result
+
+    return {
+        "median_us": round(statistics.median(samples) / 1000, 2),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1] / 1000, 2),
+        "ops_per_sec": round(iterations / total, 1),
+        "alloc_peak_bytes": int(statistics.median(peaks)),
+        "alloc_blocks": int(statistics.median(blocks)),
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    ベースラインと比較して劣化したシナリオを取得する
+
+    Args:
+        results (Dict[str, Dict[str, float]]): 計測結果
+        baseline (Dict[str, Any]): 保存済みのベースライン
+        threshold (float): 劣化と判定する増加率（0.25で25%）
+
+    Returns:
+        List[str]: 劣化の説明
+    """
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            before, after = previous.get(metric), metrics[metric]
+            if before and after > before * (1 + threshold) and after - before > ABSOLUTE_TOLERANCE[metric]:
+                regressions.append(f"{name}: {metric} {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def run(
+    transport: str,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: int,
+    keyword: Optional[str],
+    cassette: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    api = StandInAPI()
+    if cassette is not None:
+        server = None
+        client = LogilessClient("token", "merchant", cassette=Cassette(cassette, allow_repeats=True))
+    elif transport == "http":
+        server = StandInServer(api).__enter__()
+        client = LogilessClient("token", "merchant", api_base_url=server.url)
+    else:
+        server = None
+        client = LogilessClient("token", "merchant", api_base_url="https://standin.invalid/api/v1")
+        client.session.mount("https://standin.invalid/", StandInAdapter(api))
+
+    try:
+        results = {}
+        scenarios = build_cassette_scenarios(client, cassette) if cassette else build_scenarios(client)
+        for name, func in scenarios:
+            if keyword and keyword not in name:
+                continue
+            results[name] = measure(func, iterations, warmup, alloc_iterations)
+            metrics = results[name]
+            print(
+                f"{name:<34} {metrics['median_us']:>9.2f} us  p95 {metrics['p95_us']:>9.2f} us  "
+                f"{metrics['ops_per_sec']:>10.1f} ops/s  peak {metrics['alloc_peak_bytes']:>8} B  "
+                f"blocks {metrics['alloc_blocks']:>6}"
+            )
+        return results
+    finally:
+        client.close()
+        if server is not None:
+            server.__exit__(None, None, None)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--transport", choices=("inproc", "http"), default="inproc")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--alloc-iterations", type=int, default=20)
+    parser.add_argument("--cassette", help="代替サーバーの代わりに再生するカセットファイル")
+    parser.add_argument("-k", dest="keyword", help="名前にこの文字列を含むシナリオのみ実行")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    transport = "cassette" if args.cassette else args.transport
+    print(f"transport={transport} iterations={args.iterations} python={platform.python_version()}")
+    results = run(args.transport, args.iterations, args.warmup, args.alloc_iterations, args.keyword, args.cassette)
+
+    baselines: Dict[str, Any] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    status = 0
+    if args.compare:
+        baseline = baselines.get(transport)
+        if baseline is None:
+            print(f"{args.baseline} に transport={transport} のベースラインがありません")
+            return 1
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"劣化: {line}")
+        if regressions:
+            status = 1
+        else:
+            print(f"ベースラインからの劣化はありません（しきい値 {args.threshold * 100:.0f}%）")
+
+    if args.save_baseline:
+        entry = baselines.setdefault(transport, {"results": {}})
+        entry["python"] = platform.python_version()
+        entry["platform"] = platform.platform()
+        entry["results"].update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        print(f"ベースラインを保存しました: {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
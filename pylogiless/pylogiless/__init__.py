@@ -5,26 +5,9 @@ pylogiless - LOGILESS API クライアントライブラリ
 OAuth2認証と主要なAPIエンドポイントに対応しています。
 """
 
-from .api.auth import LogilessAuth
-from .api.client import (
-    LogilessClient,
-    APIResource,
-    ArticleResource,
-    ActualInventorySummaryResource,
-    LogicalInventorySummaryResource,
-    OutboundDeliveryResource,
-    InboundDeliveryResource,
-    SalesOrderResource,
-    WarehouseResource,
-    StoreResource,
-    LocationResource,
-    ReorderPointResource,
-    SupplierResource,
-    ArticleMapResource,
-    DailyInventorySummaryResource,
-    TransactionLogResource,
-    InterWarehouseTransferResource,
-)
+from typing import TYPE_CHECKING
+
+# 例外クラスは軽量なため即時に読み込む
 from .api.errors import (
     LogilessError,
     LogilessAuthError,
@@ -32,33 +15,28 @@ from .api.errors import (
     LogilessRateLimitError,
     LogilessResourceLockedError,
     LogilessServerError,
+    LogilessTimeoutError,
+    LogilessDeadlineExceeded,
+    LogilessCircuitOpenError,
 )
 
+from . import api
+from .api import __all__
+
 __version__ = "0.1.0"
 
-__all__ = [
-    "LogilessClient",
-    "LogilessAuth", 
-    "LogilessError",
-    "LogilessAuthError",
-    "LogilessValidationError",
-    "LogilessRateLimitError",
-    "LogilessResourceLockedError",
-    "LogilessServerError",
-    "APIResource",
-    "ArticleResource",
-    "ActualInventorySummaryResource",
-    "LogicalInventorySummaryResource",
-    "OutboundDeliveryResource",
-    "InboundDeliveryResource",
-    "SalesOrderResource",
-    "WarehouseResource",
-    "StoreResource",
-    "LocationResource",
-    "ReorderPointResource",
-    "SupplierResource", 
-    "ArticleMapResource",
-    "DailyInventorySummaryResource",
-    "TransactionLogResource",
-    "InterWarehouseTransferResource",
-] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .api import *  # noqa: F401,F403
+
+
+def __getattr__(name: str):
+    # 公開名と定義モジュールの対応は pylogiless.api の _EXPORTS のみで管理し、ここでは委譲する
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(api, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,28 +5,12 @@ pylogiless - LOGILESS API クライアントライブラリ
 OAuth2認証と主要なAPIエンドポイントに対応しています。
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .auth import LogilessAuth
-from .client import (
-    LogilessClient,
-    APIResource,
-    ArticleResource,
-    ActualInventorySummaryResource,
-    LogicalInventorySummaryResource,
-    OutboundDeliveryResource,
-    InboundDeliveryResource,
-    SalesOrderResource,
-    WarehouseResource,
-    StoreResource,
-    LocationResource,
-    ReorderPointResource,
-    SupplierResource,
-    ArticleMapResource,
-    DailyInventorySummaryResource,
-    TransactionLogResource,
-    InterWarehouseTransferResource,
-)
+# 例外クラスは軽量なため即時に読み込む
 from .errors import (
     LogilessError,
     LogilessAuthError,
@@ -34,12 +18,136 @@ from .errors import (
     LogilessRateLimitError,
     LogilessResourceLockedError,
     LogilessServerError,
+    LogilessTimeoutError,
+    LogilessDeadlineExceeded,
+    LogilessCircuitOpenError,
 )
 
+# 公開名と定義モジュールの対応（requestsやhttpxなどの読み込みを避けるため、初めて参照されたときに読み込む）
+_EXPORTS = {
+    "LogilessAuth": "auth",
+    "LogilessClient": "client",
+    "APIResource": "client",
+    "ArticleResource": "client",
+    "ActualInventorySummaryResource": "client",
+    "LogicalInventorySummaryResource": "client",
+    "OutboundDeliveryResource": "client",
+    "InboundDeliveryResource": "client",
+    "SalesOrderResource": "client",
+    "WarehouseResource": "client",
+    "StoreResource": "client",
+    "LocationResource": "client",
+    "ReorderPointResource": "client",
+    "SupplierResource": "client",
+    "ArticleMapResource": "client",
+    "DailyInventorySummaryResource": "client",
+    "TransactionLogResource": "client",
+    "InterWarehouseTransferResource": "client",
+    "LogilessSession": "session",
+    "AsyncLogilessClient": "async_client",
+    "AsyncAPIResource": "async_client",
+    "RateLimiter": "ratelimit",
+    "RetryPolicy": "retry",
+    "ResponseCache": "cache",
+    "ValidatorStore": "conditional",
+    "InventoryMirror": "sync",
+    "InventorySync": "sync",
+    "InventorySnapshot": "snapshot",
+    "Article": "models",
+    "ActualInventorySummary": "models",
+    "LogicalInventorySummary": "models",
+    "SalesOrder": "models",
+    "OutboundDelivery": "models",
+    "Record": "models",
+    "JSONCodec": "codec",
+    "get_codec": "codec",
+    "ItemStream": "streaming",
+    "BulkItemResult": "bulk",
+    "BulkReport": "bulk",
+    "LookupResult": "bulk",
+    "SingleFlight": "coalesce",
+    "Cassette": "cassette",
+    "Hooks": "hooks",
+    "RequestEvent": "hooks",
+    "MetricsRegistry": "metrics",
+    "deadline": "timeouts",
+    "request_timeout": "timeouts",
+    "Deadline": "timeouts",
+    "CircuitBreaker": "circuit",
+    "CircuitStateChange": "circuit",
+    "ClientPool": "pool",
+    "FairScheduler": "pool",
+}
+
+if TYPE_CHECKING:
+    from .auth import LogilessAuth
+    from .client import (
+        LogilessClient,
+        APIResource,
+        ArticleResource,
+        ActualInventorySummaryResource,
+        LogicalInventorySummaryResource,
+        OutboundDeliveryResource,
+        InboundDeliveryResource,
+        SalesOrderResource,
+        WarehouseResource,
+        StoreResource,
+        LocationResource,
+        ReorderPointResource,
+        SupplierResource,
+        ArticleMapResource,
+        DailyInventorySummaryResource,
+        TransactionLogResource,
+        InterWarehouseTransferResource,
+    )
+    from .session import LogilessSession
+    from .async_client import AsyncLogilessClient, AsyncAPIResource
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .cache import ResponseCache
+    from .conditional import ValidatorStore
+    from .sync import InventoryMirror, InventorySync
+    from .snapshot import InventorySnapshot
+    from .models import (
+        Article,
+        ActualInventorySummary,
+        LogicalInventorySummary,
+        SalesOrder,
+        OutboundDelivery,
+        Record,
+    )
+    from .codec import JSONCodec, get_codec
+    from .streaming import ItemStream
+    from .bulk import BulkItemResult, BulkReport, LookupResult
+    from .coalesce import SingleFlight
+    from .cassette import Cassette
+    from .hooks import Hooks, RequestEvent
+    from .metrics import MetricsRegistry
+    from .timeouts import deadline, request_timeout, Deadline
+    from .circuit import CircuitBreaker, CircuitStateChange
+    from .pool import ClientPool, FairScheduler
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
 __all__ = [
     "LogilessClient",
+    "AsyncLogilessClient",
     "LogilessAuth",
+    "LogilessSession",
     "APIResource",
+    "AsyncAPIResource",
     "ArticleResource",
     "ActualInventorySummaryResource",
     "LogicalInventorySummaryResource",
@@ -50,7 +158,7 @@ __all__ = [
     "StoreResource",
     "LocationResource",
     "ReorderPointResource",
-    "SupplierResource", 
+    "SupplierResource",
     "ArticleMapResource",
     "DailyInventorySummaryResource",
     "TransactionLogResource",
@@ -61,4 +169,38 @@ __all__ = [
     "LogilessRateLimitError",
     "LogilessResourceLockedError",
     "LogilessServerError",
+    "LogilessTimeoutError",
+    "LogilessDeadlineExceeded",
+    "LogilessCircuitOpenError",
+    "RateLimiter",
+    "RetryPolicy",
+    "ResponseCache",
+    "ValidatorStore",
+    "InventoryMirror",
+    "InventorySync",
+    "InventorySnapshot",
+    "Article",
+    "ActualInventorySummary",
+    "LogicalInventorySummary",
+    "SalesOrder",
+    "OutboundDelivery",
+    "Record",
+    "JSONCodec",
+    "get_codec",
+    "ItemStream",
+    "BulkItemResult",
+    "BulkReport",
+    "SingleFlight",
+    "LookupResult",
+    "Cassette",
+    "Hooks",
+    "RequestEvent",
+    "MetricsRegistry",
+    "deadline",
+    "request_timeout",
+    "Deadline",
+    "CircuitBreaker",
+    "CircuitStateChange",
+    "ClientPool",
+    "FairScheduler",
 ]
@@ -0,0 +1,281 @@
+"""
+LOGILESS APIの非同期クライアントモジュール
+
+httpx を利用して asyncio 上でAPIを呼び出します。
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx未インストール時
+    httpx = None
+
+from .auth import LogilessAuth
+from .client import RESOURCE_ENDPOINTS, LazyResource, LogilessClient, build_request_headers, parse_response
+from .codec import JSONCodec, get_codec
+from .errors import LogilessError, LogilessTimeoutError
+from .timeouts import DEFAULT_TIMEOUT, Timeout
+
+
+class AsyncAPIResource:
+    """
+    非同期APIリソースの基底クラス
+    APIResourceと同じメソッドをコルーチンとして提供します。
+    """
+
+    def __init__(self, client: "AsyncLogilessClient", resource_path: str):
+        """
+        AsyncAPIResourceクラスの初期化
+
+        Args:
+            client (AsyncLogilessClient): AsyncLogilessClientインスタンス
+            resource_path (str): APIリソースのパス
+        """
+        self.client = client
+        self.resource_path = resource_path
+
+    def _make_url(self, path: Optional[str] = None) -> str:
+        """
+        APIリソースのURLを生成する
+
+        Args:
+            path (Optional[str], optional): 追加のパス
+
+        Returns:
+            str: 完全なAPIエンドポイントURL
+        """
+        url = f"{self.client.api_base_url}/{self.resource_path}"
+        if path:
+            url = f"{url}/{path}"
+        return url
+
+    async def get(self, resource_id: str, **params) -> Dict[str, Any]:
+        """
+        リソースを取得する
+
+        Args:
+            resource_id (str): 取得するリソースのID
+            **params: 追加のクエリパラメータ
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+        """
+        return await self.client.request("GET", self._make_url(resource_id), params=params)
+
+    async def list(self, **params) -> Dict[str, Any]:
+        """
+        リソースのリストを取得する
+
+        Args:
+            **params: クエリパラメータ
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+        """
+        return await self.client.request("GET", self._make_url(), params=params)
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        リソースを作成する
+
+        Args:
+            data (Dict[str, Any]): 作成するリソースのデータ
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+        """
+        return await self.client.request("POST", self._make_url(), json=data)
+
+    async def update(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        リソースを更新する
+
+        Args:
+            resource_id (str): 更新するリソースのID
+            data (Dict[str, Any]): 更新データ
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+        """
+        return await self.client.request("PUT", self._make_url(resource_id), json=data)
+
+    async def delete(self, resource_id: str) -> Dict[str, Any]:
+        """
+        リソースを削除する
+
+        Args:
+            resource_id (str): 削除するリソースのID
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+        """
+        return await self.client.request("DELETE", self._make_url(resource_id))
+
+
+def to_httpx_timeout(timeout: Timeout) -> "httpx.Timeout":
+    """
+    同期クライアントと同じ形式のタイムアウトをhttpxのタイムアウトに変換する
+
+    Args:
+        timeout (Timeout): 秒数、(接続タイムアウト, 読み込みタイムアウト) のタプル、またはNone
+
+    Returns:
+        httpx.Timeout: 接続と接続プールの待機には接続タイムアウトを、読み込みと書き込みには読み込みタイムアウトを使用
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect, pool=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncLogilessClient:
+    """
+    LOGILESS APIの非同期クライアントクラス
+
+    LogilessClientと同じリソース属性（article, sales_order など）を持ち、
+    各メソッドはコルーチンとして実行されます。
+    """
+
+    API_BASE_URL = LogilessClient.API_BASE_URL
+
+    def __init__(
+        self,
+        access_token: str,
+        merchant_id: str,
+        api_base_url: Optional[str] = None,
+        max_concurrency: int = 100,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ):
+        """
+        AsyncLogilessClientクラスの初期化
+
+        Args:
+            access_token (str): アクセストークン
+            merchant_id (str): マーチャントID
+            api_base_url (Optional[str], optional): APIベースURL（テスト用など）
+            max_concurrency (int, optional): 同時に実行するリクエストの上限
+            max_connections (int, optional): 最大コネクション数
+            max_keepalive_connections (int, optional): 維持するkeep-aliveコネクション数
+            http_client (Optional[httpx.AsyncClient], optional): 利用する既存のhttpxクライアント
+            json_codec (Union[str, JSONCodec, None], optional): リクエストボディのエンコードと
+                レスポンスのデコードに使うコーデック（"auto" でorjsonがあれば使用）
+            timeout (Timeout, optional): タイムアウト秒数、または (接続タイムアウト, 読み込みタイムアウト) のタプル
+                （Noneの場合はタイムアウトしない。http_client を指定した場合はそのクライアントの設定を使用）
+
+        Raises:
+            ImportError: httpxがインストールされていない場合
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncLogilessClientを利用するにはhttpxが必要です: pip install pylogiless[async]"
+            )
+        self.api_base_url = api_base_url or self.API_BASE_URL
+        self.auth = LogilessAuth(access_token, merchant_id)
+        self.max_concurrency = max_concurrency
+        self.json_codec = get_codec(json_codec) if json_codec is not None else None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.timeout = timeout
+        self.http_client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=to_httpx_timeout(timeout),
+        )
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        同時実行数を制限するセマフォを取得する
+
+        イベントループ上で初めて参照されたときに生成します。
+
+        Returns:
+            asyncio.Semaphore: セマフォ
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """
+        httpxクライアントを閉じる
+        """
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncLogilessClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        APIリクエストを非同期に実行する
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]], optional): URLクエリパラメータ
+            json (Optional[Dict[str, Any]], optional): JSONリクエストボディ
+            headers (Optional[Dict[str, str]], optional): HTTPヘッダー
+            files (Optional[Dict[str, Any]], optional): マルチパートファイル
+
+        Returns:
+            Union[Dict[str, Any], List[Dict[str, Any]]]: APIレスポンス
+
+        Raises:
+            LogilessTimeoutError: 接続または読み込みがタイムアウトした場合
+            LogilessError: APIエラーが発生した場合（元の例外は __cause__ に保持）
+        """
+        request_headers = build_request_headers(self.auth, headers)
+        content = None
+        if self.json_codec is not None and json is not None and files is None:
+            content = self.json_codec.dumps(json)
+            json = None
+
+        try:
+            async with self.semaphore:
+                response = await self.http_client.request(
+                    method,
+                    url,
+                    params=params,
+                    content=content,
+                    json=json,
+                    headers=request_headers,
+                    files=files,
+                )
+            return parse_response(response, self.json_codec)
+
+        except httpx.TimeoutException as e:
+            raise LogilessTimeoutError(f"APIリクエストタイムアウト: {str(e)}") from e
+        except httpx.HTTPError as e:
+            raise LogilessError(f"APIリクエストエラー: {str(e)}") from e
+        except ValueError as e:
+            raise LogilessError(f"JSONパースエラー: {str(e)}") from e
+        except LogilessError:
+            raise
+        except Exception as e:
+            raise LogilessError(f"不明なエラー: {str(e)}") from e
+
+
+def _resource_factory(endpoint: str):
+    return lambda client: AsyncAPIResource(client, f"merchant/{client.auth.merchant_id}/{endpoint}")
+
+
+for _name, _endpoint in RESOURCE_ENDPOINTS.items():
+    setattr(AsyncLogilessClient, _name, LazyResource(_name, _resource_factory(_endpoint)))
+del _name, _endpoint
@@ -4,9 +4,6 @@
 import time
 from typing import Dict, Optional, Tuple
 
-import requests
-from requests.exceptions import RequestException
-
 
 class LogilessAuth:
     """
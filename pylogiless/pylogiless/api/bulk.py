@@ -0,0 +1,202 @@
+"""
+複数レコードの一括登録・更新を扱うモジュール
+
+各レコードをワーカープールで並行に送信し、失敗したレコードがあっても
+残りの処理を続けて、入力と同じ順序で結果を返します。
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .errors import LogilessError
+from .timeouts import submit_with_context
+
+
+class BulkItemResult:
+    """
+    一括処理の1レコード分の結果
+    """
+
+    __slots__ = ("index", "item", "response", "error")
+
+    def __init__(self, index: int, item: Any, response: Any = None, error: Optional[LogilessError] = None):
+        """
+        BulkItemResultクラスの初期化
+
+        Args:
+            index (int): 入力での位置
+            item (Any): 入力したレコード（bulk_updateの場合は (ID, データ) のタプル）
+            response (Any, optional): 成功した場合のAPIレスポンス
+            error (Optional[LogilessError], optional): 失敗した場合の例外
+        """
+        self.index = index
+        self.item = item
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        成功したかどうか
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkItemResult(index={self.index}, {status})"
+
+
+class BulkReport:
+    """
+    一括処理の結果（入力と同じ順序）
+    """
+
+    def __init__(self, results: Sequence[BulkItemResult]):
+        """
+        BulkReportクラスの初期化
+
+        Args:
+            results (Sequence[BulkItemResult]): 各レコードの結果
+        """
+        self.results = list(results)
+
+    def __iter__(self) -> Iterator[BulkItemResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> BulkItemResult:
+        return self.results[index]
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        """
+        成功したレコードの結果
+        """
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        """
+        失敗したレコードの結果
+        """
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        """
+        全てのレコードが成功したかどうか
+        """
+        return all(result.ok for result in self.results)
+
+    def failed_items(self) -> List[Any]:
+        """
+        失敗したレコードの入力を取得する（再実行用）
+
+        Returns:
+            List[Any]: 失敗したレコードの入力
+        """
+        return [result.item for result in self.failed]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        結果の件数を取得する
+
+        Returns:
+            Dict[str, int]: total、succeeded、failed を含む辞書
+        """
+        failed = len(self.failed)
+        return {"total": len(self.results), "succeeded": len(self.results) - failed, "failed": failed}
+
+    def raise_for_errors(self) -> None:
+        """
+        失敗したレコードがある場合は最初の例外を送出する
+
+        Raises:
+            LogilessError: 失敗したレコードがある場合
+        """
+        for result in self.results:
+            if result.error is not None:
+                raise result.error
+
+
+class LookupResult(dict):
+    """
+    get_manyの結果（IDをキーとするレコードの辞書）
+
+    見つからなかったIDは missing に入力と同じ順序で保持されます。
+    """
+
+    def __init__(self, records: Dict[Any, Any], missing: Sequence[Any]):
+        """
+        LookupResultクラスの初期化
+
+        Args:
+            records (Dict[Any, Any]): IDをキーとするレコード
+            missing (Sequence[Any]): 見つからなかったID
+        """
+        super().__init__(records)
+        self.missing = list(missing)
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable[Any], concurrency: int = 4) -> List[Any]:
+    """
+    要素ごとに関数を並行に実行し、戻り値を入力と同じ順序で返す
+
+    例外が発生した場合は未実行の要素を取り消して送出します。
+    呼び出し元のコンテキスト（deadline() の期限など）はワーカーに引き継がれます。
+
+    Args:
+        func (Callable[[Any], Any]): 1要素を処理する関数
+        items (Iterable[Any]): 入力
+        concurrency (int, optional): 同時に実行する数
+
+    Returns:
+        List[Any]: 戻り値のリスト
+
+    Raises:
+        ValueError: concurrencyが1未満の場合
+    """
+    if concurrency < 1:
+        raise ValueError("concurrencyは1以上を指定してください")
+    items = list(items)
+    if concurrency == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [submit_with_context(executor, func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def run_bulk(func: Callable[[Any], Any], items: Iterable[Any], concurrency: int = 4) -> BulkReport:
+    """
+    レコードごとに関数を並行に実行し、結果を入力と同じ順序で返す
+
+    LogilessErrorは結果に記録して処理を続けます。それ以外の例外が発生した場合は
+    未実行のレコードを送信せずに送出します。
+
+    Args:
+        func (Callable[[Any], Any]): 1レコードを処理する関数
+        items (Iterable[Any]): 入力レコード
+        concurrency (int, optional): 同時に実行する数
+
+    Returns:
+        BulkReport: 各レコードの結果
+
+    Raises:
+        ValueError: concurrencyが1未満の場合
+    """
+    items = list(items)
+
+    def run(index: int) -> BulkItemResult:
+        item = items[index]
+        try:
+            return BulkItemResult(index, item, response=func(item))
+        except LogilessError as error:
+            return BulkItemResult(index, item, error=error)
+
+    return BulkReport(map_concurrently(run, range(len(items)), concurrency=concurrency))
@@ -0,0 +1,225 @@
+"""
+APIレスポンスをメモリ上にキャッシュするモジュール
+"""
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+# 変更頻度の低い参照系リソースの既定TTL（秒）
+REFERENCE_TTLS: Dict[str, float] = {
+    "warehouses": 3600.0,
+    "stores": 3600.0,
+    "locations": 3600.0,
+    "suppliers": 3600.0,
+}
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+    """
+    URLとクエリパラメータからキャッシュキーを生成する
+
+    Args:
+        url (str): リクエストURL
+        params (Optional[Dict[str, Any]], optional): URLクエリパラメータ
+
+    Returns:
+        Tuple[str, str]: キャッシュキー
+    """
+    return url, json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """
+    TTLとLRUによるレスポンスキャッシュ
+
+    キャッシュ対象はTTLが設定されたリソース（エンドポイント名で指定）のGETのみです。
+    同じリソースに対して create/update/delete が呼ばれると、そのリソースのエントリを破棄します。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        ResponseCacheクラスの初期化
+
+        Args:
+            max_entries (int, optional): 保持する最大エントリ数
+            ttls (Optional[Dict[str, float]], optional): エンドポイント名（"warehouses" など）ごとのTTL秒数
+                （省略時は REFERENCE_TTLS）
+            default_ttl (Optional[float], optional): ttlsにないエンドポイントのTTL秒数（Noneの場合はキャッシュしない）
+            clock (Callable[[], float], optional): 現在時刻を返す関数
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(REFERENCE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._keys_by_resource: Dict[str, Set[Tuple[str, Hashable]]] = {}
+        # 破棄の世代番号（取得中に破棄されたレスポンスを保存しないために使用）
+        self._generations: Dict[str, int] = {}
+        # clear() の回数（全てのリソースの世代番号に加算する）
+        self._epoch = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+        self._endpoint_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def endpoint_of(resource_path: str) -> str:
+        """
+        リソースパスからエンドポイント名を取り出す
+
+        Args:
+            resource_path (str): APIリソースのパス（例: merchant/1/warehouses）
+
+        Returns:
+            str: エンドポイント名（例: warehouses）
+        """
+        return resource_path.rstrip("/").rsplit("/", 1)[-1]
+
+    def ttl_for(self, resource_path: str) -> Optional[float]:
+        """
+        リソースのTTLを取得する
+
+        Args:
+            resource_path (str): APIリソースのパス
+
+        Returns:
+            Optional[float]: TTL秒数（キャッシュしない場合はNone）
+        """
+        return self.ttls.get(self.endpoint_of(resource_path), self.default_ttl)
+
+    def get(self, resource_path: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        キャッシュからレスポンスを取得する
+
+        Args:
+            resource_path (str): APIリソースのパス
+            key (Hashable): キャッシュキー
+
+        Returns:
+            Tuple[bool, Any]: ヒットしたかどうかと、レスポンスの複製
+        """
+        endpoint = self.endpoint_of(resource_path)
+        entry_key = (resource_path, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] <= self.clock():
+                self._remove(entry_key)
+                self._stats["expirations"] += 1
+                entry = None
+            counter = "hits" if entry is not None else "misses"
+            self._stats[counter] += 1
+            endpoint_stats = self._endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+            endpoint_stats[counter] += 1
+            if entry is None:
+                return False, None
+            self._entries.move_to_end(entry_key)
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def generation(self, resource_path: str) -> int:
+        """
+        リソースの破棄世代番号を取得する
+
+        Args:
+            resource_path (str): APIリソースのパス
+
+        Returns:
+            int: invalidate() または clear() が呼ばれるたびに増える番号
+        """
+        with self._lock:
+            return self._generation(resource_path)
+
+    def _generation(self, resource_path: str) -> int:
+        # ロックを保持した状態で呼び出す。どちらの値も増えるだけのため、和も破棄のたびに必ず増える
+        return self._epoch + self._generations.get(resource_path, 0)
+
+    def set(
+        self,
+        resource_path: str,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        レスポンスをキャッシュに保存する
+
+        Args:
+            resource_path (str): APIリソースのパス
+            key (Hashable): キャッシュキー
+            value (Any): レスポンス
+            ttl (Optional[float], optional): TTL秒数（省略時はリソースの設定値）
+            generation (Optional[int], optional): 取得開始時の世代番号（その後に破棄されていれば保存しない）
+        """
+        ttl = self.ttl_for(resource_path) if ttl is None else ttl
+        if ttl is None or ttl <= 0 or self.max_entries <= 0:
+            return
+        entry_key = (resource_path, key)
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generation(resource_path):
+                return
+            self._entries[entry_key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(entry_key)
+            self._keys_by_resource.setdefault(resource_path, set()).add(entry_key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, resource_path: str) -> int:
+        """
+        リソースのエントリを全て破棄する
+
+        Args:
+            resource_path (str): APIリソースのパス
+
+        Returns:
+            int: 破棄したエントリ数
+        """
+        with self._lock:
+            self._generations[resource_path] = self._generations.get(resource_path, 0) + 1
+            keys = self._keys_by_resource.pop(resource_path, set())
+            for entry_key in keys:
+                self._entries.pop(entry_key, None)
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        全てのエントリを破棄する
+        """
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._keys_by_resource.clear()
+
+    def _remove(self, entry_key: Tuple[str, Hashable]) -> None:
+        self._entries.pop(entry_key, None)
+        keys = self._keys_by_resource.get(entry_key[0])
+        if keys is not None:
+            keys.discard(entry_key)
+            if not keys:
+                del self._keys_by_resource[entry_key[0]]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        キャッシュの統計を取得する
+
+        Returns:
+            Dict[str, Any]: hits, misses, evictions, expirations, invalidations, size と
+                エンドポイントごとの hits/misses（endpoints）を含む辞書
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["endpoints"] = {name: dict(value) for name, value in self._endpoint_stats.items()}
+        return stats
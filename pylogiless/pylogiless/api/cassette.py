@@ -0,0 +1,479 @@
+"""
+リクエストとレスポンスを記録・再生するモジュール（カセット）
+
+LogilessClient のセッションにトランスポートアダプタとして組み込み、実際のAPIとの
+やり取りをJSON Lines形式（拡張子が .gz の場合はgzip圧縮）のファイルに記録します。
+再生時はAPIに接続せず、記録したレスポンスを返します（必要に応じて元のタイミングを再現）。
+
+記録にはリクエストヘッダー（アクセストークンを含む）とCookieを保存しません。
+stream=True のレスポンスは呼び出し元が読み進めるのにあわせて一時ファイルに書き出し、
+最後まで読まれた時点で記録するため、記録中もストリーミングのメモリ使用量は増えません。
+"""
+import base64
+import codecs
+import gzip
+import hashlib
+import json
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from .errors import LogilessError
+from .session import build_response
+
+MODES = ("record", "replay")
+TIMINGS = (None, "latency", "schedule")
+# 本文はデコード済みで保存するため、転送時の符号化に関するヘッダーと Cookie は記録しない
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+# 記録中の本文をメモリに保持する上限（超えた分は一時ファイルに書き出す）
+SPOOL_MAX_SIZE = 1024 * 1024
+# 記録の書き込み時に本文を読み込む単位（base64で区切れるよう3の倍数）
+COPY_CHUNK_SIZE = 3 * 21846
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """
+    リクエストとレスポンスの組を記録・再生するカセット
+
+    同じリクエスト（メソッド・URL・リクエストボディ）が複数回記録されている場合は、
+    記録した順に返します。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        timing: Optional[str] = None,
+        speed: float = 1.0,
+        allow_repeats: bool = False,
+        match_body: bool = True,
+    ):
+        """
+        Cassetteクラスの初期化
+
+        Args:
+            path (str): カセットファイルのパス（.gz で終わる場合はgzip圧縮）
+            mode (str, optional): "record"（APIに送信して記録）または "replay"（記録から再生）
+            timing (Optional[str], optional): 再生時のタイミング
+                （None: 待たずに返す、"latency": 記録時の応答時間だけ待つ、
+                "schedule": 記録時の送信時刻に合わせて返す）
+            speed (float, optional): timing指定時の再生速度（2.0で2倍速）
+            allow_repeats (bool, optional): 記録した回数を超えて同じリクエストが送信された場合に
+                最後のレスポンスを繰り返すかどうか（Falseの場合はエラー）
+            match_body (bool, optional): リクエストボディもリクエストの照合に使うかどうか
+
+        Raises:
+            ValueError: mode、timing、speedが不正な場合
+        """
+        if mode not in MODES:
+            raise ValueError(f"modeは {', '.join(MODES)} のいずれかを指定してください: {mode}")
+        if timing not in TIMINGS:
+            raise ValueError(f"timingは None, 'latency', 'schedule' のいずれかを指定してください: {timing}")
+        if speed <= 0:
+            raise ValueError("speedは0より大きい値を指定してください")
+        self.path = path
+        self.mode = mode
+        self.timing = timing
+        self.speed = speed
+        self.allow_repeats = allow_repeats
+        self.match_body = match_body
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self._entries: Dict[Tuple[str, str, Optional[str]], Deque[Dict[str, Any]]] = {}
+        self._last: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+        self._started = time.monotonic()
+        self._stats = {"recorded": 0, "replayed": 0, "misses": 0, "incomplete": 0}
+        # 組み込んだセッションと、組み込む前のアダプタ（unmount() で元に戻す）
+        self._mounted: List[Tuple[requests.Session, Dict[str, BaseAdapter]]] = []
+        if mode == "replay":
+            self._load()
+
+    def _load(self) -> None:
+        """
+        カセットファイルを読み込む
+        """
+        with _open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = (entry["method"], entry["url"], entry.get("body_sha1") if self.match_body else None)
+                self._entries.setdefault(key, deque()).append(entry)
+
+    def mount(self, session: requests.Session) -> None:
+        """
+        セッションにカセットを組み込む
+
+        記録時は既存のアダプタを記録用のアダプタで包み、再生時は全てのURLを再生用のアダプタに送ります。
+        セッションのアダプタを置き換えるため、同じセッションを使う他の処理にも影響します。
+        元のアダプタは unmount() で戻せます。
+
+        Args:
+            session (requests.Session): 組み込むセッション
+        """
+        self._started = time.monotonic()
+        with self._lock:
+            if not any(mounted is session for mounted, _ in self._mounted):
+                self._mounted.append((session, dict(session.adapters)))
+        if self.mode == "replay":
+            adapter = ReplayAdapter(self)
+            for prefix in ("https://", "http://"):
+                session.mount(prefix, adapter)
+            return
+        for prefix, inner in list(session.adapters.items()):
+            if not isinstance(inner, RecordingAdapter):
+                session.mount(prefix, RecordingAdapter(self, inner))
+
+    def unmount(self, session: requests.Session) -> None:
+        """
+        mount() で置き換えたセッションのアダプタを元に戻す
+
+        組み込んでいないセッションの場合は何もしません。
+
+        Args:
+            session (requests.Session): 元に戻すセッション
+        """
+        with self._lock:
+            for index, (mounted, adapters) in enumerate(self._mounted):
+                if mounted is session:
+                    del self._mounted[index]
+                    break
+            else:
+                return
+        session.adapters.clear()
+        session.adapters.update(adapters)
+
+    def make_key(self, request: requests.PreparedRequest) -> Tuple[str, str, Optional[str]]:
+        """
+        リクエストを照合するキーを生成する
+
+        クエリパラメータは順序に依存しないように並べ替えます。マルチパートのボディは
+        境界文字列が毎回変わるため照合に使いません。
+
+        Args:
+            request (requests.PreparedRequest): リクエスト
+
+        Returns:
+            Tuple[str, str, Optional[str]]: メソッド、正規化したURL、リクエストボディのSHA-1
+        """
+        parts = urlsplit(request.url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        url = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+        digest = None
+        content_type = request.headers.get("Content-Type", "")
+        if self.match_body and request.body and not content_type.startswith("multipart/"):
+            body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+            if isinstance(body, bytes):
+                digest = hashlib.sha1(body).hexdigest()
+        return request.method.upper(), url, digest
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response, started: float) -> None:
+        """
+        リクエストとレスポンスの組を書き込む
+
+        Args:
+            request (requests.PreparedRequest): 送信したリクエスト
+            response (requests.Response): 受信したレスポンス（本文を読み込みます）
+            started (float): 送信を開始した時刻（time.monotonic()）
+        """
+        elapsed = time.monotonic() - started
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as body:
+            body.write(response.content or b"")
+            self.write_entry(request, response, started, elapsed, body)
+
+    def record_stream(self, request: requests.PreparedRequest, response: requests.Response, started: float) -> None:
+        """
+        本文を読み込まずに、呼び出し元が本文を読み終えた時点で記録するようにする
+
+        最後まで読まれずに閉じられたレスポンスは記録しません（stats の incomplete に数えます）。
+
+        Args:
+            request (requests.PreparedRequest): 送信したリクエスト
+            response (requests.Response): 本文が未読のレスポンス（raw を記録用に置き換えます）
+            started (float): 送信を開始した時刻（time.monotonic()）
+        """
+        elapsed = time.monotonic() - started
+
+        def complete(body: IO[bytes]) -> None:
+            self.write_entry(request, response, started, elapsed, body)
+
+        def abandon() -> None:
+            with self._lock:
+                self._stats["incomplete"] += 1
+
+        response.raw = _RecordingBody(response.raw, complete, abandon)
+
+    def write_entry(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        started: float,
+        elapsed: float,
+        body: IO[bytes],
+    ) -> None:
+        """
+        記録を1行書き込む
+
+        本文は COPY_CHUNK_SIZE ずつ読み込んで書き込むため、本文全体をメモリに保持しません。
+        UTF-8として解釈できない本文は body_base64 に保存します。
+
+        Args:
+            request (requests.PreparedRequest): 送信したリクエスト
+            response (requests.Response): 受信したレスポンス
+            started (float): 送信を開始した時刻（time.monotonic()）
+            elapsed (float): レスポンスヘッダーを受信するまでの秒数
+            body (IO[bytes]): 本文を保存したファイル
+        """
+        method, url, digest = self.make_key(request)
+        entry: Dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "body_sha1": digest,
+            "status": response.status_code,
+            "headers": {name: value for name, value in response.headers.items() if name.lower() not in SKIPPED_HEADERS},
+            "offset": round(started - self._started, 6),
+            "elapsed": round(elapsed, 6),
+        }
+        text = _is_utf8(body)
+        prefix = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))[:-1]
+        prefix += ',"body":"' if text else ',"body_base64":"'
+
+        with self._lock:
+            if self._file is None:
+                self._file = _open(self.path, "w")
+            self._file.write(prefix)
+            body.seek(0)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            while True:
+                chunk = body.read(COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if text:
+                    self._file.write(json.dumps(decoder.decode(chunk), ensure_ascii=False)[1:-1])
+                else:
+                    self._file.write(base64.b64encode(chunk).decode("ascii"))
+            self._file.write('"}\n')
+            self._stats["recorded"] += 1
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        リクエストに対応する記録済みのレスポンスを返す
+
+        Args:
+            request (requests.PreparedRequest): リクエスト
+
+        Returns:
+            requests.Response: 記録済みのレスポンス
+
+        Raises:
+            LogilessError: 対応する記録がない場合
+        """
+        key = self.make_key(request)
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries:
+                entry = self._last[key] = entries.popleft()
+            elif self.allow_repeats and key in self._last:
+                entry = self._last[key]
+            else:
+                self._stats["misses"] += 1
+                raise LogilessError(f"カセットに記録がないリクエストです: {key[0]} {key[1]}")
+            self._stats["replayed"] += 1
+
+        self._wait(entry)
+        if "body_base64" in entry:
+            body = base64.b64decode(entry["body_base64"])
+        else:
+            body = entry.get("body", "").encode("utf-8")
+        response = build_response(entry["status"], entry["headers"], body, url=request.url)
+        response.request = request
+        return response
+
+    def _wait(self, entry: Dict[str, Any]) -> None:
+        """
+        timingの指定に従って、レスポンスを返すまで待機する
+
+        Args:
+            entry (Dict[str, Any]): 記録
+        """
+        if self.timing == "latency":
+            delay = entry.get("elapsed", 0.0) / self.speed
+        elif self.timing == "schedule":
+            delay = entry.get("offset", 0.0) / self.speed - (time.monotonic() - self._started)
+        else:
+            return
+        if delay > 0:
+            time.sleep(delay)
+
+    def remaining(self) -> int:
+        """
+        まだ再生されていない記録の数を取得する
+
+        Returns:
+            int: 未再生の記録の数
+        """
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        記録・再生の統計を取得する
+
+        Returns:
+            Dict[str, int]: recorded（記録数）、replayed（再生数）、misses（記録がなかったリクエスト数）、
+                incomplete（最後まで読まれず記録しなかったストリーミングレスポンスの数）を含む辞書
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """
+        記録中のカセットファイルを閉じる
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _is_utf8(body: IO[bytes]) -> bool:
+    """
+    ファイルの内容がUTF-8として解釈できるかどうかを判定する
+    """
+    body.seek(0)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        while True:
+            chunk = body.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                decoder.decode(b"", final=True)
+                return True
+            decoder.decode(chunk)
+    except UnicodeDecodeError:
+        return False
+
+
+class _RecordingBody:
+    """
+    読み込まれた本文を一時ファイルに書き出し、最後まで読まれたら記録する response.raw のラッパー
+
+    requests が使用する stream() と read() 以外の属性は元のオブジェクトに委譲します。
+    """
+
+    def __init__(self, raw: Any, on_complete: Any, on_abandon: Any):
+        self._raw = raw
+        self._on_complete = on_complete
+        self._on_abandon = on_abandon
+        self._spool: Optional[IO[bytes]] = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    def _finish(self) -> None:
+        spool, self._spool = self._spool, None
+        if spool is not None:
+            try:
+                self._on_complete(spool)
+            finally:
+                spool.close()
+
+    def stream(self, amt: int = 2 ** 16, decode_content: Optional[bool] = None) -> Any:
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            if self._spool is not None:
+                self._spool.write(chunk)
+            yield chunk
+        self._finish()
+
+    def read(self, amt: Optional[int] = None, *args: Any, **kwargs: Any) -> bytes:
+        data = self._raw.read(amt, *args, **kwargs)
+        if self._spool is not None:
+            self._spool.write(data)
+            if not data or amt is None:
+                self._finish()
+        return data
+
+    def close(self) -> None:
+        spool, self._spool = self._spool, None
+        if spool is not None:
+            spool.close()
+            self._on_abandon()
+        self._raw.close()
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    既存のアダプタで送信し、リクエストとレスポンスをカセットに記録するアダプタ
+    """
+
+    def __init__(self, cassette: Cassette, inner: BaseAdapter):
+        """
+        RecordingAdapterクラスの初期化
+
+        Args:
+            cassette (Cassette): 記録先のカセット
+            inner (BaseAdapter): 実際に送信するアダプタ
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        started = time.monotonic()
+        response = self.inner.send(request, **kwargs)
+        if kwargs.get("stream"):
+            self.cassette.record_stream(request, response, started)
+        else:
+            self.cassette.record(request, response, started)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    APIに接続せずにカセットからレスポンスを返すアダプタ
+    """
+
+    def __init__(self, cassette: Cassette):
+        """
+        ReplayAdapterクラスの初期化
+
+        Args:
+            cassette (Cassette): 再生するカセット
+        """
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        return self.cassette.play(request)
+
+    def close(self) -> None:
+        pass
+
+
+def read_cassette(path: str) -> List[Dict[str, Any]]:
+    """
+    カセットファイルの記録を全て読み込む（集計や確認用）
+
+    Args:
+        path (str): カセットファイルのパス
+
+    Returns:
+        List[Dict[str, Any]]: 記録のリスト（記録順）
+    """
+    with _open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
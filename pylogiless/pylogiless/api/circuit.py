@@ -0,0 +1,252 @@
+"""
+エンドポイントごとのサーキットブレーカーを扱うモジュール
+
+リソースパスのテンプレート（merchant/{merchant_id}/outbound_deliveries など）ごとに連続した失敗を数え、
+しきい値に達したエンドポイントへの送信を一定時間止めて LogilessCircuitOpenError で即座に失敗させます。
+一定時間後は少数の試行（half-open）を許可し、成功すれば元に戻します。
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .errors import LogilessCircuitOpenError, LogilessDeadlineExceeded, LogilessError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitStateChange:
+    """
+    サーキットの状態の変化（フックの on_circuit_state に渡される）
+    """
+
+    __slots__ = ("key", "old_state", "new_state", "failures")
+
+    def __init__(self, key: str, old_state: str, new_state: str, failures: int):
+        """
+        CircuitStateChangeクラスの初期化
+
+        Args:
+            key (str): リソースパスのテンプレート
+            old_state (str): 変化前の状態
+            new_state (str): 変化後の状態
+            failures (int): 変化した時点の連続失敗数
+        """
+        self.key = key
+        self.old_state = old_state
+        self.new_state = new_state
+        self.failures = failures
+
+    def __repr__(self) -> str:
+        return f"CircuitStateChange({self.key!r}, {self.old_state} -> {self.new_state}, failures={self.failures})"
+
+
+class _Circuit:
+    """
+    1つのエンドポイントの状態
+    """
+
+    __slots__ = ("state", "failures", "successes", "opened_at", "probes", "last_error")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.last_error: Optional[LogilessError] = None
+
+
+def is_failure(error: LogilessError) -> bool:
+    """
+    エンドポイントの障害とみなすエラーかどうかを判定する
+
+    5xxと通信エラー（タイムアウトを含む）を障害とみなします。4xxはエンドポイントが応答しているため、
+    期限切れは呼び出し元の都合のため、障害とみなしません。
+
+    Args:
+        error (LogilessError): 発生したエラー
+
+    Returns:
+        bool: 障害とみなす場合はTrue
+    """
+    if isinstance(error, (LogilessCircuitOpenError, LogilessDeadlineExceeded)):
+        return False
+    if error.status_code is not None:
+        return error.status_code >= 500
+    from requests.exceptions import RequestException
+
+    return isinstance(error.__cause__, RequestException)
+
+
+class CircuitBreaker:
+    """
+    エンドポイントごとのサーキットブレーカー
+
+    複数のクライアントで同じインスタンスを共有できます。
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_predicate: Callable[[LogilessError], bool] = is_failure,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        CircuitBreakerクラスの初期化
+
+        Args:
+            failure_threshold (int, optional): openにする連続失敗数
+            recovery_timeout (float, optional): openからhalf-openに移るまでの秒数
+            half_open_max_calls (int, optional): half-open中に同時に許可する試行数
+            success_threshold (int, optional): half-openからclosedに戻すのに必要な連続成功数
+            failure_predicate (Callable[[LogilessError], bool], optional): 障害とみなすエラーかどうかを判定する関数
+            clock (Callable[[], float], optional): 現在時刻を返す関数
+
+        Raises:
+            ValueError: しきい値が1未満の場合
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("failure_threshold、half_open_max_calls、success_thresholdは1以上を指定してください")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_predicate = failure_predicate
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def _get(self, key: str) -> _Circuit:
+        # ロックを保持した状態で呼び出す
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def _transition(self, key: str, circuit: _Circuit, state: str) -> CircuitStateChange:
+        # ロックを保持した状態で呼び出す
+        change = CircuitStateChange(key, circuit.state, state, circuit.failures)
+        circuit.state = state
+        circuit.successes = 0
+        circuit.probes = 0
+        if state == OPEN:
+            circuit.opened_at = self.clock()
+        elif state == CLOSED:
+            circuit.failures = 0
+            circuit.last_error = None
+        return change
+
+    def before_call(self, key: str) -> Optional[CircuitStateChange]:
+        """
+        送信してよいかを確認する
+
+        Args:
+            key (str): リソースパスのテンプレート
+
+        Returns:
+            Optional[CircuitStateChange]: openからhalf-openに移った場合はその変化
+
+        Raises:
+            LogilessCircuitOpenError: openの場合、またはhalf-openで試行数が上限に達している場合
+                （最後の障害を last_error 属性と __cause__ に保持）
+        """
+        with self._lock:
+            circuit = self._get(key)
+            change = None
+            if circuit.state == OPEN:
+                retry_after = circuit.opened_at + self.recovery_timeout - self.clock()
+                if retry_after > 0:
+                    raise LogilessCircuitOpenError(key, retry_after, circuit.last_error)
+                change = self._transition(key, circuit, HALF_OPEN)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_max_calls:
+                    raise LogilessCircuitOpenError(key, 0.0, circuit.last_error)
+                circuit.probes += 1
+            return change
+
+    def record(self, key: str, error: Optional[LogilessError] = None) -> Optional[CircuitStateChange]:
+        """
+        送信の結果を記録する
+
+        Args:
+            key (str): リソースパスのテンプレート
+            error (Optional[LogilessError], optional): 失敗した場合のエラー（成功した場合はNone）
+
+        Returns:
+            Optional[CircuitStateChange]: 状態が変化した場合はその変化
+        """
+        failed = error is not None and self.failure_predicate(error)
+        with self._lock:
+            circuit = self._get(key)
+            if failed:
+                circuit.last_error = error
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+                if failed:
+                    circuit.failures += 1
+                    return self._transition(key, circuit, OPEN)
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    return self._transition(key, circuit, CLOSED)
+                return None
+            if not failed:
+                circuit.failures = 0
+                return None
+            circuit.failures += 1
+            if circuit.state == CLOSED and circuit.failures >= self.failure_threshold:
+                return self._transition(key, circuit, OPEN)
+            return None
+
+    def release(self, key: str) -> None:
+        """
+        結果を記録せずに終わった試行（LogilessError以外の例外など）の枠を解放する
+
+        Args:
+            key (str): リソースパスのテンプレート
+        """
+        with self._lock:
+            circuit = self._get(key)
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+    def state(self, key: str) -> str:
+        """
+        エンドポイントの状態を取得する
+
+        Args:
+            key (str): リソースパスのテンプレート
+
+        Returns:
+            str: "closed"、"open"、"half_open" のいずれか
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CLOSED
+
+    def states(self) -> Dict[str, Dict[str, object]]:
+        """
+        全てのエンドポイントの状態を取得する
+
+        Returns:
+            Dict[str, Dict[str, object]]: リソースパスのテンプレートごとの state と failures を含む辞書
+        """
+        with self._lock:
+            return {key: {"state": c.state, "failures": c.failures} for key, c in self._circuits.items()}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        エンドポイントの状態をclosedに戻す
+
+        Args:
+            key (Optional[str], optional): リソースパスのテンプレート（省略時は全て）
+        """
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
@@ -2,13 +2,41 @@
 LOGILESS APIのクライアントモジュール
 """
 import json
-from typing import Any, Dict, List, Optional, Type, Union
-
-import requests
-from requests.exceptions import RequestException
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 from .auth import LogilessAuth
-from .errors import LogilessError, raise_for_error
+from .bulk import BulkReport, LookupResult, map_concurrently, run_bulk
+from .cache import ResponseCache, make_cache_key
+from .coalesce import SingleFlight
+from .errors import LogilessDeadlineExceeded, LogilessError, LogilessTimeoutError, raise_for_error
+from .hooks import Hooks, RequestEvent, Route, parse_route
+from .timeouts import DEFAULT_TIMEOUT, Timeout, current_deadline, current_timeout, resolve_timeout
+from .models import (
+    ActualInventorySummary,
+    Article,
+    LogicalInventorySummary,
+    OutboundDelivery,
+    Record,
+    SalesOrder,
+    wrap_page,
+)
+from .pagination import extract_items, iter_pages, iter_pages_parallel
+from .streaming import ItemStream
+
+if TYPE_CHECKING:
+    # requests・sqlite3・orjsonなどの読み込みは最初のリクエストまで遅延させる
+    import requests
+
+    from .cassette import Cassette
+    from .circuit import CircuitBreaker, CircuitStateChange
+    from .codec import JSONCodec
+    from .conditional import ValidatorStore
+    from .metrics import MetricsRegistry
+    from .pool import FairScheduler
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
 
 
 class APIResource:
@@ -17,16 +45,32 @@ class APIResource:
     個別のAPIエンドポイントに対応するリソースクラスの基底となるクラスです。
     """
 
-    def __init__(self, client: "LogilessClient", resource_path: str):
+    # エンドポイント名（merchant/{merchant_id}/ に続くパス）
+    endpoint: Optional[str] = None
+    # ページングに使用するクエリパラメータ名
+    page_param = "page"
+    limit_param = "limit"
+    # as_records=Trueの場合にレコードを変換するモデルクラス
+    model: Optional[Type[Record]] = None
+    # get_manyで使用するIDのフィールド名と、IDで絞り込むクエリパラメータ名
+    # （絞り込みに対応していないエンドポイントではNoneとし、個別のgetで取得する）
+    id_field = "id"
+    id_filter_param: Optional[str] = None
+    id_filter_chunk_size = 50
+    # 一覧APIのレコードが個別取得（get）のレスポンスと同じ形かどうか
+    # （Falseの場合、get_manyで一覧から取得したレコードはgetとは別のキーでキャッシュする）
+    list_record_matches_detail = False
+
+    def __init__(self, client: "LogilessClient", resource_path: Optional[str] = None):
         """
         APIResourceクラスの初期化
 
         Args:
             client (LogilessClient): LogilessClientインスタンス
-            resource_path (str): APIリソースのパス
+            resource_path (Optional[str], optional): APIリソースのパス（省略時はendpointから生成）
         """
         self.client = client
-        self.resource_path = resource_path
+        self.resource_path = resource_path or f"merchant/{client.auth.merchant_id}/{self.endpoint}"
 
     def _make_url(self, path: Optional[str] = None) -> str:
         """
@@ -43,30 +87,318 @@ class APIResource:
             url = f"{url}/{path}"
         return url
 
-    def get(self, resource_id: str, **params) -> Dict[str, Any]:
+    def _record_model(self) -> Type[Record]:
+        """
+        レコードモデルのクラスを取得する
+
+        Returns:
+            Type[Record]: モデルクラス
+
+        Raises:
+            LogilessError: このリソースにモデルが定義されていない場合
+        """
+        if self.model is None:
+            raise LogilessError(f"{type(self).__name__}はレコードモデルに対応していません")
+        return self.model
+
+    def get(self, resource_id: str, as_records: bool = False, **params) -> Dict[str, Any]:
         """
         リソースを取得する
 
         Args:
             resource_id (str): 取得するリソースのID
+            as_records (bool, optional): レスポンスをレコードモデルに変換するかどうか
             **params: 追加のクエリパラメータ
 
         Returns:
-            Dict[str, Any]: APIレスポンス
+            Dict[str, Any]: APIレスポンス（as_records=Trueの場合はレコードモデル）
+        """
+        response = self._get(self._make_url(resource_id), params)
+        if as_records:
+            return self._record_model()(response)
+        return response
+
+    def get_many(
+        self,
+        ids: Iterable[Any],
+        concurrency: int = 4,
+        filter_param: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        **params,
+    ) -> LookupResult:
+        """
+        複数のリソースをまとめて取得する
+
+        レスポンスキャッシュにあるIDはキャッシュから返します。残りのIDは、IDで絞り込める
+        エンドポイントではID一覧を分割してlist()で取得し、そうでなければgetを並行に実行します。
+
+        Args:
+            ids (Iterable[Any]): 取得するリソースのID（重複は1回のみ取得）
+            concurrency (int, optional): 同時に送信するリクエストの上限
+            filter_param (Optional[str], optional): IDで絞り込むクエリパラメータ名（省略時は id_filter_param）
+            chunk_size (Optional[int], optional): 1回のlist()で絞り込むIDの数（省略時は id_filter_chunk_size）
+            **params: 追加のクエリパラメータ
+
+        Returns:
+            LookupResult: IDをキーとするレコードの辞書（見つからなかったIDは missing に保持）
+
+        Raises:
+            LogilessError: 404以外のAPIエラーが発生した場合
         """
-        return self.client.request("GET", self._make_url(resource_id), params=params)
+        wanted = list(dict.fromkeys(ids))
+        found: Dict[Any, Any] = {}
+        filter_param = filter_param or self.id_filter_param
+        cache = self.client.response_cache
+        if cache is not None and cache.ttl_for(self.resource_path) is None:
+            cache = None
+
+        # 個別のgetはそれ自体がキャッシュを参照するため、ここでは絞り込み取得の場合のみ参照する
+        # （getのレスポンスは一覧のレコードと同じか、より詳しいため、どちらのキーも参照する）
+        pending = []
+        for resource_id in wanted:
+            if cache is not None and filter_param:
+                hit, value = cache.get(self.resource_path, make_cache_key(self._make_url(str(resource_id)), params))
+                if not hit and not self.list_record_matches_detail:
+                    hit, value = cache.get(self.resource_path, self._list_cache_key(resource_id, params))
+                if hit:
+                    found[resource_id] = value
+                    continue
+            pending.append(resource_id)
+
+        if pending and filter_param:
+            chunk_size = chunk_size or self.id_filter_chunk_size
+            chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+            by_key = {str(resource_id): resource_id for resource_id in pending}
+            generation = cache.generation(self.resource_path) if cache is not None else None
+
+            def fetch_chunk(chunk: List[Any]) -> List[Dict[str, Any]]:
+                page = self.list(
+                    **{**params, filter_param: ",".join(str(resource_id) for resource_id in chunk), self.limit_param: len(chunk)}
+                )
+                return extract_items(page)
+
+            for items in map_concurrently(fetch_chunk, chunks, concurrency=concurrency):
+                for record in items:
+                    resource_id = by_key.get(str(record.get(self.id_field)))
+                    if resource_id is None or resource_id in found:
+                        continue
+                    found[resource_id] = record
+                    if cache is not None:
+                        cache.set(self.resource_path, self._list_cache_key(resource_id, params), record, generation=generation)
+        elif pending:
+            def fetch_one(resource_id: Any) -> Optional[Dict[str, Any]]:
+                try:
+                    return self.get(str(resource_id), **params)
+                except LogilessError as error:
+                    if error.status_code == 404:
+                        return None
+                    raise
+
+            for resource_id, record in zip(pending, map_concurrently(fetch_one, pending, concurrency=concurrency)):
+                if record is not None:
+                    found[resource_id] = record
+
+        records = {resource_id: found[resource_id] for resource_id in wanted if resource_id in found}
+        return LookupResult(records, [resource_id for resource_id in wanted if resource_id not in found])
 
-    def list(self, **params) -> Dict[str, Any]:
+    def _list_cache_key(self, resource_id: Any, params: Dict[str, Any]) -> Any:
+        """
+        get_manyで一覧から取得したレコードのキャッシュキーを生成する
+
+        Args:
+            resource_id (Any): リソースID
+            params (Dict[str, Any]): 追加のクエリパラメータ
+
+        Returns:
+            Any: list_record_matches_detail がTrueの場合はgetと同じキー、そうでなければ別の名前空間のキー
+        """
+        key = make_cache_key(self._make_url(str(resource_id)), params)
+        if self.list_record_matches_detail:
+            return key
+        return ("list_record",) + key
+
+    def list(self, as_records: bool = False, stream: bool = False, **params) -> Dict[str, Any]:
         """
         リソースのリストを取得する
 
+        stream=Trueの場合はレスポンス本文を受信しながらレコードを1件ずつデコードする
+        ItemStreamを返します。total などのレコード配列以外のキーは、読み進めた時点で
+        ItemStream.meta に格納されます。
+
         Args:
+            as_records (bool, optional): レコード配列をレコードモデルのリストに変換するかどうか
+            stream (bool, optional): レコードを逐次デコードするかどうか
             **params: クエリパラメータ
 
+        Returns:
+            Dict[str, Any]: APIレスポンス（stream=Trueの場合はItemStream）
+        """
+        if stream:
+            model = self._record_model() if as_records else None
+            return self.client.stream("GET", self._make_url(), params=params, transform=model)
+        response = self._get(self._make_url(), params)
+        if as_records:
+            return wrap_page(response, self._record_model())
+        return response
+
+    def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        レスポンスキャッシュを利用してGETリクエストを実行する
+
+        Args:
+            url (str): リクエストURL
+            params (Dict[str, Any]): クエリパラメータ
+
         Returns:
             Dict[str, Any]: APIレスポンス
         """
-        return self.client.request("GET", self._make_url(), params=params)
+        cache = self.client.response_cache
+        if cache is None or cache.ttl_for(self.resource_path) is None:
+            return self.client.request("GET", url, params=params)
+
+        key = make_cache_key(url, params)
+        hit, value = cache.get(self.resource_path, key)
+        if hit:
+            return value
+        generation = cache.generation(self.resource_path)
+        value = self.client.request("GET", url, params=params)
+        cache.set(self.resource_path, key, value, generation=generation)
+        return value
+
+    def _invalidate_cache(self) -> None:
+        """
+        このリソースのキャッシュを破棄する
+        """
+        if self.client.response_cache is not None:
+            self.client.response_cache.invalidate(self.resource_path)
+
+    def iter_pages(
+        self,
+        limit: int = 100,
+        start_page: int = 1,
+        prefetch: bool = True,
+        parallelism: int = 1,
+        ordered: bool = True,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        全ページを取得するジェネレータ
+
+        parallelismが2以上の場合は、最初のページの総件数から残りのページを
+        割り出し、ワーカープールで並列に取得します。
+
+        Args:
+            limit (int, optional): 1ページあたりの件数
+            start_page (int, optional): 最初のページ番号
+            prefetch (bool, optional): 次のページをバックグラウンドで先読みするかどうか
+            parallelism (int, optional): 並列に取得するワーカー数
+            ordered (bool, optional): 並列取得時にページ番号順で返すかどうか
+            **params: クエリパラメータ
+
+        Yields:
+            Dict[str, Any]: 各ページのAPIレスポンス
+        """
+        def fetch_page(page_number: int) -> Dict[str, Any]:
+            return self.list(**{**params, self.page_param: page_number, self.limit_param: limit})
+
+        if parallelism > 1:
+            return iter_pages_parallel(
+                fetch_page, start_page=start_page, limit=limit, parallelism=parallelism, ordered=ordered
+            )
+        return iter_pages(fetch_page, start_page=start_page, limit=limit, prefetch=prefetch)
+
+    def iter_all(
+        self,
+        limit: int = 100,
+        start_page: int = 1,
+        prefetch: bool = True,
+        parallelism: int = 1,
+        ordered: bool = True,
+        as_records: bool = False,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        全ページのレコードを1件ずつ返すジェネレータ
+
+        Args:
+            limit (int, optional): 1ページあたりの件数
+            start_page (int, optional): 最初のページ番号
+            prefetch (bool, optional): 次のページをバックグラウンドで先読みするかどうか
+            parallelism (int, optional): 並列に取得するワーカー数
+            ordered (bool, optional): 並列取得時にページ番号順で返すかどうか
+            as_records (bool, optional): レコードをレコードモデルに変換するかどうか
+            **params: クエリパラメータ
+
+        Yields:
+            Dict[str, Any]: レコード（as_records=Trueの場合はレコードモデル）
+        """
+        model = self._record_model() if as_records else None
+        pages = self.iter_pages(
+            limit=limit,
+            start_page=start_page,
+            prefetch=prefetch,
+            parallelism=parallelism,
+            ordered=ordered,
+            **params,
+        )
+        for page in pages:
+            if model is None:
+                yield from extract_items(page)
+            else:
+                for item in extract_items(page):
+                    yield model(item)
+
+    def export(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        chunk_size: int = 10000,
+        limit: int = 100,
+        resume: bool = True,
+        prefetch: bool = True,
+        overwrite: bool = False,
+        column_types: Optional[Dict[str, str]] = None,
+        **params,
+    ) -> Dict[str, Any]:
+        """
+        全ページのレコードをCSV・JSON Lines・Parquetのファイルに書き出す
+
+        chunk_size件以上たまるごとに書き込んでチェックポイントを保存するため、メモリ使用量は
+        件数によらず一定で、中断した場合は同じ引数で呼び出すと続きから再開します。
+        列の型は最初のページから推定して固定するため、Parquetで以降のページの値が型に合わない場合
+        （integer と推定した列の小数など）は LogilessError になります。その場合は column_types で型を指定してください。
+
+        Args:
+            path (str): 出力先のパス（Parquetの場合はパーツファイルを置くディレクトリ）
+            format (Optional[str], optional): "csv"、"jsonl"、"parquet" のいずれか（省略時は拡張子から判定）
+            chunk_size (int, optional): 1回に書き込むレコード数の目安
+            limit (int, optional): 1ページあたりの件数
+            resume (bool, optional): チェックポイントがあれば再開するかどうか
+            prefetch (bool, optional): 次のページをバックグラウンドで先読みするかどうか
+            overwrite (bool, optional): Parquetで最初から書き出す場合に、空でない出力先ディレクトリの
+                パーツファイルを削除してよいかどうか
+            column_types (Optional[Dict[str, str]], optional): 推定した型を上書きする列名と型
+                （integer, number, boolean, string, json）
+            **params: クエリパラメータ
+
+        Returns:
+            Dict[str, Any]: 書き込んだレコード数（rows）・チャンク数（chunks）・取得したページ数（pages）・
+                再開したかどうか（resumed）
+        """
+        from .export import export_resource
+
+        return export_resource(
+            self,
+            path,
+            format=format,
+            chunk_size=chunk_size,
+            limit=limit,
+            resume=resume,
+            prefetch=prefetch,
+            overwrite=overwrite,
+            column_types=column_types,
+            **params,
+        )
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -78,7 +410,10 @@ class APIResource:
         Returns:
             Dict[str, Any]: APIレスポンス
         """
-        return self.client.request("POST", self._make_url(), json=data)
+        try:
+            return self.client.request("POST", self._make_url(), json=data)
+        finally:
+            self._invalidate_cache()
 
     def update(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -91,7 +426,47 @@ class APIResource:
         Returns:
             Dict[str, Any]: APIレスポンス
         """
-        return self.client.request("PUT", self._make_url(resource_id), json=data)
+        try:
+            return self.client.request("PUT", self._make_url(resource_id), json=data)
+        finally:
+            self._invalidate_cache()
+
+    def bulk_create(self, items: Iterable[Dict[str, Any]], concurrency: int = 4) -> BulkReport:
+        """
+        複数のリソースを並行に作成する
+
+        失敗したレコードがあっても残りの処理を続けます。
+
+        Args:
+            items (Iterable[Dict[str, Any]]): 作成するリソースのデータ
+            concurrency (int, optional): 同時に送信するリクエストの上限
+
+        Returns:
+            BulkReport: 入力と同じ順序の結果（失敗したレコードは error に LogilessError を保持）
+        """
+        return run_bulk(self.create, items, concurrency=concurrency)
+
+    def bulk_update(
+        self,
+        pairs: Union[Mapping[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+        concurrency: int = 4,
+    ) -> BulkReport:
+        """
+        複数のリソースを並行に更新する
+
+        失敗したレコードがあっても残りの処理を続けます。
+
+        Args:
+            pairs (Union[Mapping[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]]):
+                更新するリソースのIDと更新データの組
+            concurrency (int, optional): 同時に送信するリクエストの上限
+
+        Returns:
+            BulkReport: 入力と同じ順序の結果（各結果の item は (ID, 更新データ) のタプル）
+        """
+        if isinstance(pairs, Mapping):
+            pairs = pairs.items()
+        return run_bulk(lambda pair: self.update(*pair), [tuple(pair) for pair in pairs], concurrency=concurrency)
 
     def delete(self, resource_id: str) -> Dict[str, Any]:
         """
@@ -103,21 +478,19 @@ class APIResource:
         Returns:
             Dict[str, Any]: APIレスポンス
         """
-        return self.client.request("DELETE", self._make_url(resource_id))
+        try:
+            return self.client.request("DELETE", self._make_url(resource_id))
+        finally:
+            self._invalidate_cache()
 
 
 class ArticleResource(APIResource):
     """
     商品情報に関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        ArticleResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/articles")
+    endpoint = "articles"
+    model = Article
 
 
 class ActualInventorySummaryResource(APIResource):
@@ -125,14 +498,8 @@ class ActualInventorySummaryResource(APIResource):
     実在庫サマリ(ActualInventorySummary)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        ActualInventorySummaryResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/actual_inventory_summaries")
+    endpoint = "actual_inventory_summaries"
+    model = ActualInventorySummary
 
 
 class LogicalInventorySummaryResource(APIResource):
@@ -140,14 +507,8 @@ class LogicalInventorySummaryResource(APIResource):
     論理在庫サマリ(LogicalInventorySummary)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        LogicalInventorySummaryResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/logical_inventory_summaries")
+    endpoint = "logical_inventory_summaries"
+    model = LogicalInventorySummary
 
 
 class OutboundDeliveryResource(APIResource):
@@ -155,14 +516,8 @@ class OutboundDeliveryResource(APIResource):
     出荷配送(OutboundDelivery)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        OutboundDeliveryResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/outbound_deliveries")
+    endpoint = "outbound_deliveries"
+    model = OutboundDelivery
 
 
 class InboundDeliveryResource(APIResource):
@@ -170,14 +525,7 @@ class InboundDeliveryResource(APIResource):
     入荷配送(InboundDelivery)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        InboundDeliveryResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/inbound_deliveries")
+    endpoint = "inbound_deliveries"
 
 
 class SalesOrderResource(APIResource):
@@ -185,14 +533,8 @@ class SalesOrderResource(APIResource):
     受注(SalesOrder)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        SalesOrderResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/sales_orders")
+    endpoint = "sales_orders"
+    model = SalesOrder
 
 
 class WarehouseResource(APIResource):
@@ -200,14 +542,7 @@ class WarehouseResource(APIResource):
     倉庫(Warehouse)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        WarehouseResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/warehouses")
+    endpoint = "warehouses"
 
 
 class StoreResource(APIResource):
@@ -215,117 +550,206 @@ class StoreResource(APIResource):
     店舗(Store)リソースを扱うクラス
     """
 
-    def __init__(self, client: "LogilessClient"):
-        """
-        StoreResourceクラスの初期化
-
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/stores")
+    endpoint = "stores"
 
 
 class LocationResource(APIResource):
     """
     ロケーション情報に関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        LocationResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/locations")
+    endpoint = "locations"
 
 
 class ReorderPointResource(APIResource):
     """
     再注文点に関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        ReorderPointResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/reorder_points")
+    endpoint = "reorder_points"
 
 
 class SupplierResource(APIResource):
     """
     サプライヤー情報に関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        SupplierResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/suppliers")
+    endpoint = "suppliers"
 
 
 class ArticleMapResource(APIResource):
     """
     商品マッピングに関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        ArticleMapResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/article_maps")
+    endpoint = "article_maps"
 
 
 class DailyInventorySummaryResource(APIResource):
     """
     日次在庫サマリに関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        DailyInventorySummaryResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/daily_inventory_summaries")
+    endpoint = "daily_inventory_summaries"
 
 
 class TransactionLogResource(APIResource):
     """
     取引ログに関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
-        """
-        TransactionLogResourceの初期化
 
-        Args:
-            client (LogilessClient): LogilessClientインスタンス
-        """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/transaction_logs")
+    endpoint = "transaction_logs"
 
 
 class InterWarehouseTransferResource(APIResource):
     """
     倉庫間移動に関するリソースクラス
     """
-    def __init__(self, client: "LogilessClient"):
+
+    endpoint = "inter_warehouse_transfers"
+
+
+# クライアント属性名とリソースクラスの対応表（リソースは属性に初めてアクセスしたときに生成）
+RESOURCES: Dict[str, Type[APIResource]] = {
+    "article": ArticleResource,
+    "actual_inventory_summary": ActualInventorySummaryResource,
+    "logical_inventory_summary": LogicalInventorySummaryResource,
+    "outbound_delivery": OutboundDeliveryResource,
+    "inbound_delivery": InboundDeliveryResource,
+    "sales_order": SalesOrderResource,
+    "warehouse": WarehouseResource,
+    "store": StoreResource,
+    "location": LocationResource,
+    "reorder_point": ReorderPointResource,
+    "supplier": SupplierResource,
+    "article_map": ArticleMapResource,
+    "daily_inventory_summary": DailyInventorySummaryResource,
+    "transaction_log": TransactionLogResource,
+    "inter_warehouse_transfer": InterWarehouseTransferResource,
+}
+
+# クライアント属性名とエンドポイント名の対応表
+RESOURCE_ENDPOINTS: Dict[str, str] = {name: resource_class.endpoint for name, resource_class in RESOURCES.items()}
+# エンドポイント名からリソース名への対応（フックのイベントでリソースを特定するために使用）
+ENDPOINT_RESOURCES: Dict[str, str] = {endpoint: name for name, endpoint in RESOURCE_ENDPOINTS.items()}
+
+
+def build_request_headers(auth: LogilessAuth, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    認証情報を含むリクエストヘッダーを生成する
+
+    Args:
+        auth (LogilessAuth): 認証情報
+        headers (Optional[Dict[str, str]], optional): 追加のHTTPヘッダー
+
+    Returns:
+        Dict[str, str]: リクエストヘッダー
+
+    Raises:
+        LogilessError: アクセストークンが無効な場合
+    """
+    # トークンが有効かチェック
+    token_valid, error_message = auth.ensure_active_token()
+    if not token_valid:
+        raise LogilessError(error_message)
+
+    # ヘッダーの準備
+    request_headers = {
+        "Content-Type": "application/json",
+        **auth.get_auth_header(),
+    }
+    if headers:
+        request_headers.update(headers)
+    return request_headers
+
+
+def parse_response(
+    response: Any, codec: Optional["JSONCodec"] = None
+) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    HTTPレスポンスを解析する
+
+    requestsとhttpxのどちらのレスポンスオブジェクトも扱えます。
+
+    Args:
+        response (Any): HTTPレスポンス
+        codec (Optional[JSONCodec], optional): 本文のバイト列を直接デコードするコーデック
+            （省略時はレスポンスオブジェクトのjson()を使用）
+
+    Returns:
+        Union[Dict[str, Any], List[Dict[str, Any]]]: APIレスポンス
+
+    Raises:
+        LogilessError: エラーステータスの場合
+        ValueError: JSONの解析に失敗した場合
+    """
+    # 成功以外のステータスコードの場合、例外をスロー
+    decode = response.json if codec is None else lambda: codec.loads(response.content)
+    if response.status_code >= 400:
+        try:
+            error_data = decode()
+        except ValueError:
+            error_data = {"error": "解析エラー", "error_description": response.text}
+        raise_for_error(response.status_code, error_data, response.headers)
+
+    # レスポンスがJSONの場合はパース、そうでなければテキスト
+    if response.headers.get("Content-Type", "").startswith("application/json"):
+        return decode()
+    return {"text": response.text}
+
+
+def transport_error(error: Exception) -> LogilessError:
+    """
+    requestsの例外を LogilessError に変換する
+
+    Args:
+        error (Exception): requestsの例外
+
+    Returns:
+        LogilessError: タイムアウトの場合は LogilessTimeoutError（期限を過ぎている場合は LogilessDeadlineExceeded）
+    """
+    from requests.exceptions import Timeout
+
+    if isinstance(error, Timeout):
+        current = current_deadline()
+        if current is not None and current.expired:
+            return LogilessDeadlineExceeded(f"処理の期限を過ぎました: {str(error)}")
+        return LogilessTimeoutError(f"APIリクエストタイムアウト: {str(error)}")
+    return LogilessError(f"APIリクエストエラー: {str(error)}")
+
+
+class LazyResource:
+    """
+    クライアントの属性に初めてアクセスしたときにリソースを生成するディスクリプタ
+
+    生成したリソースはインスタンスの属性として保存されるため、2回目以降のアクセスでは
+    ディスクリプタを経由しません。
+    """
+
+    def __init__(self, name: str, factory: Callable[[Any], Any]):
         """
-        InterWarehouseTransferResourceの初期化
+        LazyResourceクラスの初期化
 
         Args:
-            client (LogilessClient): LogilessClientインスタンス
+            name (str): クライアントの属性名
+            factory (Callable[[Any], Any]): クライアントを受け取りリソースを生成する関数
         """
-        super().__init__(client, f"merchant/{client.auth.merchant_id}/inter_warehouse_transfers")
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, client: Any, owner: type) -> Any:
+        if client is None:
+            return self
+        # 複数のスレッドから同時にアクセスされても同じリソースを返す
+        return client.__dict__.setdefault(self.name, self.factory(client))
 
 
 class LogilessClient:
     """
     LOGILESS APIのクライアントクラス
+
+    リソース属性（article, sales_order など）は RESOURCES から初めてアクセスされたときに生成され、
+    requestsのセッションは最初のリクエストで生成されます。
     """
 
     API_BASE_URL = "https://app2.logiless.com/api/v1"
@@ -335,6 +759,23 @@ class LogilessClient:
         access_token: str,
         merchant_id: str,
         api_base_url: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: Optional["requests.Session"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        response_cache: Optional[ResponseCache] = None,
+        validator_store: Optional["ValidatorStore"] = None,
+        json_codec: Union[str, "JSONCodec", None] = None,
+        single_flight: Optional[SingleFlight] = None,
+        cassette: Optional["Cassette"] = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        scheduler: Optional["FairScheduler"] = None,
     ):
         """
         LogilessClientクラスの初期化
@@ -343,27 +784,128 @@ class LogilessClient:
             access_token (str): アクセストークン
             merchant_id (str): マーチャントID
             api_base_url (Optional[str], optional): APIベースURL（テスト用など）
+            pool_connections (int, optional): キャッシュするホスト別コネクションプールの数
+            pool_maxsize (int, optional): ホストごとの最大コネクション数
+            pool_block (bool, optional): プールが満杯の場合に空きを待つかどうか
+            keep_alive (bool, optional): コネクションを維持して再利用するかどうか
+            session (Optional[requests.Session], optional): 共有する既存のセッション
+            rate_limiter (Optional[RateLimiter], optional): 送信レートを制御するレートリミッター
+                （複数のクライアントで同じインスタンスを共有可能）
+            retry_policy (Optional[RetryPolicy], optional): 一時的なエラーに対するリトライポリシー
+            response_cache (Optional[ResponseCache], optional): 参照系リソースのGETレスポンスキャッシュ
+            validator_store (Optional[ValidatorStore], optional): 条件付きGETに使う検証子ストア
+            json_codec (Union[str, JSONCodec, None], optional): リクエストボディのエンコードと
+                レスポンスのデコードに使うコーデック（"auto" でorjsonがあれば使用、省略時はrequestsの標準処理）
+            single_flight (Optional[SingleFlight], optional): 同一のGETの同時実行を1回にまとめる場合に指定
+            cassette (Optional[Cassette], optional): リクエストとレスポンスを記録・再生するカセット
+                （セッションの生成時にトランスポートとして組み込み、close() で記録を閉じる。
+                sessionを指定した場合はそのセッションのアダプタを置き換え、close() で元に戻す）
+            hooks (Optional[Hooks], optional): リクエストのライフサイクルフック
+                （省略時は空のHooksを生成。client.hooks.register() で関数を登録）
+            metrics (Optional[MetricsRegistry], optional): リソース・メソッドごとのメトリクスを集計するレジストリ
+                （複数のクライアントで同じインスタンスを共有可能）
+            timeout (Timeout, optional): 既定のタイムアウト秒数、または (接続タイムアウト, 読み込みタイムアウト) のタプル
+                （Noneの場合はタイムアウトしない）
+            circuit_breaker (Optional[CircuitBreaker], optional): エンドポイント（リソースパスのテンプレート）ごとの
+                サーキットブレーカー（複数のクライアントで同じインスタンスを共有可能）
+            scheduler (Optional[FairScheduler], optional): 同時送信数を制限し、マーチャント間で公平に
+                送信枠を割り当てるスケジューラー（通常は ClientPool が設定）
         """
         self.api_base_url = api_base_url or self.API_BASE_URL
         self.auth = LogilessAuth(access_token, merchant_id)
+        self._session_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "session": session,
+        }
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.response_cache = response_cache
+        self.validator_store = validator_store
+        self.json_codec = None
+        if json_codec is not None:
+            from .codec import get_codec
+
+            self.json_codec = get_codec(json_codec)
+        self.single_flight = single_flight
+        self.cassette = cassette
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.scheduler = scheduler
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.install(self.hooks)
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        全てのAPIResourceとスレッドで共有するコネクションプール付きのセッション
+
+        requestsの読み込みとセッションの生成は最初にアクセスされたときに行います。
+
+        Returns:
+            requests.Session: セッション
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    from .session import create_session
+
+                    session = create_session(**self._session_options)
+                    if self.cassette is not None:
+                        self.cassette.mount(session)
+                    self._session = session
+        return self._session
+
+    @session.setter
+    def session(self, session: "requests.Session") -> None:
+        self._session = session
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        コネクションプールの利用統計を取得する
+
+        Returns:
+            Dict[str, int]: 総リクエスト数、新規接続数、再利用数などを含む辞書
+        """
+        stats = getattr(self.session, "connection_stats", None)
+        if stats is None:
+            return {}
+        return stats()
 
-        # APIリソースを初期化
-        self.article = ArticleResource(self)
-        self.actual_inventory_summary = ActualInventorySummaryResource(self)
-        self.logical_inventory_summary = LogicalInventorySummaryResource(self)
-        self.outbound_delivery = OutboundDeliveryResource(self)
-        self.inbound_delivery = InboundDeliveryResource(self)
-        self.sales_order = SalesOrderResource(self)
-        self.warehouse = WarehouseResource(self)
-        self.store = StoreResource(self)
-        self.location = LocationResource(self)
-        # 追加のAPIリソース
-        self.reorder_point = ReorderPointResource(self)
-        self.supplier = SupplierResource(self)
-        self.article_map = ArticleMapResource(self)
-        self.daily_inventory_summary = DailyInventorySummaryResource(self)
-        self.transaction_log = TransactionLogResource(self)
-        self.inter_warehouse_transfer = InterWarehouseTransferResource(self)
+    def close(self) -> None:
+        """
+        コネクションプールを閉じる
+        """
+        if self._session is not None:
+            if self.cassette is not None:
+                self.cassette.unmount(self._session)
+            self._session.close()
+        if self.cassette is not None:
+            self.cassette.close()
+
+    def __enter__(self) -> "LogilessClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def route(self, url: str) -> Route:
+        """
+        リクエストURLをリソース名・URLテンプレート・リソースIDに分解する
+
+        Args:
+            url (str): リクエストURL
+
+        Returns:
+            Route: 分解した結果
+        """
+        return parse_route(url, self.api_base_url, ENDPOINT_RESOURCES)
 
     def request(
         self,
@@ -373,6 +915,7 @@ class LogilessClient:
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         files: Optional[Dict[str, Any]] = None,
+        timeout: Timeout = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         APIリクエストを実行する
@@ -384,55 +927,423 @@ class LogilessClient:
             json (Optional[Dict[str, Any]], optional): JSONリクエストボディ
             headers (Optional[Dict[str, str]], optional): HTTPヘッダー
             files (Optional[Dict[str, Any]], optional): マルチパートファイル
+            timeout (Timeout, optional): この呼び出しのタイムアウト（省略時は request_timeout() の指定またはクライアントの既定値）
 
         Returns:
             Union[Dict[str, Any], List[Dict[str, Any]]]: APIレスポンス
 
+        Raises:
+            LogilessTimeoutError: 接続または読み込みがタイムアウトした場合
+            LogilessDeadlineExceeded: deadline() で設定した期限を過ぎた場合
+            LogilessError: APIエラーが発生した場合（リトライした回数は retries 属性に設定）
+        """
+        request_headers = build_request_headers(self.auth, headers)
+
+        def send() -> Any:
+            return self._with_retries(
+                method,
+                url,
+                lambda event: self._send(method, url, params, json, request_headers, files, event, timeout),
+                params,
+            )
+
+        if self.single_flight is not None and method.upper() == "GET":
+            effective = timeout if timeout is not None else current_timeout()
+            key = self.single_flight.make_key(
+                method, url, params, self.auth.merchant_id, headers, self.timeout if effective is None else effective
+            )
+            return self.single_flight.do(key, send)
+        return send()
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        chunk_size: int = 65536,
+        timeout: Timeout = None,
+    ) -> ItemStream:
+        """
+        APIリクエストを実行し、レスポンスのレコード配列を逐次デコードして返す
+
+        リトライはレスポンスヘッダーを受信するまでの間のみ行われます。
+        レスポンスキャッシュと条件付きリクエストは使用しません。
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]], optional): URLクエリパラメータ
+            headers (Optional[Dict[str, str]], optional): HTTPヘッダー
+            transform (Optional[Callable[[Any], Any]], optional): 各レコードに適用する変換
+            chunk_size (int, optional): ソケットから読み込むチャンクのバイト数
+            timeout (Timeout, optional): この呼び出しのタイムアウト（読み込みタイムアウトはチャンクごとに適用）
+
+        Returns:
+            ItemStream: レコードのイテレータ（読み終えるか閉じるとコネクションをプールに返却）
+
         Raises:
             LogilessError: APIエラーが発生した場合
         """
-        # トークンが有効かチェック
-        token_valid, error_message = self.auth.ensure_active_token()
-        if not token_valid:
-            raise LogilessError(error_message)
+        from requests.exceptions import RequestException
 
-        # ヘッダーの準備
-        request_headers = {
-            "Content-Type": "application/json",
-            **self.auth.get_auth_header(),
-        }
-        if headers:
-            request_headers.update(headers)
+        request_headers = build_request_headers(self.auth, headers)
+        response = self._with_retries(
+            method, url, lambda event: self._open_stream(method, url, params, request_headers, event, timeout), params
+        )
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size=chunk_size)
+            except RequestException as e:
+                raise transport_error(e) from e
+
+        return ItemStream(chunks(), transform=transform, on_close=response.close)
+
+    def _with_retries(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[Optional[RequestEvent]], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        リトライポリシーに従って送信処理を繰り返す
+
+        フックが登録されている場合は送信ごとに RequestEvent を生成し、before_request、
+        on_retry（リトライする場合）、on_error（最終的に失敗した場合）を通知します。
+        サーキットブレーカーが設定されている場合は、送信ごとにエンドポイントの状態を確認して結果を記録します。
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            send (Callable[[Optional[RequestEvent]], Any]): 1回分の送信処理（イベントを受け取る）
+            params (Optional[Dict[str, Any]], optional): URLクエリパラメータ（イベントに記録）
+
+        Returns:
+            Any: 送信処理の戻り値
+
+        Raises:
+            LogilessCircuitOpenError: サーキットブレーカーが開いている場合（リトライしない）
+            LogilessError: APIエラーが発生した場合（リトライした回数は retries 属性に設定）
+        """
+        retries = 0
+        started = time.monotonic()
+        route = self.route(url) if self.hooks.active or self.circuit_breaker is not None else None
+
+        while True:
+            event = None
+            if route is not None and self.hooks.active:
+                event = RequestEvent(method, url, route, self.auth.merchant_id, params, retries)
+            try:
+                result = self._attempt(send, event, route)
+            except LogilessError as error:
+                delay = None
+                if self.retry_policy is not None and not isinstance(error, LogilessDeadlineExceeded):
+                    delay = self.retry_policy.next_delay(method, retries, error, time.monotonic() - started)
+                    current = current_deadline()
+                    if delay is not None and current is not None and delay >= current.remaining():
+                        # 待機している間に期限を過ぎるためリトライしない
+                        delay = None
+                if event is not None:
+                    event.error = error
+                    if event.elapsed is None:
+                        event.elapsed = time.perf_counter() - event.started
+                if delay is None:
+                    error.retries = retries
+                    if event is not None:
+                        self.hooks.emit("on_error", event)
+                    raise
+                self.retry_policy.notify(
+                    {"method": method, "url": url, "attempt": retries + 1, "delay": delay, "error": error}
+                )
+                if event is not None:
+                    event.retry_delay = delay
+                    self.hooks.emit("on_retry", event)
+                self.retry_policy.sleep(delay)
+                retries += 1
+                continue
+
+            if self.retry_policy is not None:
+                self.retry_policy.record_success(retries)
+            return result
+
+    def _attempt(self, send: Callable[[Optional[RequestEvent]], Any], event: Optional[RequestEvent], route: Optional[Route]) -> Any:
+        """
+        サーキットブレーカーの状態を確認して1回送信し、結果を記録する
+
+        Args:
+            send (Callable[[Optional[RequestEvent]], Any]): 1回分の送信処理
+            event (Optional[RequestEvent]): この送信のイベント
+            route (Optional[Route]): URLを分解した結果（サーキットブレーカーのキーに使用）
+
+        Returns:
+            Any: 送信処理の戻り値
 
+        Raises:
+            LogilessCircuitOpenError: サーキットブレーカーが開いている場合
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            if event is not None:
+                self.hooks.emit("before_request", event)
+            return send(event)
+
+        key = route.resource_path
+        self._circuit_changed(breaker.before_call(key))
+        if event is not None:
+            self.hooks.emit("before_request", event)
         try:
-            # リクエスト実行
-            response = requests.request(
+            result = send(event)
+        except LogilessError as error:
+            self._circuit_changed(breaker.record(key, error))
+            raise
+        except BaseException:
+            breaker.release(key)
+            raise
+        self._circuit_changed(breaker.record(key))
+        return result
+
+    def _circuit_changed(self, change: Optional["CircuitStateChange"]) -> None:
+        """
+        サーキットの状態が変化した場合にフックへ通知する
+
+        Args:
+            change (Optional[CircuitStateChange]): 状態の変化（変化がない場合はNone）
+        """
+        if change is not None:
+            self.hooks.emit("on_circuit_state", change)
+
+    def _acquire(self) -> None:
+        """
+        レートリミッターのトークンを取得する（期限が設定されている場合は残り時間まで待機）
+
+        Raises:
+            LogilessDeadlineExceeded: 期限を過ぎているか、待機が期限を超える場合
+        """
+        current = current_deadline()
+        remaining = current.check() if current is not None else None
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(remaining)
+
+    def _session_request(self, event: Optional[RequestEvent], method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        スケジューラーが設定されている場合は送信枠を取得してからリクエストを送信する
+
+        Args:
+            event (Optional[RequestEvent]): 記録するイベント
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            **kwargs: requests.Session.request に渡すキーワード引数
+
+        Returns:
+            requests.Response: レスポンス
+
+        Raises:
+            LogilessDeadlineExceeded: スケジューラーの送信枠を期限までに取得できなかった場合
+        """
+        if self.scheduler is None:
+            return self._perform(event, method, url, **kwargs)
+        # 送信枠はレスポンスヘッダーの受信まで保持する（ストリーミングの本文の読み込み中は返却済み）
+        current = current_deadline()
+        with self.scheduler.slot(self.auth.merchant_id, current.check() if current is not None else None):
+            return self._perform(event, method, url, **kwargs)
+
+    def _perform(self, event: Optional[RequestEvent], method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        セッションでリクエストを送信し、イベントがあればステータス・バイト数・所要時間を記録する
+
+        Args:
+            event (Optional[RequestEvent]): 記録するイベント
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            **kwargs: requests.Session.request に渡すキーワード引数
+
+        Returns:
+            requests.Response: レスポンス
+        """
+        session = self.session
+        if event is None:
+            return session.request(method, url, **kwargs)
+
+        take_connect_time = getattr(session, "take_connect_time", None)
+        if take_connect_time is not None:
+            take_connect_time()
+        sent_at = time.perf_counter()
+        response = session.request(method, url, **kwargs)
+        connect_time = take_connect_time() if take_connect_time is not None else 0.0
+        event.record_response(response, sent_at, connect_time, stream=kwargs.get("stream", False))
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        files: Optional[Dict[str, Any]],
+        event: Optional[RequestEvent] = None,
+        timeout: Timeout = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        HTTPリクエストを1回送信し、レスポンスを解析する
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]]): URLクエリパラメータ
+            json (Optional[Dict[str, Any]]): JSONリクエストボディ
+            headers (Dict[str, str]): HTTPヘッダー
+            files (Optional[Dict[str, Any]]): マルチパートファイル
+            event (Optional[RequestEvent], optional): 結果を記録し after_response で通知するイベント
+            timeout (Timeout, optional): 呼び出し単位のタイムアウト
+
+        Returns:
+            Union[Dict[str, Any], List[Dict[str, Any]]]: APIレスポンス
+
+        Raises:
+            LogilessError: APIエラーが発生した場合（元の例外は __cause__ に保持）
+        """
+        from requests.exceptions import RequestException
+
+        # フックの例外はAPIエラーに変換せずに呼び出し元へ伝えるため、try の外側で通知する
+        notify = False
+        try:
+            # 保存済みの検証子があれば条件付きリクエストにする
+            validator_key = stored = None
+            if self.validator_store is not None and method.upper() == "GET":
+                validator_key = self.validator_store.make_key(url, params, self.auth.merchant_id)
+                stored = self.validator_store.lookup(validator_key)
+                if stored is not None:
+                    headers = {**headers, **stored.conditional_headers()}
+
+            self._acquire()
+
+            # リクエスト実行（コーデック指定時はボディを自前でエンコード。Content-Typeは設定済み）
+            data = None
+            if self.json_codec is not None and json is not None and files is None:
+                data = self.json_codec.dumps(json)
+                json = None
+            response = self._session_request(
+                event,
                 method,
                 url,
                 params=params,
+                data=data,
                 json=json,
-                headers=request_headers,
+                headers=headers,
                 files=files,
+                timeout=resolve_timeout(self.timeout, timeout),
             )
 
-            # 成功以外のステータスコードの場合、例外をスロー
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.status_code, response.headers)
+
+            if validator_key is not None:
+                if response.status_code == 304 and stored is not None:
+                    response = self.validator_store.not_modified(stored, response)
+                elif response.status_code == 200:
+                    self.validator_store.save(validator_key, response)
+            if event is None:
+                return parse_response(response, self.json_codec)
+
+            notify = True
+            decode_started = time.perf_counter()
+            try:
+                return parse_response(response, self.json_codec)
+            finally:
+                event.decode_time = time.perf_counter() - decode_started
+                event.elapsed = time.perf_counter() - event.started
+
+        except RequestException as e:
+            raise transport_error(e) from e
+        except ValueError as e:
+            raise LogilessError(f"JSONパースエラー: {str(e)}") from e
+        except LogilessError:
+            raise
+        except Exception as e:
+            raise LogilessError(f"不明なエラー: {str(e)}") from e
+        finally:
+            if notify:
+                self.hooks.emit("after_response", event)
+
+    def _open_stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        event: Optional[RequestEvent] = None,
+        timeout: Timeout = None,
+    ) -> "requests.Response":
+        """
+        本文を読み込まずにレスポンスを受信する
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]]): URLクエリパラメータ
+            headers (Dict[str, str]): HTTPヘッダー
+            event (Optional[RequestEvent], optional): レスポンスヘッダーの受信までを記録し after_response で通知するイベント
+            timeout (Timeout, optional): 呼び出し単位のタイムアウト
+
+        Returns:
+            requests.Response: 本文が未読のレスポンス
+
+        Raises:
+            LogilessError: APIエラーが発生した場合（元の例外は __cause__ に保持）
+        """
+        from requests.exceptions import RequestException
+
+        # フックの例外はAPIエラーに変換せずに呼び出し元へ伝えるため、try の外側で通知する
+        notify = False
+        try:
+            self._acquire()
+
+            response = self._session_request(
+                event, method, url, params=params, headers=headers, stream=True,
+                timeout=resolve_timeout(self.timeout, timeout),
+            )
+            if event is not None:
+                event.elapsed = time.perf_counter() - event.started
+                notify = True
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.status_code, response.headers)
+
             if response.status_code >= 400:
+                # エラーレスポンスは本文全体を読み込んで例外に変換する
                 try:
-                    error_data = response.json()
-                except ValueError:
-                    error_data = {"error": "解析エラー", "error_description": response.text}
-                raise_for_error(response.status_code, error_data)
-
-            # レスポンスがJSONの場合はパース、そうでなければテキスト
-            if response.headers.get("Content-Type", "").startswith("application/json"):
-                return response.json()
-            return {"text": response.text}
+                    parse_response(response, self.json_codec)
+                finally:
+                    response.close()
+            if not response.headers.get("Content-Type", "").startswith("application/json"):
+                response.close()
+                raise LogilessError(
+                    f"JSON以外のレスポンスはストリーミングできません: {response.headers.get('Content-Type')}",
+                    status_code=response.status_code,
+                )
+            return response
 
         except RequestException as e:
-            raise LogilessError(f"APIリクエストエラー: {str(e)}")
+            raise transport_error(e) from e
         except ValueError as e:
-            raise LogilessError(f"JSONパースエラー: {str(e)}")
+            raise LogilessError(f"JSONパースエラー: {str(e)}") from e
         except LogilessError:
             raise
         except Exception as e:
-            raise LogilessError(f"不明なエラー: {str(e)}")
+            raise LogilessError(f"不明なエラー: {str(e)}") from e
+        finally:
+            if notify:
+                try:
+                    self.hooks.emit("after_response", event)
+                except BaseException:
+                    response.close()
+                    raise
+
+
+for _name, _resource_class in RESOURCES.items():
+    setattr(LogilessClient, _name, LazyResource(_name, _resource_class))
+del _name, _resource_class
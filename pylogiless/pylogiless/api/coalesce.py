@@ -0,0 +1,192 @@
+"""
+同一のGETリクエストをまとめて1回の呼び出しにするモジュール（single-flight）
+
+実行中のリクエストと同じキーのリクエストが届いた場合は、新たに送信せずに
+実行中のリクエストの完了を待ち、同じ結果を受け取ります。
+待機は呼び出し元の期限（deadline()）までに制限され、実行した呼び出し元の期限切れは
+待機していた呼び出し元には引き継がれません。
+"""
+import copy
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from .errors import LogilessDeadlineExceeded
+from .timeouts import Timeout, current_deadline
+
+
+class _Call:
+    """
+    実行中の呼び出し
+    """
+
+    __slots__ = ("done", "result", "error", "abandoned", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        # KeyboardInterrupt などで結果を得られずに終わった場合はTrue（待機していた呼び出し元は実行し直す）
+        self.abandoned = False
+        self.waiters = 0
+
+
+def _copy_error(error: Exception) -> Exception:
+    """
+    待機していた呼び出し元に送出するため、トレースバックを持たない例外のコピーを作成する
+
+    コンストラクタを呼ばずに属性と __cause__ を複製するため、独自の引数を持つ例外クラスもコピーできます。
+    """
+    try:
+        clone = type(error).__new__(type(error))
+        clone.__dict__.update(error.__dict__)
+    except (TypeError, AttributeError):
+        return error
+    clone.args = error.args
+    clone.__cause__ = error.__cause__
+    clone.__suppress_context__ = error.__suppress_context__
+    return clone
+
+
+class SingleFlight:
+    """
+    同じキーの同時呼び出しを1回の実行にまとめるクラス
+
+    複数のクライアントで同じインスタンスを共有できます（キーにマーチャントIDを含みます）。
+    """
+
+    def __init__(self):
+        """
+        SingleFlightクラスの初期化
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {"calls": 0, "executions": 0, "collapsed": 0, "errors": 0}
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        merchant_id: Optional[str],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> str:
+        """
+        まとめる対象を識別するキーを生成する
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]]): URLクエリパラメータ
+            merchant_id (Optional[str]): マーチャントID
+            headers (Optional[Dict[str, str]], optional): 呼び出し元が追加したHTTPヘッダー
+            timeout (Timeout, optional): 送信に使うタイムアウト（異なるタイムアウトの呼び出しはまとめない）
+
+        Returns:
+            str: キー
+        """
+        return json.dumps(
+            [method.upper(), merchant_id, url, params or {}, headers or {}, timeout], sort_keys=True, default=str
+        )
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        同じキーの呼び出しが実行中であれば完了を待って結果を共有し、なければ実行する
+
+        待機した呼び出し元には結果のコピーを返すため、呼び出し元同士で変更が影響しません。
+
+        Args:
+            key (str): キー
+            func (Callable[[], Any]): 実行する関数
+
+        Returns:
+            Any: 関数の戻り値
+
+        Raises:
+            LogilessDeadlineExceeded: 待機中に呼び出し元の期限を過ぎた場合
+            Exception: 関数が送出した例外（待機していた呼び出し元には同じ型・属性のコピーを送出）
+        """
+        current = current_deadline()
+        with self._lock:
+            self._stats["calls"] += 1
+
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    leader = True
+                    self._stats["executions"] += 1
+                else:
+                    call.waiters += 1
+                    leader = False
+                    self._stats["collapsed"] += 1
+
+            if leader:
+                break
+            if not call.done.wait(None if current is None else max(current.remaining(), 0)):
+                raise LogilessDeadlineExceeded("処理の期限を過ぎました")
+            if call.abandoned or (
+                isinstance(call.error, LogilessDeadlineExceeded) and (current is None or not current.expired)
+            ):
+                # 実行した呼び出し元の中断や期限切れのため、この呼び出し元で実行し直す（まとめた数には含めない）
+                with self._lock:
+                    self._stats["collapsed"] -= 1
+                continue
+            if call.error is not None:
+                raise _copy_error(call.error)
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func()
+        except Exception as error:
+            call.error = error
+            with self._lock:
+                self._stats["errors"] += 1
+            self._finish(key, call)
+            raise
+        except BaseException:
+            # KeyboardInterrupt や SystemExit は待機していた呼び出し元と共有しない
+            call.abandoned = True
+            self._finish(key, call)
+            raise
+        # 待機していた呼び出し元が元の結果をコピーするため、実行した呼び出し元にもコピーを返す
+        if self._finish(key, call):
+            return copy.deepcopy(call.result)
+        return call.result
+
+    def _finish(self, key: str, call: _Call) -> int:
+        """
+        呼び出しを完了し、待機していた呼び出し元を再開する
+
+        Returns:
+            int: 待機していた呼び出し元の数
+        """
+        # 完了後に届いた呼び出しは新たに実行する
+        with self._lock:
+            del self._calls[key]
+            waiters = call.waiters
+        call.done.set()
+        return waiters
+
+    def in_flight(self) -> int:
+        """
+        実行中の呼び出し数を取得する
+
+        Returns:
+            int: 実行中のキーの数
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        まとめた呼び出しの統計を取得する
+
+        Returns:
+            Dict[str, int]: calls（呼び出し数）、executions（実際に実行した数）、
+                collapsed（実行中の呼び出しにまとめた数）、errors（失敗した実行の数）を含む辞書
+        """
+        with self._lock:
+            return dict(self._stats)
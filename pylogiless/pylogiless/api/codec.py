@@ -0,0 +1,103 @@
+"""
+リクエストボディのエンコードとレスポンスのデコードに使用するJSONコーデックのモジュール
+
+orjsonがインストールされている場合は高速なコーデックを使用し、
+インストールされていない場合は標準ライブラリのjsonにフォールバックします。
+"""
+import json
+from typing import Any, Dict, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson未インストール時
+    orjson = None
+
+
+class JSONCodec:
+    """
+    標準ライブラリのjsonを使用するコーデック
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        オブジェクトをJSONのバイト列にエンコードする
+
+        Args:
+            obj (Any): エンコードするオブジェクト
+
+        Returns:
+            bytes: UTF-8のJSON
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        JSONをデコードする
+
+        Args:
+            data (Union[bytes, str]): レスポンス本文
+
+        Returns:
+            Any: デコードしたオブジェクト
+
+        Raises:
+            ValueError: JSONの解析に失敗した場合
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjsonを使用するコーデック
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        OrjsonCodecクラスの初期化
+
+        Raises:
+            ImportError: orjsonがインストールされていない場合
+        """
+        if orjson is None:
+            raise ImportError("OrjsonCodecを利用するにはorjsonが必要です: pip install pylogiless[fast]")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeErrorはValueErrorのサブクラス
+        return orjson.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec] = "auto") -> JSONCodec:
+    """
+    コーデックを取得する
+
+    Args:
+        codec (Union[str, JSONCodec], optional): コーデック名またはインスタンス。
+            "auto" の場合はインストールされている中で最も高速なコーデック
+
+    Returns:
+        JSONCodec: コーデック
+
+    Raises:
+        ValueError: 不明なコーデック名の場合
+        ImportError: 指定したコーデックのライブラリがインストールされていない場合
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        return OrjsonCodec() if orjson is not None else JSONCodec()
+    if codec not in CODECS:
+        raise ValueError(f"不明なJSONコーデックです: {codec}（{', '.join(CODECS)} または auto）")
+    return CODECS[codec]()
@@ -0,0 +1,189 @@
+"""
+条件付きリクエスト（ETag / Last-Modified）を扱うモジュール
+
+GETレスポンスの検証子と本文をSQLiteに保存し、次回以降は If-None-Match /
+If-Modified-Since を付けて送信します。304が返った場合は保存済みの本文を使用します。
+"""
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+
+from .session import build_response
+
+
+class StoredResponse:
+    """
+    保存済みの検証子とレスポンス本文
+    """
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], content_type: str, body: bytes):
+        """
+        StoredResponseクラスの初期化
+
+        Args:
+            etag (Optional[str]): ETagヘッダーの値
+            last_modified (Optional[str]): Last-Modifiedヘッダーの値
+            content_type (str): Content-Typeヘッダーの値
+            body (bytes): レスポンス本文
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.body = body
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        条件付きリクエスト用のヘッダーを取得する
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since を含む辞書
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorStore:
+    """
+    URL・クエリパラメータ・マーチャントごとに検証子とレスポンス本文を保存するSQLiteストア
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        ValidatorStoreクラスの初期化
+
+        Args:
+            path (str, optional): SQLiteデータベースのパス（省略時はメモリ上）
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS validators (
+                key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT NOT NULL,
+                body BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._stats = {"conditional_requests": 0, "not_modified": 0, "bytes_saved": 0, "stored": 0}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]], merchant_id: Optional[str]) -> str:
+        """
+        保存キーを生成する
+
+        Args:
+            url (str): リクエストURL
+            params (Optional[Dict[str, Any]]): URLクエリパラメータ
+            merchant_id (Optional[str]): マーチャントID
+
+        Returns:
+            str: 保存キー
+        """
+        return json.dumps([merchant_id, url, params or {}], sort_keys=True, default=str)
+
+    def lookup(self, key: str) -> Optional[StoredResponse]:
+        """
+        保存済みのレスポンスを取得する
+
+        Args:
+            key (str): 保存キー
+
+        Returns:
+            Optional[StoredResponse]: 保存済みのレスポンス（存在しない場合はNone）
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, body FROM validators WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._stats["conditional_requests"] += 1
+        if row is None:
+            return None
+        return StoredResponse(row[0], row[1], row[2], bytes(row[3]))
+
+    def save(self, key: str, response: requests.Response) -> bool:
+        """
+        検証子を含むレスポンスを保存する
+
+        Args:
+            key (str): 保存キー
+            response (requests.Response): 200レスポンス
+
+        Returns:
+            bool: 保存した場合はTrue（検証子がない場合はFalse）
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self.discard(key)
+            return False
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO validators (key, etag, last_modified, content_type, body) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, last_modified, response.headers.get("Content-Type", ""), sqlite3.Binary(response.content)),
+            )
+            self._conn.commit()
+            self._stats["stored"] += 1
+        return True
+
+    def discard(self, key: str) -> None:
+        """
+        保存済みのレスポンスを削除する
+
+        Args:
+            key (str): 保存キー
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM validators WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def not_modified(self, stored: StoredResponse, response: requests.Response) -> requests.Response:
+        """
+        304レスポンスを保存済みの本文から組み立てた200レスポンスに置き換える
+
+        Args:
+            stored (StoredResponse): 保存済みのレスポンス
+            response (requests.Response): 304レスポンス
+
+        Returns:
+            requests.Response: 保存済みの本文を持つレスポンス
+        """
+        with self._lock:
+            self._stats["not_modified"] += 1
+            self._stats["bytes_saved"] += len(stored.body)
+        headers: Dict[str, str] = dict(response.headers)
+        headers["Content-Type"] = stored.content_type
+        headers.pop("Content-Length", None)
+        return build_response(200, headers, stored.body, url=response.url)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        条件付きリクエストの統計を取得する
+
+        Returns:
+            Dict[str, int]: conditional_requests（検証子付きで送信した数）、not_modified（304の数）、
+                bytes_saved（転送を省略できたバイト数）、stored（保存した数）、entries（保存件数）を含む辞書
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._conn.execute("SELECT COUNT(*) FROM validators").fetchone()[0]
+        return stats
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる
+        """
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,7 @@
 """
 LOGILESS APIのエラー処理モジュール
 """
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 class LogilessError(Exception):
@@ -9,7 +9,7 @@ class LogilessError(Exception):
     LOGILESS API関連のエラーの基底クラス
     """
 
-    def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[Dict[str, Any]] = None):
+    def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[Dict[str, Any]] = None, headers: Optional[Mapping[str, str]] = None):
         """
         LogilessErrorクラスの初期化
 
@@ -17,10 +17,14 @@ class LogilessError(Exception):
             message (str): エラーメッセージ
             status_code (Optional[int], optional): HTTPステータスコード
             response (Optional[Dict[str, Any]], optional): APIレスポンスの内容
+            headers (Optional[Mapping[str, str]], optional): レスポンスヘッダー
         """
         self.message = message
         self.status_code = status_code
         self.response = response
+        self.headers = headers or {}
+        # リトライした回数（LogilessClient.requestが設定）
+        self.retries = 0
         super().__init__(self.message)
 
     def __str__(self) -> str:
@@ -47,7 +51,7 @@ class LogilessValidationError(LogilessError):
     バリデーションエラーを表すクラス
     """
 
-    def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[Dict[str, Any]] = None, validation_errors: Optional[Dict[str, str]] = None):
+    def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[Dict[str, Any]] = None, validation_errors: Optional[Dict[str, str]] = None, headers: Optional[Mapping[str, str]] = None):
         """
         LogilessValidationErrorクラスの初期化
 
@@ -56,8 +60,9 @@ class LogilessValidationError(LogilessError):
             status_code (Optional[int], optional): HTTPステータスコード
             response (Optional[Dict[str, Any]], optional): APIレスポンスの内容
             validation_errors (Optional[Dict[str, str]], optional): バリデーションエラーの詳細
+            headers (Optional[Mapping[str, str]], optional): レスポンスヘッダー
         """
-        super().__init__(message, status_code, response)
+        super().__init__(message, status_code, response, headers)
         self.validation_errors = validation_errors or {}
 
     def __str__(self) -> str:
@@ -95,13 +100,54 @@ class LogilessServerError(LogilessError):
     pass
 
 
-def raise_for_error(status_code: int, response_body: Dict[str, Any]) -> None:
+class LogilessTimeoutError(LogilessError):
+    """
+    接続または読み込みのタイムアウトを表すクラス
+    """
+    pass
+
+
+class LogilessDeadlineExceeded(LogilessTimeoutError):
+    """
+    deadline() で設定した期限を過ぎたことを表すクラス（リトライされません）
+    """
+    pass
+
+
+class LogilessCircuitOpenError(LogilessError):
+    """
+    サーキットブレーカーが開いているため送信しなかったことを表すクラス（リトライされません）
+
+    サーキットを開いた最後の障害は last_error 属性と __cause__ に保持されます。
+    """
+
+    def __init__(self, key: str, retry_after: float, last_error: Optional[BaseException] = None):
+        """
+        LogilessCircuitOpenErrorクラスの初期化
+
+        Args:
+            key (str): リソースパスのテンプレート
+            retry_after (float): 試行が再開されるまでの秒数の目安
+            last_error (Optional[BaseException], optional): エンドポイントで最後に発生した障害
+        """
+        message = f"サーキットが開いているため送信しません: {key}（{retry_after:.1f}秒後に再試行可能）"
+        if last_error is not None:
+            message += f": {last_error}"
+        super().__init__(message)
+        self.key = key
+        self.retry_after = retry_after
+        self.last_error = last_error
+        self.__cause__ = last_error
+
+
+def raise_for_error(status_code: int, response_body: Dict[str, Any], headers: Optional[Mapping[str, str]] = None) -> None:
     """
     ステータスコードとレスポンスボディに基づいて適切な例外を発生させる
 
     Args:
         status_code (int): HTTPステータスコード
         response_body (Dict[str, Any]): APIレスポンスの内容
+        headers (Optional[Mapping[str, str]], optional): レスポンスヘッダー
 
     Raises:
         LogilessAuthError: 認証エラー（401）の場合
@@ -114,34 +160,34 @@ def raise_for_error(status_code: int, response_body: Dict[str, Any]) -> None:
     if status_code == 400:
         message = response_body.get("message", "バリデーションエラー")
         validation_errors = response_body.get("errors", {})
-        raise LogilessValidationError(message, status_code, response_body, validation_errors)
+        raise LogilessValidationError(message, status_code, response_body, validation_errors, headers)
     elif status_code == 401:
         error = response_body.get("error", "認証エラー")
         error_description = response_body.get("error_description", "認証に失敗しました")
         message = f"{error}: {error_description}"
-        raise LogilessAuthError(message, status_code, response_body)
+        raise LogilessAuthError(message, status_code, response_body, headers)
     elif status_code == 403:
         error = response_body.get("error", "アクセス拒否")
         error_description = response_body.get("error_description", "リクエストへのアクセスが拒否されました")
         message = f"{error}: {error_description}"
-        raise LogilessAuthError(message, status_code, response_body)
+        raise LogilessAuthError(message, status_code, response_body, headers)
     elif status_code == 423:
         error = response_body.get("error", "リソースロック")
         error_description = response_body.get("error_description", "リソースがロックされています")
         message = f"{error}: {error_description}"
-        raise LogilessResourceLockedError(message, status_code, response_body)
+        raise LogilessResourceLockedError(message, status_code, response_body, headers)
     elif status_code == 429:
         error = response_body.get("error", "レート制限超過")
         error_description = response_body.get("error_description", "APIのリクエストレート制限を超えました")
         message = f"{error}: {error_description}"
-        raise LogilessRateLimitError(message, status_code, response_body)
+        raise LogilessRateLimitError(message, status_code, response_body, headers)
     elif status_code >= 500:
         error = response_body.get("error", "サーバーエラー")
         error_description = response_body.get("error_description", "内部サーバーエラーが発生しました")
         message = f"{error}: {error_description}"
-        raise LogilessServerError(message, status_code, response_body)
+        raise LogilessServerError(message, status_code, response_body, headers)
     else:
         error = response_body.get("error", "未知のエラー")
         error_description = response_body.get("error_description", "エラーが発生しました")
         message = f"{error}: {error_description}"
-        raise LogilessError(message, status_code, response_body)
+        raise LogilessError(message, status_code, response_body, headers)
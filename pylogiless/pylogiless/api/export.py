@@ -0,0 +1,545 @@
+"""
+一覧APIの全レコードをファイルに書き出すモジュール
+
+ページを順に取得し、chunk_size件以上たまるごとにCSV・JSON Lines・Parquetのファイルへ書き込みます。
+列とその型は最初のページから推定し、書き込むたびにチェックポイントを保存するため、中断しても
+続きから再開できます。保持するレコードは1チャンク分と先読み中の1ページのみです。
+"""
+import csv
+import io
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .codec import JSONCodec
+from .errors import LogilessError
+from .pagination import extract_items
+
+if TYPE_CHECKING:
+    from .client import APIResource
+
+# 列名と型（integer, number, boolean, string, json）の組
+Schema = List[Tuple[str, str]]
+
+# 拡張子と出力形式の対応
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+CHECKPOINT_VERSION = 1
+
+COLUMN_TYPES = ("integer", "number", "boolean", "string", "json")
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, (dict, list)):
+        return "json"
+    return "string"
+
+
+def infer_schema(records: Iterable[Dict[str, Any]]) -> Schema:
+    """
+    レコードから列とその型を推定する
+
+    列は最初に現れた順に並べます。整数と小数が混在する列は number、型が混在する列と
+    全ての値がNoneの列は string、オブジェクトや配列の列は json とします。
+
+    Args:
+        records (Iterable[Dict[str, Any]]): レコード（通常は最初のページ）
+
+    Returns:
+        Schema: 列名と型の組のリスト
+    """
+    types: Dict[str, Optional[str]] = {}
+    for record in records:
+        for name, value in record.items():
+            current = types.get(name)
+            if value is None:
+                types.setdefault(name, None)
+                continue
+            value_type = _value_type(value)
+            if current is None or current == value_type:
+                types[name] = value_type
+            elif {current, value_type} == {"integer", "number"}:
+                types[name] = "number"
+            else:
+                types[name] = "string"
+    return [(name, value_type or "string") for name, value_type in types.items()]
+
+
+def apply_column_types(schema: Schema, column_types: Optional[Dict[str, str]]) -> Schema:
+    """
+    推定した列の型を呼び出し元の指定で上書きする
+
+    推定結果にない列は末尾に追加します。
+
+    Args:
+        schema (Schema): 推定した列名と型
+        column_types (Optional[Dict[str, str]]): 列名と型（integer, number, boolean, string, json）の辞書
+
+    Returns:
+        Schema: 上書きした列名と型
+
+    Raises:
+        ValueError: 不明な型が指定された場合
+    """
+    if not column_types:
+        return schema
+    unknown = sorted(set(column_types.values()) - set(COLUMN_TYPES))
+    if unknown:
+        raise ValueError(f"不明な列の型です: {', '.join(unknown)}（{', '.join(COLUMN_TYPES)} のいずれかを指定してください）")
+    names = {name for name, _ in schema}
+    return [(name, column_types.get(name, value_type)) for name, value_type in schema] + [
+        (name, value_type) for name, value_type in column_types.items() if name not in names
+    ]
+
+
+def detect_format(path: str) -> str:
+    """
+    出力先のパスの拡張子から出力形式を判定する
+
+    Args:
+        path (str): 出力先のパス
+
+    Returns:
+        str: "csv"、"jsonl"、"parquet" のいずれか
+
+    Raises:
+        ValueError: 拡張子から判定できない場合
+    """
+    extension = os.path.splitext(path.rstrip("/\\"))[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"出力形式を判定できません: {path}（format に csv、jsonl、parquet のいずれかを指定してください）")
+    return FORMATS[extension]
+
+
+def _to_text(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return value
+
+
+def _to_integer(value: Any) -> Any:
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value!r} は整数ではありません")
+        return int(value)
+    return value
+
+
+def _open_append(path: str, offset: Optional[int]) -> Any:
+    """
+    書き込み用にファイルを開く（offsetの指定があればその位置以降を切り詰めて追記する）
+    """
+    if offset is None:
+        return open(path, "wb")
+    handle = open(path, "r+b")
+    handle.truncate(offset)
+    handle.seek(offset)
+    return handle
+
+
+class CSVWriter:
+    """
+    CSVファイルに書き込むクラス
+
+    スキーマにない列は書き込まず、オブジェクトや配列の値はJSON文字列にします。
+    """
+
+    def __init__(self, path: str, schema: Schema, state: Optional[Dict[str, Any]] = None, **options: Any):
+        """
+        CSVWriterクラスの初期化
+
+        Args:
+            path (str): 出力先のパス
+            schema (Schema): 列名と型
+            state (Optional[Dict[str, Any]], optional): 再開する場合はチェックポイントに保存した状態
+            **options: 使用しない（他の形式との互換のため）
+        """
+        self.columns = [name for name, _ in schema]
+        self._binary = _open_append(path, state["offset"] if state else None)
+        self._file = io.TextIOWrapper(self._binary, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        if not state and self.columns:
+            self._writer.writerow(self.columns)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        """
+        レコードを書き込む
+
+        Args:
+            records (List[Dict[str, Any]]): レコード
+        """
+        columns = self.columns
+        self._writer.writerows([_to_text(record.get(name)) for name in columns] for record in records)
+
+    def state(self) -> Dict[str, Any]:
+        """
+        書き込んだ内容をディスクに反映し、再開に必要な状態を返す
+
+        Returns:
+            Dict[str, Any]: 書き込み済みのバイト数（offset）
+        """
+        self._file.flush()
+        os.fsync(self._binary.fileno())
+        return {"offset": os.fstat(self._binary.fileno()).st_size}
+
+    def close(self) -> None:
+        """
+        ファイルを閉じる
+        """
+        self._file.close()
+
+
+class JSONLinesWriter:
+    """
+    JSON Linesファイルに書き込むクラス
+
+    レコードはスキーマにない列も含めてそのまま書き込みます。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Schema,
+        state: Optional[Dict[str, Any]] = None,
+        codec: Optional[JSONCodec] = None,
+        **options: Any,
+    ):
+        """
+        JSONLinesWriterクラスの初期化
+
+        Args:
+            path (str): 出力先のパス
+            schema (Schema): 列名と型（使用しない）
+            state (Optional[Dict[str, Any]], optional): 再開する場合はチェックポイントに保存した状態
+            codec (Optional[JSONCodec], optional): エンコードに使うコーデック（省略時は標準のjson）
+            **options: 使用しない（他の形式との互換のため）
+        """
+        self.codec = codec or JSONCodec()
+        self._file = _open_append(path, state["offset"] if state else None)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        """
+        レコードを書き込む
+
+        Args:
+            records (List[Dict[str, Any]]): レコード
+        """
+        if records:
+            dumps = self.codec.dumps
+            self._file.write(b"\n".join(dumps(record) for record in records) + b"\n")
+
+    def state(self) -> Dict[str, Any]:
+        """
+        書き込んだ内容をディスクに反映し、再開に必要な状態を返す
+
+        Returns:
+            Dict[str, Any]: 書き込み済みのバイト数（offset）
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"offset": self._file.tell()}
+
+    def close(self) -> None:
+        """
+        ファイルを閉じる
+        """
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Parquetのパーツファイル（ディレクトリ内の part-00000.parquet など）に書き込むクラス
+
+    チャンクごとに1つのパーツファイルを書き込みます。ディレクトリはpyarrowやpandasで
+    1つのデータセットとして読み込めます。pyarrowが必要です。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Schema,
+        state: Optional[Dict[str, Any]] = None,
+        overwrite: bool = False,
+        **options: Any,
+    ):
+        """
+        ParquetWriterクラスの初期化
+
+        Args:
+            path (str): 出力先のディレクトリ
+            schema (Schema): 列名と型
+            state (Optional[Dict[str, Any]], optional): 再開する場合はチェックポイントに保存した状態
+            overwrite (bool, optional): 最初から書き出す場合に、空でないディレクトリのパーツファイルを削除してよいかどうか
+            **options: 使用しない（他の形式との互換のため）
+
+        Raises:
+            ImportError: pyarrowがインストールされていない場合
+            LogilessError: 最初から書き出す場合に、overwrite=False でディレクトリが空でない場合
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet形式で出力するにはpyarrowが必要です: pip install pylogiless[parquet]") from None
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        types = {
+            "integer": pyarrow.int64(),
+            "number": pyarrow.float64(),
+            "boolean": pyarrow.bool_(),
+            "string": pyarrow.string(),
+            "json": pyarrow.string(),
+        }
+        self.schema = schema
+        self.arrow_schema = pyarrow.schema([(name, types[value_type]) for name, value_type in schema])
+        self.path = path
+        self.parts = state["parts"] if state else 0
+        os.makedirs(path, exist_ok=True)
+        if state:
+            # 中断時に書きかけだったパーツファイルや、チェックポイントより後のパーツファイルを削除する
+            for name in os.listdir(path):
+                if name.startswith("part-") and (name.endswith(".tmp") or self._part_index(name) >= self.parts):
+                    os.remove(os.path.join(path, name))
+        elif os.listdir(path):
+            if not overwrite:
+                raise LogilessError(
+                    f"出力先のディレクトリが空ではありません: {path}（パーツファイルを削除して書き直す場合は overwrite=True を指定してください）"
+                )
+            for name in os.listdir(path):
+                if name.startswith("part-") and name.endswith((".parquet", ".tmp")):
+                    os.remove(os.path.join(path, name))
+
+    @staticmethod
+    def _part_index(name: str) -> int:
+        try:
+            return int(name[len("part-"):].split(".", 1)[0])
+        except ValueError:
+            return -1
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        """
+        レコードを1つのパーツファイルに書き込む
+
+        Args:
+            records (List[Dict[str, Any]]): レコード
+
+        Raises:
+            LogilessError: 値を列の型に変換できない場合（例: integer の列に小数がある場合）
+        """
+        if not records:
+            return
+        arrays = []
+        for (name, value_type), field in zip(self.schema, self.arrow_schema):
+            values = [record.get(name) for record in records]
+            if value_type in ("string", "json"):
+                values = [value if value is None or isinstance(value, str) else str(_to_text(value)) for value in values]
+            try:
+                if value_type == "integer":
+                    # pyarrowは小数を黙って切り捨てるため、整数値の小数（1.0 など）以外は変換しない
+                    values = [_to_integer(value) for value in values]
+                arrays.append(self._pa.array(values, type=field.type))
+            except (self._pa.ArrowInvalid, self._pa.ArrowTypeError, TypeError, ValueError) as e:
+                raise LogilessError(
+                    f"列 {name} の値を {value_type} 型に変換できません: {str(e)}"
+                    "（export() の column_types で列の型を指定してください）"
+                ) from e
+        table = self._pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+        target = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        self._pq.write_table(table, target + ".tmp")
+        os.replace(target + ".tmp", target)
+        self.parts += 1
+
+    def state(self) -> Dict[str, Any]:
+        """
+        再開に必要な状態を返す
+
+        Returns:
+            Dict[str, Any]: 書き込み済みのパーツファイルの数（parts）
+        """
+        return {"parts": self.parts}
+
+    def close(self) -> None:
+        """
+        何もしない（パーツファイルは書き込むたびに閉じる）
+        """
+
+
+WRITERS = {"csv": CSVWriter, "jsonl": JSONLinesWriter, "parquet": ParquetWriter}
+
+
+def checkpoint_path(path: str) -> str:
+    """
+    出力先に対応するチェックポイントファイルのパスを取得する
+
+    Args:
+        path (str): 出力先のパス
+
+    Returns:
+        str: チェックポイントファイルのパス
+    """
+    return path.rstrip("/\\") + ".checkpoint.json"
+
+
+def _save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    # 電源断などでも空や古い内容のチェックポイントが残らないよう、ディスクに反映してから置き換える
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(checkpoint, handle, ensure_ascii=False)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def _load_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    チェックポイントを読み込む
+
+    Raises:
+        LogilessError: チェックポイントが壊れている場合
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            checkpoint = json.load(handle)
+        if not isinstance(checkpoint, dict):
+            raise ValueError("オブジェクトではありません")
+        for key in ("schema", "next_page", "rows", "chunks", "writer"):
+            if key not in checkpoint:
+                raise ValueError(f"{key} がありません")
+    except ValueError as e:
+        raise LogilessError(
+            f"チェックポイントが壊れています: {path}（{str(e)}）（最初から書き直す場合は resume=False を指定してください）"
+        ) from e
+    return checkpoint
+
+
+def export_resource(
+    resource: "APIResource",
+    path: str,
+    format: Optional[str] = None,
+    chunk_size: int = 10000,
+    limit: int = 100,
+    resume: bool = True,
+    prefetch: bool = True,
+    overwrite: bool = False,
+    column_types: Optional[Dict[str, str]] = None,
+    **params: Any,
+) -> Dict[str, Any]:
+    """
+    リソースの全レコードをファイルに書き出す
+
+    ページを順に取得し、chunk_size件以上たまったページの区切りで書き込んで、チェックポイント
+    （出力先のパスに .checkpoint.json を付けたファイル）を保存します。チェックポイントがある場合は、
+    最後に書き込んだチャンクの次のページから再開し、書きかけの内容は切り詰めます。
+    全て書き込むとチェックポイントを削除します。
+
+    列の型は最初のページから推定し、以降のページでも変えません。Parquetでは、最初のページで integer と
+    推定した列に以降のページで小数が現れた場合など、値を列の型に変換できないと LogilessError を送出します
+    （それまでのチャンクは書き込み済みで、チェックポイントから再開できます）。最初のページで全てNoneだった列は
+    string になり、以降の値は文字列として書き込みます。型が変わり得る列は column_types で指定してください。
+
+    Args:
+        resource (APIResource): 書き出すリソース
+        path (str): 出力先のパス（Parquetの場合はディレクトリ）
+        format (Optional[str], optional): "csv"、"jsonl"、"parquet" のいずれか（省略時は拡張子から判定）
+        chunk_size (int, optional): 1回に書き込むレコード数の目安
+        limit (int, optional): 1ページあたりの件数
+        resume (bool, optional): チェックポイントがあれば再開するかどうか（Falseの場合は最初から書き直す）
+        prefetch (bool, optional): 次のページを先読みするかどうか
+        overwrite (bool, optional): Parquetで最初から書き出す場合に、空でない出力先ディレクトリの
+            パーツファイルを削除してよいかどうか（Falseの場合は LogilessError）
+        column_types (Optional[Dict[str, str]], optional): 推定した型を上書きする列名と型
+            （integer, number, boolean, string, json。{"price": "number"} など）
+        **params: 一覧APIのクエリパラメータ
+
+    Returns:
+        Dict[str, Any]: 書き込んだレコード数（rows）・チャンク数（chunks）・取得したページ数（pages）・
+            再開したかどうか（resumed）
+
+    Raises:
+        ValueError: 出力形式を判定できない場合、または column_types に不明な型がある場合
+        ImportError: Parquet形式でpyarrowがインストールされていない場合
+        LogilessError: APIエラーが発生した場合、チェックポイントの条件が今回の呼び出しと異なる場合、
+            またはParquetの出力先ディレクトリが空でなく overwrite=False の場合
+    """
+    format = format or detect_format(path)
+    if format not in WRITERS:
+        raise ValueError(f"不明な出力形式です: {format}（csv、jsonl、parquet のいずれかを指定してください）")
+    # 不明な型はページを取得する前に検出する
+    apply_column_types([], column_types)
+    checkpoint_file = checkpoint_path(path)
+    conditions = {
+        "version": CHECKPOINT_VERSION,
+        "resource_path": resource.resource_path,
+        "format": format,
+        "limit": limit,
+        "column_types": column_types or {},
+        # JSONに変換できない値は文字列として比較する
+        "params": json.loads(json.dumps(params, default=str)),
+    }
+
+    checkpoint: Optional[Dict[str, Any]] = None
+    if resume and os.path.exists(checkpoint_file):
+        checkpoint = _load_checkpoint(checkpoint_file)
+        mismatched = [key for key, value in conditions.items() if checkpoint.get(key) != value]
+        if mismatched:
+            raise LogilessError(
+                f"チェックポイントの条件（{', '.join(mismatched)}）が異なります: {checkpoint_file}"
+                "（最初から書き直す場合は resume=False を指定してください）"
+            )
+
+    writer_options = {"codec": resource.client.json_codec, "overwrite": overwrite}
+    writer = None
+    schema: Optional[Schema] = None
+    start_page = 1
+    stats = {"rows": 0, "chunks": 0, "pages": 0, "resumed": checkpoint is not None}
+    if checkpoint is not None:
+        schema = [tuple(column) for column in checkpoint["schema"]]
+        start_page = checkpoint["next_page"]
+        stats["rows"] = checkpoint["rows"]
+        stats["chunks"] = checkpoint["chunks"]
+        writer = WRITERS[format](path, schema, state=checkpoint["writer"], **writer_options)
+
+    buffer: List[Dict[str, Any]] = []
+
+    def flush(next_page: int) -> None:
+        writer.write(buffer)
+        stats["rows"] += len(buffer)
+        stats["chunks"] += 1
+        buffer.clear()
+        _save_checkpoint(
+            checkpoint_file,
+            {**conditions, "schema": schema, "next_page": next_page, "rows": stats["rows"],
+             "chunks": stats["chunks"], "writer": writer.state()},
+        )
+
+    try:
+        pages = resource.iter_pages(limit=limit, start_page=start_page, prefetch=prefetch, **params)
+        for page_number, page in enumerate(pages, start_page):
+            items = extract_items(page)
+            del page
+            stats["pages"] += 1
+            if writer is None:
+                schema = apply_column_types(infer_schema(items), column_types)
+                writer = WRITERS[format](path, schema, **writer_options)
+            buffer.extend(items)
+            if len(buffer) >= chunk_size:
+                flush(page_number + 1)
+        if writer is None:
+            # レコードが1件もない場合も空の出力を作成する
+            schema = apply_column_types([], column_types)
+            writer = WRITERS[format](path, schema, **writer_options)
+        if buffer:
+            flush(start_page + stats["pages"])
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+    return stats
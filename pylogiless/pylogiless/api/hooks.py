@@ -0,0 +1,266 @@
+"""
+リクエストのライフサイクルフックを扱うモジュール
+
+LogilessClient.hooks に関数を登録すると、リクエストの送信前（before_request）、
+レスポンスの受信後（after_response）、リトライ時（on_retry）、最終的な失敗時（on_error）に
+RequestEvent を受け取ります。関数が登録されていない場合はイベントを生成しません。
+サーキットブレーカーの状態が変化した場合は on_circuit_state に CircuitStateChange が渡されます。
+"""
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+HOOK_EVENTS = ("before_request", "after_response", "on_retry", "on_error", "on_circuit_state")
+
+Hook = Callable[[Any], None]
+
+
+class Route:
+    """
+    リクエストURLをリソース名・URLテンプレート・リソースIDに分解したもの
+    """
+
+    __slots__ = ("resource", "resource_path", "url_template", "resource_id")
+
+    def __init__(self, resource: Optional[str], resource_path: str, url_template: str, resource_id: Optional[str]):
+        """
+        Routeクラスの初期化
+
+        Args:
+            resource (Optional[str]): リソース名（article など。不明な場合はNone）
+            resource_path (str): IDを含まないリソースパスのテンプレート（merchant/{merchant_id}/articles など）
+            url_template (str): リソースIDを {id} に置き換えたパスのテンプレート
+            resource_id (Optional[str]): リソースID
+        """
+        self.resource = resource
+        self.resource_path = resource_path
+        self.url_template = url_template
+        self.resource_id = resource_id
+
+    def __repr__(self) -> str:
+        return f"Route({self.resource!r}, {self.url_template!r}, resource_id={self.resource_id!r})"
+
+
+def parse_route(url: str, base_url: str, resources_by_endpoint: Mapping[str, str]) -> Route:
+    """
+    リクエストURLを分解する
+
+    merchant/{merchant_id}/{endpoint}/{id}/... の形式のパスを、マーチャントIDとリソースIDを
+    プレースホルダーに置き換えたテンプレートにします。
+
+    Args:
+        url (str): リクエストURL
+        base_url (str): APIベースURL
+        resources_by_endpoint (Mapping[str, str]): エンドポイント名からリソース名への対応
+
+    Returns:
+        Route: 分解した結果
+    """
+    if url.startswith(base_url):
+        path = url[len(base_url):].split("?", 1)[0]
+    else:
+        path = urlsplit(url).path
+    segments = [segment for segment in path.split("/") if segment]
+    if len(segments) < 3 or segments[0] != "merchant":
+        path = "/".join(segments)
+        return Route(None, path, path, None)
+
+    endpoint = segments[2]
+    resource_path = f"merchant/{{merchant_id}}/{endpoint}"
+    rest = segments[3:]
+    if not rest:
+        return Route(resources_by_endpoint.get(endpoint), resource_path, resource_path, None)
+    url_template = "/".join([resource_path, "{id}"] + rest[1:])
+    return Route(resources_by_endpoint.get(endpoint), resource_path, url_template, rest[0])
+
+
+def body_size(body: Any) -> int:
+    """
+    リクエストボディのバイト数を取得する
+
+    Args:
+        body (Any): PreparedRequest.body
+
+    Returns:
+        int: バイト数（ストリームなど長さが分からない場合は0）
+    """
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+class RequestEvent:
+    """
+    1回の送信（リトライごとに1つ）の内容と所要時間
+
+    時間は秒単位です。connect_time は新規接続（名前解決・TCP接続・TLSハンドシェイク）に
+    かかった時間で、コネクションを再利用した場合やLogilessSession以外のセッションでは0です。
+    wait_time は送信からレスポンスヘッダーの受信まで、receive_time は本文の受信、
+    decode_time はJSONのデコードと例外への変換にかかった時間です。
+    """
+
+    __slots__ = (
+        "resource",
+        "method",
+        "url",
+        "url_template",
+        "resource_path",
+        "resource_id",
+        "merchant_id",
+        "params",
+        "attempt",
+        "status_code",
+        "bytes_sent",
+        "bytes_received",
+        "connect_time",
+        "wait_time",
+        "receive_time",
+        "decode_time",
+        "elapsed",
+        "error",
+        "retry_delay",
+        "started",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        route: Route,
+        merchant_id: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        attempt: int = 0,
+    ):
+        """
+        RequestEventクラスの初期化
+
+        Args:
+            method (str): HTTPメソッド
+            url (str): リクエストURL
+            route (Route): URLを分解した結果
+            merchant_id (Optional[str], optional): マーチャントID
+            params (Optional[Dict[str, Any]], optional): URLクエリパラメータ
+            attempt (int, optional): この呼び出しでそれまでにリトライした回数
+        """
+        self.resource = route.resource
+        self.method = method.upper()
+        self.url = url
+        self.url_template = route.url_template
+        self.resource_path = route.resource_path
+        self.resource_id = route.resource_id
+        self.merchant_id = merchant_id
+        self.params = params
+        self.attempt = attempt
+        self.status_code: Optional[int] = None
+        self.bytes_sent = 0
+        self.bytes_received: Optional[int] = None
+        self.connect_time = 0.0
+        self.wait_time: Optional[float] = None
+        self.receive_time: Optional[float] = None
+        self.decode_time: Optional[float] = None
+        self.elapsed: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None
+        self.started = time.perf_counter()
+
+    def record_response(self, response: Any, sent_at: float, connect_time: float = 0.0, stream: bool = False) -> None:
+        """
+        受信したレスポンスのステータス・バイト数・所要時間を記録する
+
+        Args:
+            response (requests.Response): レスポンス
+            sent_at (float): 送信を開始した時刻（time.perf_counter()）
+            connect_time (float, optional): 新規接続にかかった時間
+            stream (bool, optional): 本文を読み込んでいない場合はTrue（本文のバイト数と受信時間は記録しない）
+        """
+        total = time.perf_counter() - sent_at
+        self.status_code = response.status_code
+        request = getattr(response, "request", None)
+        self.bytes_sent = body_size(getattr(request, "body", None))
+        self.connect_time = connect_time
+        # requestsの elapsed は送信からレスポンスヘッダーの受信までの時間
+        elapsed = getattr(response, "elapsed", None)
+        headers_at = min(elapsed.total_seconds(), total) if elapsed is not None else total
+        self.wait_time = max(headers_at - connect_time, 0.0)
+        if not stream:
+            self.receive_time = max(total - headers_at, 0.0)
+            self.bytes_received = len(response.content or b"")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        イベントを辞書に変換する（ログ出力用）
+
+        Returns:
+            Dict[str, Any]: 属性名と値の辞書
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"RequestEvent({self.method} {self.url_template}, status={self.status_code}, attempt={self.attempt})"
+
+
+class Hooks:
+    """
+    イベントごとに登録された関数を呼び出すクラス
+
+    関数が送出した例外はリクエストの呼び出し元に送出されます。
+    """
+
+    def __init__(self):
+        """
+        Hooksクラスの初期化
+        """
+        self._callbacks: Dict[str, List[Hook]] = {name: [] for name in HOOK_EVENTS}
+        self.active = False
+
+    def register(self, event: str, callback: Optional[Hook] = None) -> Any:
+        """
+        イベントに関数を登録する
+
+        callbackを省略した場合はデコレータとして使用できます。
+
+        Args:
+            event (str): イベント名（before_request, after_response, on_retry, on_error, on_circuit_state）
+            callback (Optional[Callable[[RequestEvent], None]], optional): 呼び出す関数
+
+        Returns:
+            Any: 登録した関数（デコレータとして使用した場合はデコレータ）
+
+        Raises:
+            ValueError: 不明なイベント名の場合
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"不明なイベントです: {event}（{', '.join(self._callbacks)} のいずれかを指定してください）")
+        if callback is None:
+            return lambda func: self.register(event, func)
+        self._callbacks[event].append(callback)
+        self.active = True
+        return callback
+
+    def unregister(self, event: str, callback: Hook) -> None:
+        """
+        イベントから関数の登録を解除する
+
+        Args:
+            event (str): イベント名
+            callback (Callable[[RequestEvent], None]): 解除する関数
+        """
+        callbacks = self._callbacks.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        self.active = any(self._callbacks.values())
+
+    def emit(self, event: str, payload: Any) -> None:
+        """
+        イベントに登録された関数を登録順に呼び出す
+
+        Args:
+            event (str): イベント名
+            payload (Any): 関数に渡す値
+        """
+        for callback in self._callbacks[event]:
+            callback(payload)
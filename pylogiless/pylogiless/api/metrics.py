@@ -0,0 +1,260 @@
+"""
+クライアント側で観測したリクエストのメトリクスを集計するモジュール
+
+LogilessClient(metrics=MetricsRegistry()) を指定すると、フックを通じてリソース・メソッドごとに
+リクエスト数、例外クラス別のエラー数、リトライ数、レイテンシのヒストグラム、送受信バイト数を集計します。
+サーキットブレーカーが開いていたため送信しなかった呼び出しは、エラーではなく circuit_open として別に数えます。
+集計結果は辞書のスナップショットまたはPrometheusのテキスト形式で取得できます。
+"""
+import bisect
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .errors import LogilessCircuitOpenError
+
+if TYPE_CHECKING:
+    from .hooks import Hooks, RequestEvent
+
+# レイテンシのヒストグラムの上限値（秒）
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.5, 0.75,
+    1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 30.0, 60.0,
+)
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class _Series:
+    """
+    1つのリソース・メソッドの集計値
+    """
+
+    __slots__ = (
+        "requests", "retries", "errors", "circuit_open", "bucket_counts", "latency_sum", "bytes_sent", "bytes_received"
+    )
+
+    def __init__(self, bucket_count: int):
+        self.requests = 0
+        self.retries = 0
+        self.errors: Dict[str, int] = {}
+        self.circuit_open = 0
+        # 最後の要素は最大の上限値を超えたもの（+Inf）
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.latency_sum = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class MetricsRegistry:
+    """
+    リソース・メソッドごとのメトリクスを保持するスレッドセーフなレジストリ
+
+    複数のクライアントで同じインスタンスを共有できます。
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "logiless_client"):
+        """
+        MetricsRegistryクラスの初期化
+
+        Args:
+            buckets (Sequence[float], optional): レイテンシのヒストグラムの上限値（秒、昇順）
+            prefix (str, optional): Prometheusのメトリクス名の接頭辞
+
+        Raises:
+            ValueError: bucketsが空または昇順でない場合
+        """
+        buckets = tuple(float(bound) for bound in buckets)
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("bucketsには昇順の値を1つ以上指定してください")
+        self.buckets = buckets
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+
+    def install(self, hooks: "Hooks") -> None:
+        """
+        フックに集計用の関数を登録する
+
+        Args:
+            hooks (Hooks): 登録先のフック
+        """
+        hooks.register("after_response", self._on_response)
+        hooks.register("on_retry", self._on_retry)
+        hooks.register("on_error", self._on_error)
+
+    def _get_series(self, event: "RequestEvent") -> _Series:
+        # ロックを保持した状態で呼び出す
+        key = (event.resource or event.url_template, event.method)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self.buckets))
+        return series
+
+    def _observe(self, series: _Series, event: "RequestEvent") -> None:
+        # ロックを保持した状態で呼び出す
+        latency = event.elapsed or 0.0
+        series.requests += 1
+        series.bucket_counts[bisect.bisect_left(self.buckets, latency)] += 1
+        series.latency_sum += latency
+        series.bytes_sent += event.bytes_sent
+        series.bytes_received += event.bytes_received or 0
+
+    def _on_response(self, event: "RequestEvent") -> None:
+        with self._lock:
+            self._observe(self._get_series(event), event)
+
+    def _on_retry(self, event: "RequestEvent") -> None:
+        with self._lock:
+            series = self._get_series(event)
+            series.retries += 1
+            # レスポンスを受信しなかった送信（通信エラー）は after_response で集計されない
+            if event.status_code is None:
+                self._observe(series, event)
+
+    def _on_error(self, event: "RequestEvent") -> None:
+        with self._lock:
+            series = self._get_series(event)
+            if isinstance(event.error, LogilessCircuitOpenError):
+                # 送信していないため、リクエスト数とレイテンシには含めない
+                series.circuit_open += 1
+                return
+            name = type(event.error).__name__
+            series.errors[name] = series.errors.get(name, 0) + 1
+            if event.status_code is None:
+                self._observe(series, event)
+
+    def _percentile(self, counts: List[int], q: float) -> Optional[float]:
+        """
+        ヒストグラムからパーセンタイルを推定する（バケット内は線形補間）
+
+        Args:
+            counts (List[int]): バケットごとの件数
+            q (float): 0から1の割合
+
+        Returns:
+            Optional[float]: 推定値（秒）。件数が0の場合はNone
+        """
+        total = sum(counts)
+        if total == 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    # 最大の上限値を超えたものは上限値で代用する
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        集計値のスナップショットを取得する
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: リソース名 → メソッド → 集計値の辞書。集計値は
+                requests、retries、errors（例外クラス名ごとの件数）、circuit_open（サーキットが開いていたため
+                送信しなかった数）、bytes_sent、bytes_received、
+                latency（count、sum、p50、p95、p99）を含む
+        """
+        with self._lock:
+            items = [
+                (key, series.requests, series.retries, dict(series.errors), series.circuit_open,
+                 list(series.bucket_counts), series.latency_sum, series.bytes_sent, series.bytes_received)
+                for key, series in self._series.items()
+            ]
+
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (resource, method), requests, retries, errors, circuit_open, counts, latency_sum, sent, received in items:
+            latency: Dict[str, Any] = {"count": requests, "sum": latency_sum}
+            for q in PERCENTILES:
+                latency[f"p{int(q * 100)}"] = self._percentile(counts, q)
+            result.setdefault(resource, {})[method] = {
+                "requests": requests,
+                "retries": retries,
+                "errors": errors,
+                "circuit_open": circuit_open,
+                "bytes_sent": sent,
+                "bytes_received": received,
+                "latency": latency,
+            }
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        集計値をPrometheusのテキスト形式で取得する
+
+        Returns:
+            str: テキスト形式のメトリクス
+        """
+        with self._lock:
+            items = sorted(
+                (key, series.requests, series.retries, dict(series.errors), series.circuit_open,
+                 list(series.bucket_counts), series.latency_sum, series.bytes_sent, series.bytes_received)
+                for key, series in self._series.items()
+            )
+
+        name = self.prefix
+        lines: List[str] = []
+
+        def header(metric: str, kind: str, description: str) -> None:
+            lines.append(f"# HELP {name}_{metric} {description}")
+            lines.append(f"# TYPE {name}_{metric} {kind}")
+
+        def labels(resource: str, method: str, **extra: str) -> str:
+            pairs = [("resource", resource), ("method", method)] + list(extra.items())
+            return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+        header("requests_total", "counter", "Requests sent to the LOGILESS API, including retries.")
+        for (resource, method), requests, *_ in items:
+            lines.append(f"{name}_requests_total{labels(resource, method)} {requests}")
+
+        header("retries_total", "counter", "Retried requests.")
+        for (resource, method), _, retries, *_ in items:
+            lines.append(f"{name}_retries_total{labels(resource, method)} {retries}")
+
+        header("errors_total", "counter", "Failed calls by exception class.")
+        for (resource, method), _, _, errors, *_ in items:
+            for error, count in sorted(errors.items()):
+                lines.append(f"{name}_errors_total{labels(resource, method, error=error)} {count}")
+
+        header("circuit_open_total", "counter", "Calls rejected without sending because the circuit was open.")
+        for (resource, method), _, _, _, circuit_open, *_ in items:
+            lines.append(f"{name}_circuit_open_total{labels(resource, method)} {circuit_open}")
+
+        header("request_duration_seconds", "histogram", "Client-observed request latency.")
+        for (resource, method), requests, _, _, _, counts, latency_sum, *_ in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f"{name}_request_duration_seconds_bucket{labels(resource, method, le=_format(bound))} {cumulative}")
+            lines.append(f"{name}_request_duration_seconds_bucket{labels(resource, method, le='+Inf')} {requests}")
+            lines.append(f"{name}_request_duration_seconds_sum{labels(resource, method)} {_format(latency_sum)}")
+            lines.append(f"{name}_request_duration_seconds_count{labels(resource, method)} {requests}")
+
+        header("sent_bytes_total", "counter", "Request body bytes sent.")
+        for (resource, method), *_, sent, _ in items:
+            lines.append(f"{name}_sent_bytes_total{labels(resource, method)} {sent}")
+
+        header("received_bytes_total", "counter", "Response body bytes received.")
+        for (resource, method), *_, received in items:
+            lines.append(f"{name}_received_bytes_total{labels(resource, method)} {received}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        集計値を全て破棄する
+        """
+        with self._lock:
+            self._series.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return repr(float(value))
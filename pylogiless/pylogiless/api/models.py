@@ -0,0 +1,261 @@
+"""
+APIレスポンスのレコードを表す軽量モデルのモジュール
+
+各モデルは __slots__ で宣言したフィールドに値を保持するため、辞書よりも
+レコードあたりのメモリ使用量が小さくなります。ネストしたフィールドは
+最初にアクセスされた時点でモデルに変換されます。
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from .pagination import ITEMS_KEYS
+
+
+class _LazyField:
+    """
+    ネストしたフィールドを初回アクセス時にモデルへ変換するディスクリプタ
+    """
+
+    def __init__(self, name: str, model: Type["Record"]):
+        self.name = name
+        self.slot = "_" + name
+        self.model = model
+
+    def __get__(self, record: Optional["Record"], owner: type) -> Any:
+        if record is None:
+            return self
+        try:
+            value = object.__getattribute__(record, self.slot)
+        except AttributeError:
+            return None
+        if isinstance(value, dict):
+            value = self.model(value)
+            object.__setattr__(record, self.slot, value)
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            value = [self.model(item) if isinstance(item, dict) else item for item in value]
+            object.__setattr__(record, self.slot, value)
+        return value
+
+    def __set__(self, record: "Record", value: Any) -> None:
+        object.__setattr__(record, self.slot, value)
+
+
+class Record(Mapping):
+    """
+    __slots__ を使用したレコードモデルの基底クラス
+
+    サブクラスは _fields にスカラーのフィールド名、_nested にネストしたフィールド名と
+    モデルクラスの対応を宣言し、__slots__ に record_slots(_fields, _nested) を指定します。
+    宣言されていないキーは _extra に保持され、辞書と同様に参照できます。
+    """
+
+    __slots__ = ("_extra",)
+
+    _fields: Tuple[str, ...] = ()
+    _nested: Dict[str, Type["Record"]] = {}
+    # キー名からスロット名への対応（サブクラス定義時に生成）
+    _slot_for: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        slot_for = {name: name for name in cls._fields}
+        for name, model in cls._nested.items():
+            setattr(cls, name, _LazyField(name, model))
+            slot_for[name] = "_" + name
+        cls._slot_for = slot_for
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Recordクラスの初期化
+
+        Args:
+            data (Dict[str, Any]): APIレスポンスのレコード
+        """
+        slot_for = self._slot_for
+        extra = None
+        for key, value in data.items():
+            slot = slot_for.get(key)
+            if slot is not None:
+                object.__setattr__(self, slot, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+
+    def __getattr__(self, name: str) -> Any:
+        # 値が設定されていないスロットと、_extraに含まれるキーの参照
+        if name in self._slot_for:
+            return None
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._slot_for.get(key)
+        if slot is not None:
+            try:
+                value = object.__getattribute__(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+            return value if slot == key else getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in self._slot_for.items():
+            try:
+                object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # 未設定のスロットを復元時に設定しないよう、存在するキーのみで再構築する
+        return type(self), (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        辞書に変換する
+
+        Returns:
+            Dict[str, Any]: ネストしたモデルも辞書に変換したレコード
+        """
+        return {key: _to_plain(self[key]) for key in self}
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def record_slots(fields: Tuple[str, ...], nested: Optional[Dict[str, Any]] = None) -> Tuple[str, ...]:
+    """
+    モデルの __slots__ を生成する
+
+    Args:
+        fields (Tuple[str, ...]): スカラーのフィールド名
+        nested (Optional[Dict[str, Any]], optional): ネストしたフィールド名とモデルクラスの対応
+
+    Returns:
+        Tuple[str, ...]: __slots__ に指定するスロット名
+    """
+    return tuple(fields) + tuple("_" + name for name in (nested or {}))
+
+
+def wrap_page(page: Any, model: Type[Record]) -> Any:
+    """
+    一覧レスポンスのレコード配列をモデルに変換する
+
+    Args:
+        page (Any): 一覧APIのレスポンス
+        model (Type[Record]): モデルクラス
+
+    Returns:
+        Any: レコード配列をモデルのリストに置き換えたレスポンス
+    """
+    if isinstance(page, list):
+        return [model(item) for item in page]
+    for key in ITEMS_KEYS:
+        items = page.get(key)
+        if isinstance(items, list):
+            return {**page, key: [model(item) for item in items]}
+    return page
+
+
+class Article(Record):
+    """
+    商品(Article)のレコード
+    """
+
+    _fields = ("id", "code", "name", "article_type", "barcode", "price", "cost", "created_at", "updated_at")
+    __slots__ = record_slots(_fields)
+
+
+class ActualInventorySummary(Record):
+    """
+    実在庫サマリ(ActualInventorySummary)のレコード
+    """
+
+    _fields = ("id", "article_id", "article_code", "warehouse_id", "location_id", "quantity", "updated_at")
+    _nested = {"article": Article}
+    __slots__ = record_slots(_fields, _nested)
+
+
+class LogicalInventorySummary(Record):
+    """
+    論理在庫サマリ(LogicalInventorySummary)のレコード
+    """
+
+    _fields = (
+        "id",
+        "article_id",
+        "article_code",
+        "warehouse_id",
+        "quantity",
+        "allocated_quantity",
+        "available_quantity",
+        "updated_at",
+    )
+    _nested = {"article": Article}
+    __slots__ = record_slots(_fields, _nested)
+
+
+class SalesOrderLine(Record):
+    """
+    受注明細のレコード
+    """
+
+    _fields = ("id", "article_id", "article_code", "article_name", "quantity", "price")
+    __slots__ = record_slots(_fields)
+
+
+class SalesOrder(Record):
+    """
+    受注(SalesOrder)のレコード
+    """
+
+    _fields = ("id", "code", "status", "store_id", "ordered_at", "total_price", "created_at", "updated_at")
+    _nested = {"lines": SalesOrderLine}
+    __slots__ = record_slots(_fields, _nested)
+
+
+class OutboundDeliveryLine(Record):
+    """
+    出荷明細のレコード
+    """
+
+    _fields = ("id", "article_id", "article_code", "quantity")
+    __slots__ = record_slots(_fields)
+
+
+class OutboundDelivery(Record):
+    """
+    出荷配送(OutboundDelivery)のレコード
+    """
+
+    _fields = (
+        "id",
+        "code",
+        "status",
+        "warehouse_id",
+        "sales_order_id",
+        "shipped_at",
+        "created_at",
+        "updated_at",
+    )
+    _nested = {"lines": OutboundDeliveryLine}
+    __slots__ = record_slots(_fields, _nested)
@@ -0,0 +1,233 @@
+"""
+一覧APIのページングを処理するモジュール
+"""
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Union
+
+from .timeouts import submit_with_context
+
+# 一覧レスポンスでレコード配列と総件数を表すキー（先頭から順に探索）
+ITEMS_KEYS = ("items", "data")
+TOTAL_KEYS = ("total", "total_count")
+
+Page = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+
+def extract_items(page: Page) -> List[Dict[str, Any]]:
+    """
+    一覧レスポンスからレコードの配列を取り出す
+
+    Args:
+        page (Page): 一覧APIのレスポンス
+
+    Returns:
+        List[Dict[str, Any]]: レコードの配列
+    """
+    if isinstance(page, list):
+        return page
+    for key in ITEMS_KEYS:
+        items = page.get(key)
+        if isinstance(items, list):
+            return items
+    return []
+
+
+def extract_total(page: Page) -> Optional[int]:
+    """
+    一覧レスポンスから総件数を取り出す
+
+    Args:
+        page (Page): 一覧APIのレスポンス
+
+    Returns:
+        Optional[int]: 総件数（レスポンスに含まれない場合はNone）
+    """
+    if isinstance(page, list):
+        return None
+    for key in TOTAL_KEYS:
+        total = page.get(key)
+        if total is not None:
+            try:
+                return int(total)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def is_last_page(page: Page, page_number: int, limit: int, page_size: Optional[int] = None) -> bool:
+    """
+    最終ページかどうかを判定する
+
+    総件数がある場合はそれを優先します。サーバーが1ページの件数をlimitより小さく制限している
+    場合でも途中で止まらないよう、取得済みの件数は実際のページの件数（page_size）から計算します。
+    総件数がない場合はlimitに満たないページを最終ページとします。
+
+    Args:
+        page (Page): 一覧APIのレスポンス
+        page_number (int): ページ番号（1始まり）
+        limit (int): 要求した1ページあたりの件数
+        page_size (Optional[int], optional): サーバーが実際に返す1ページあたりの件数（省略時はlimit）
+
+    Returns:
+        bool: 最終ページの場合はTrue
+    """
+    count = len(extract_items(page))
+    if count == 0:
+        return True
+    total = extract_total(page)
+    if total is None:
+        return count < limit
+    return (page_number - 1) * (page_size or limit) + count >= total
+
+
+def infer_page_size(page: Page, page_number: int, limit: int) -> int:
+    """
+    サーバーが実際に返す1ページあたりの件数を推定する
+
+    limitを優先し、limitに満たないページが総件数上まだ最終ページでない場合のみ、サーバーが件数を
+    制限しているとみなしてそのページの件数を使います。途中のページから取得を始めて最初のページが
+    件数の少ない最終ページだった場合に、1ページの件数を小さく見積もりません。
+
+    Args:
+        page (Page): 最初に取得したページ
+        page_number (int): そのページのページ番号（1始まり）
+        limit (int): 要求した1ページあたりの件数
+
+    Returns:
+        int: 1ページあたりの件数
+    """
+    count = len(extract_items(page))
+    total = extract_total(page)
+    if 0 < count < limit and total is not None and (page_number - 1) * limit + count < total:
+        return count
+    return limit
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Page],
+    start_page: int = 1,
+    limit: int = 100,
+    prefetch: bool = True,
+    page_size: Optional[int] = None,
+) -> Iterator[Page]:
+    """
+    ページを順に取得して返すジェネレータ
+
+    prefetchが有効な場合、現在のページを返している間に次のページを
+    バックグラウンドで取得します。保持するページは最大2つです。
+
+    Args:
+        fetch_page (Callable[[int], Page]): ページ番号を受け取りレスポンスを返す関数
+        start_page (int, optional): 最初のページ番号
+        limit (int, optional): 1ページあたりの件数
+        prefetch (bool, optional): 次のページを先読みするかどうか
+        page_size (Optional[int], optional): サーバーが実際に返す1ページあたりの件数
+            （省略時は最初に取得したページから infer_page_size() で推定）
+
+    Yields:
+        Page: 一覧APIのレスポンス
+    """
+    if not prefetch:
+        page_number = start_page
+        while True:
+            page = fetch_page(page_number)
+            page_size = page_size or infer_page_size(page, page_number, limit)
+            yield page
+            if is_last_page(page, page_number, limit, page_size):
+                return
+            page_number += 1
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pylogiless-prefetch")
+    pending: Optional[Future] = None
+    try:
+        page_number = start_page
+        page = fetch_page(page_number)
+        page_size = page_size or infer_page_size(page, page_number, limit)
+        while True:
+            last = is_last_page(page, page_number, limit, page_size)
+            if not last:
+                pending = submit_with_context(executor, fetch_page, page_number + 1)
+            yield page
+            if last:
+                return
+            page = pending.result()
+            pending = None
+            page_number += 1
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_pages_parallel(
+    fetch_page: Callable[[int], Page],
+    start_page: int = 1,
+    limit: int = 100,
+    parallelism: int = 4,
+    ordered: bool = True,
+) -> Iterator[Page]:
+    """
+    最初のページから総件数を取得し、残りのページを並列に取得するジェネレータ
+
+    ページ数は総件数と1ページあたりの件数（limit。サーバーが件数を制限している場合は実際の件数）から計算します。同時に取得中のページ数はparallelismの2倍までに制限されます。
+    総件数がレスポンスに含まれない場合は先読み付きの逐次取得に切り替えます。
+
+    Args:
+        fetch_page (Callable[[int], Page]): ページ番号を受け取りレスポンスを返す関数
+        start_page (int, optional): 最初のページ番号
+        limit (int, optional): 1ページあたりの件数
+        parallelism (int, optional): 並列に取得するワーカー数
+        ordered (bool, optional): Trueの場合はページ番号順、Falseの場合は取得完了順に返す
+
+    Yields:
+        Page: 一覧APIのレスポンス
+    """
+    first = fetch_page(start_page)
+    total = extract_total(first)
+    # サーバーがlimitより小さく制限している場合は、実際に返した件数から残りのページ数を計算する
+    page_size = infer_page_size(first, start_page, limit)
+    if is_last_page(first, start_page, limit, page_size):
+        yield first
+        return
+    if total is None:
+        yield first
+        yield from iter_pages(fetch_page, start_page=start_page + 1, limit=limit, page_size=page_size)
+        return
+
+    page_numbers = iter(range(start_page + 1, math.ceil(total / page_size) + 1))
+    max_in_flight = max(parallelism, 1) * 2
+    executor = ThreadPoolExecutor(max_workers=max(parallelism, 1), thread_name_prefix="pylogiless-scan")
+    in_flight: Deque[Future] = deque()
+
+    def submit_next() -> bool:
+        page_number = next(page_numbers, None)
+        if page_number is None:
+            return False
+        in_flight.append(submit_with_context(executor, fetch_page, page_number))
+        return True
+
+    try:
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+        yield first
+        del first
+
+        if ordered:
+            while in_flight:
+                page = in_flight.popleft().result()
+                submit_next()
+                yield page
+        else:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    submit_next()
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
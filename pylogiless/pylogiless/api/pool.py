@@ -0,0 +1,452 @@
+"""
+複数のマーチャントで1つのコネクションプールを共有するモジュール
+
+ClientPool に登録したマーチャントごとのクライアントは、トークン・レートリミッター・リソースパスを
+個別に持ちながら、同じセッション（コネクションプール）で送信します。同時送信数は FairScheduler が
+制限し、空きを待つ送信にはマーチャント間でラウンドロビンに枠を割り当てるため、1つのマーチャントの
+大量の送信が他のマーチャントの送信を待たせ続けることはありません。
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from .client import LogilessClient
+from .errors import LogilessDeadlineExceeded, LogilessError
+
+if TYPE_CHECKING:
+    import requests
+
+    from .cassette import Cassette
+    from .ratelimit import RateLimiter
+
+
+class _Waiter:
+    """
+    送信枠を待っている呼び出し
+    """
+
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted = False
+
+
+class FairScheduler:
+    """
+    同時送信数を制限し、空きを待つ送信にキー（マーチャントID）間で公平に枠を割り当てるクラス
+
+    枠はキーごとの重みに応じた重み付きラウンドロビンで割り当てます（重み2のキーは1巡で2回）。
+    待っている送信がない場合は待機せずに枠を取得します。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        max_per_key: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        FairSchedulerクラスの初期化
+
+        Args:
+            max_concurrency (int, optional): 全体の同時送信数の上限
+            max_per_key (Optional[int], optional): キーごとの同時送信数の上限（省略時は全体の上限のみ）
+            clock (Callable[[], float], optional): 現在時刻を返す関数
+
+        Raises:
+            ValueError: 上限が1未満の場合
+        """
+        if max_concurrency < 1 or (max_per_key is not None and max_per_key < 1):
+            raise ValueError("max_concurrency、max_per_keyは1以上を指定してください")
+        self.max_concurrency = max_concurrency
+        self.max_per_key = max_per_key
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._active = 0
+        self._in_flight: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[_Waiter]] = {}
+        # 待っている送信があるキーの巡回順（先頭のキーに次の枠を割り当てる）
+        self._ring: Deque[str] = deque()
+        self._weights: Dict[str, int] = {}
+        self._credits: Dict[str, int] = {}
+
+    def set_weight(self, key: str, weight: int) -> None:
+        """
+        キーの重みを設定する
+
+        Args:
+            key (str): キー（マーチャントID）
+            weight (int): 1巡で割り当てる枠の数
+
+        Raises:
+            ValueError: 重みが1未満の場合
+        """
+        if weight < 1:
+            raise ValueError("weightは1以上を指定してください")
+        with self._cond:
+            self._weights[key] = weight
+            self._credits.pop(key, None)
+
+    def _can_run(self, key: str) -> bool:
+        # ロックを保持した状態で呼び出す
+        return self.max_per_key is None or self._in_flight.get(key, 0) < self.max_per_key
+
+    def _start(self, key: str) -> None:
+        # ロックを保持した状態で呼び出す
+        self._active += 1
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def _dispatch(self) -> None:
+        # ロックを保持した状態で呼び出す。空いている枠を巡回順に割り当てる
+        skipped = 0
+        while self._active < self.max_concurrency and self._ring and skipped < len(self._ring):
+            key = self._ring[0]
+            if not self._can_run(key):
+                self._ring.rotate(-1)
+                skipped += 1
+                continue
+            skipped = 0
+            queue = self._queues[key]
+            queue.popleft().granted = True
+            self._start(key)
+            credits = self._credits.get(key, self._weights.get(key, 1)) - 1
+            if not queue:
+                self._ring.popleft()
+                del self._queues[key]
+                self._credits.pop(key, None)
+            elif credits > 0:
+                self._credits[key] = credits
+            else:
+                self._credits.pop(key, None)
+                self._ring.rotate(-1)
+        self._cond.notify_all()
+
+    def _withdraw(self, key: str, waiter: _Waiter) -> None:
+        # ロックを保持した状態で呼び出す
+        queue = self._queues[key]
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[key]
+            self._ring.remove(key)
+            self._credits.pop(key, None)
+
+    def acquire(self, key: str, max_wait: Optional[float] = None) -> float:
+        """
+        送信枠を取得する（空きがない場合は割り当てられるまで待機）
+
+        Args:
+            key (str): キー（マーチャントID）
+            max_wait (Optional[float], optional): 待機できる最大秒数（deadline() の残り時間など）
+
+        Returns:
+            float: 待機した秒数
+
+        Raises:
+            LogilessDeadlineExceeded: max_wait 以内に枠を取得できなかった場合
+        """
+        with self._cond:
+            if not self._ring and self._active < self.max_concurrency and self._can_run(key):
+                self._start(key)
+                return 0.0
+
+            started = self.clock()
+            waiter = _Waiter()
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._ring.append(key)
+            queue.append(waiter)
+            self._dispatch()
+            while not waiter.granted:
+                timeout = None
+                if max_wait is not None:
+                    timeout = max_wait - (self.clock() - started)
+                    if timeout <= 0:
+                        self._withdraw(key, waiter)
+                        raise LogilessDeadlineExceeded("送信枠の待機中に処理の期限を過ぎました")
+                self._cond.wait(timeout)
+            return self.clock() - started
+
+    def release(self, key: str) -> None:
+        """
+        送信枠を返却し、待っている送信に割り当てる
+
+        Args:
+            key (str): acquire() に指定したキー
+        """
+        with self._cond:
+            self._active -= 1
+            remaining = self._in_flight[key] - 1
+            if remaining:
+                self._in_flight[key] = remaining
+            else:
+                del self._in_flight[key]
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, key: str, max_wait: Optional[float] = None) -> Iterator[float]:
+        """
+        ブロック内で送信枠を保持する
+
+        Args:
+            key (str): キー（マーチャントID）
+            max_wait (Optional[float], optional): 待機できる最大秒数
+
+        Yields:
+            float: 待機した秒数
+        """
+        waited = self.acquire(key, max_wait)
+        try:
+            yield waited
+        finally:
+            self.release(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        送信中・待機中の数を取得する
+
+        Returns:
+            Dict[str, Any]: 全体の送信中の数（active）と、キーごとの送信中（in_flight）・待機中（waiting）の数
+        """
+        with self._cond:
+            return {
+                "active": self._active,
+                "in_flight": dict(self._in_flight),
+                "waiting": {key: len(queue) for key, queue in self._queues.items()},
+            }
+
+
+class PooledClient(LogilessClient):
+    """
+    ClientPool に登録したマーチャントのクライアント
+
+    セッションはプールのものを使用し、close() ではセッションを閉じません。
+    """
+
+    def __init__(self, pool: "ClientPool", access_token: str, merchant_id: str, **options: Any):
+        """
+        PooledClientクラスの初期化
+
+        Args:
+            pool (ClientPool): 登録先のプール
+            access_token (str): アクセストークン
+            merchant_id (str): マーチャントID
+            **options: LogilessClient に渡す追加の引数
+        """
+        super().__init__(access_token, merchant_id, api_base_url=pool.api_base_url, scheduler=pool.scheduler, **options)
+        self.pool = pool
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        プールで共有するセッション
+        """
+        return self.pool.session
+
+    def close(self) -> None:
+        """
+        何もしない（セッションはプールの close() で閉じる）
+        """
+
+
+class ClientPool:
+    """
+    複数のマーチャントのクライアントを1つのセッションで扱うクラス
+
+    Examples:
+        >>> pool = ClientPool(pool_maxsize=20, rate_limiter_factory=lambda merchant_id: RateLimiter(rate=5))
+        >>> pool.add_merchant("m1", token1)
+        >>> pool.add_merchant("m2", token2, weight=2)
+        >>> pool["m1"].sales_order.list()
+    """
+
+    def __init__(
+        self,
+        api_base_url: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: Optional["requests.Session"] = None,
+        max_concurrency: Optional[int] = None,
+        max_per_merchant: Optional[int] = None,
+        rate_limiter_factory: Optional[Callable[[str], "RateLimiter"]] = None,
+        cassette: Optional["Cassette"] = None,
+        **client_options: Any,
+    ):
+        """
+        ClientPoolクラスの初期化
+
+        Args:
+            api_base_url (Optional[str], optional): APIベースURL（テスト用など）
+            pool_connections (int, optional): キャッシュするホスト別コネクションプールの数
+            pool_maxsize (int, optional): ホストごとの最大コネクション数
+            pool_block (bool, optional): プールが満杯の場合に空きを待つかどうか
+            keep_alive (bool, optional): コネクションを維持して再利用するかどうか
+            session (Optional[requests.Session], optional): 共有する既存のセッション
+            max_concurrency (Optional[int], optional): 全マーチャントの同時送信数の上限（省略時はpool_maxsize）
+            max_per_merchant (Optional[int], optional): マーチャントごとの同時送信数の上限
+            rate_limiter_factory (Optional[Callable[[str], RateLimiter]], optional): マーチャントIDを受け取り、
+                そのマーチャント専用のレートリミッターを生成する関数
+            cassette (Optional[Cassette], optional): セッションに組み込むカセット
+                （sessionを指定した場合はそのセッションのアダプタを置き換え、close() で元に戻す）
+            **client_options: 全てのマーチャントのクライアントに渡す LogilessClient の引数
+                （retry_policy、hooks、metrics、circuit_breaker など）
+        """
+        self.api_base_url = api_base_url or LogilessClient.API_BASE_URL
+        self._session_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "session": session,
+        }
+        self._session: Optional["requests.Session"] = None
+        self._lock = threading.Lock()
+        self.scheduler = FairScheduler(max_concurrency or pool_maxsize, max_per_merchant)
+        self.rate_limiter_factory = rate_limiter_factory
+        self.cassette = cassette
+        self.client_options = client_options
+        self._clients: Dict[str, PooledClient] = {}
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        全てのマーチャントで共有するコネクションプール付きのセッション
+
+        Returns:
+            requests.Session: セッション
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    from .session import create_session
+
+                    session = create_session(**self._session_options)
+                    if self.cassette is not None:
+                        self.cassette.mount(session)
+                    self._session = session
+        return self._session
+
+    def add_merchant(
+        self,
+        merchant_id: str,
+        access_token: str,
+        rate_limiter: Optional["RateLimiter"] = None,
+        weight: int = 1,
+        **options: Any,
+    ) -> PooledClient:
+        """
+        マーチャントを登録する
+
+        Args:
+            merchant_id (str): マーチャントID
+            access_token (str): アクセストークン
+            rate_limiter (Optional[RateLimiter], optional): このマーチャントのレートリミッター
+                （省略時は rate_limiter_factory で生成）
+            weight (int, optional): 送信枠を待っているときに1巡で割り当てる枠の数
+            **options: このマーチャントのクライアントにだけ渡す LogilessClient の引数
+
+        Returns:
+            PooledClient: 登録したマーチャントのクライアント
+
+        Raises:
+            ValueError: 既に登録されているマーチャントの場合
+        """
+        if rate_limiter is None and self.rate_limiter_factory is not None:
+            rate_limiter = self.rate_limiter_factory(merchant_id)
+        with self._lock:
+            if merchant_id in self._clients:
+                raise ValueError(f"既に登録されているマーチャントです: {merchant_id}")
+            client = PooledClient(
+                self, access_token, merchant_id, rate_limiter=rate_limiter, **{**self.client_options, **options}
+            )
+            self._clients[merchant_id] = client
+        self.scheduler.set_weight(merchant_id, weight)
+        return client
+
+    def remove_merchant(self, merchant_id: str) -> None:
+        """
+        マーチャントの登録を解除する
+
+        Args:
+            merchant_id (str): マーチャントID
+        """
+        with self._lock:
+            self._clients.pop(merchant_id, None)
+
+    def update_token(self, merchant_id: str, access_token: str) -> None:
+        """
+        マーチャントのアクセストークンを更新する
+
+        Args:
+            merchant_id (str): マーチャントID
+            access_token (str): 新しいアクセストークン
+        """
+        self.client(merchant_id).auth.access_token = access_token
+
+    def client(self, merchant_id: str) -> PooledClient:
+        """
+        マーチャントのクライアントを取得する
+
+        Args:
+            merchant_id (str): マーチャントID
+
+        Returns:
+            PooledClient: クライアント
+
+        Raises:
+            LogilessError: 登録されていないマーチャントの場合
+        """
+        client = self._clients.get(merchant_id)
+        if client is None:
+            raise LogilessError(f"登録されていないマーチャントです: {merchant_id}")
+        return client
+
+    __getitem__ = client
+
+    def __contains__(self, merchant_id: object) -> bool:
+        return merchant_id in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def merchants(self) -> List[str]:
+        """
+        登録されているマーチャントIDの一覧を取得する
+
+        Returns:
+            List[str]: マーチャントID
+        """
+        return list(self._clients)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        共有するコネクションプールの利用統計を取得する
+
+        Returns:
+            Dict[str, int]: 総リクエスト数、新規接続数、再利用数などを含む辞書
+        """
+        stats = getattr(self.session, "connection_stats", None)
+        if stats is None:
+            return {}
+        return stats()
+
+    def close(self) -> None:
+        """
+        コネクションプールを閉じる
+        """
+        if self._session is not None:
+            if self.cassette is not None:
+                self.cassette.unmount(self._session)
+            self._session.close()
+        if self.cassette is not None:
+            self.cassette.close()
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
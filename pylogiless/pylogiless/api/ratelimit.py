@@ -0,0 +1,324 @@
+"""
+クライアント側のレート制限を行うモジュール
+
+トークンバケット方式でリクエストの送信間隔を制御し、429レスポンスや
+レート制限ヘッダーに応じて送信レートを自動調整します。
+"""
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .errors import LogilessDeadlineExceeded
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+State = Dict[str, float]
+
+# レート制限の残数とリセット時刻を表すヘッダー（先頭から順に探索）
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Retry-Afterヘッダーを待機秒数に変換する
+
+    Args:
+        value (Optional[str]): Retry-Afterヘッダーの値（秒数またはHTTP日付）
+        now (Optional[float], optional): 現在時刻（UNIX時間）
+
+    Returns:
+        Optional[float]: 待機秒数（解析できない場合はNone）
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(retry_at - (now if now is not None else time.time()), 0.0)
+
+
+def _header(headers: Mapping[str, str], names: tuple) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class MemoryBackend:
+    """
+    同一プロセス内のスレッド間でレート制限の状態を共有するバックエンド
+    """
+
+    def __init__(self):
+        """
+        MemoryBackendクラスの初期化
+        """
+        self._lock = threading.Lock()
+        self._state: State = {}
+
+    def transact(self, func: Callable[[State], Any]) -> Any:
+        """
+        状態を排他的に読み書きする
+
+        Args:
+            func (Callable[[State], Any]): 状態を受け取り更新する関数
+
+        Returns:
+            Any: funcの戻り値
+        """
+        with self._lock:
+            return func(self._state)
+
+
+class FileBackend:
+    """
+    ローカルファイルを介して複数プロセス間でレート制限の状態を共有するバックエンド
+
+    ファイルロック（fcntl.flock）を使用するため、POSIX環境でのみ利用できます。
+    """
+
+    def __init__(self, path: str):
+        """
+        FileBackendクラスの初期化
+
+        Args:
+            path (str): 状態を保存するファイルのパス
+
+        Raises:
+            RuntimeError: ファイルロックが利用できない環境の場合
+        """
+        if fcntl is None:
+            raise RuntimeError("FileBackendはfcntlが利用できる環境でのみ使用できます")
+        self.path = path
+        self._lock = threading.Lock()
+
+    def transact(self, func: Callable[[State], Any]) -> Any:
+        """
+        ファイルをロックした状態で状態を読み書きする
+
+        Args:
+            func (Callable[[State], Any]): 状態を受け取り更新する関数
+
+        Returns:
+            Any: funcの戻り値
+        """
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as f:
+                    raw = f.read()
+                    try:
+                        state = json.loads(raw) if raw else {}
+                    except ValueError:
+                        state = {}
+                    result = func(state)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                return result
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+
+class RateLimiter:
+    """
+    適応型トークンバケットによるレート制限クラス
+
+    - 送信前に acquire() でトークンを取得し、不足している場合は待機します
+    - 429レスポンスを受けると送信レートを乗算的に下げ、その時点のレートを上限として記憶します
+    - 成功レスポンスごとにレートを加算的に上げ、記憶した上限の手前で止めます
+    - Retry-After やレート制限ヘッダーがある場合はその値に従います
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        increase: float = 0.1,
+        decrease_factor: float = 0.5,
+        ceiling_margin: float = 0.9,
+        ceiling_ttl: float = 60.0,
+        backend: Optional[Any] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        RateLimiterクラスの初期化
+
+        Args:
+            rate (float, optional): 初期の送信レート（リクエスト/秒）
+            burst (Optional[float], optional): バケット容量（省略時はrateと同じ）
+            min_rate (float, optional): 送信レートの下限
+            max_rate (Optional[float], optional): 送信レートの上限（省略時はrateの2倍）
+            increase (float, optional): 成功時に加算するレート
+            decrease_factor (float, optional): 429受信時にレートへ掛ける係数
+            ceiling_margin (float, optional): 429を受けたレートに対して維持する割合
+            ceiling_ttl (float, optional): 429で記憶した上限を保持する秒数
+            backend (Optional[Any], optional): 状態を保持するバックエンド（MemoryBackend または FileBackend）
+            clock (Callable[[], float], optional): 現在時刻を返す関数
+            sleep (Callable[[float], None], optional): 待機に使用する関数
+        """
+        self.initial_rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate * 2
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.ceiling_margin = ceiling_margin
+        self.ceiling_ttl = ceiling_ttl
+        self.backend = backend or MemoryBackend()
+        self.clock = clock
+        self.sleep = sleep
+
+    def _refill(self, state: State, now: float) -> None:
+        if "rate" not in state:
+            state.update(
+                rate=self.initial_rate,
+                tokens=self.burst,
+                updated=now,
+                blocked_until=0.0,
+                ceiling=0.0,
+                ceiling_until=0.0,
+                throttled=0.0,
+                waited=0.0,
+            )
+        elapsed = max(now - state["updated"], 0.0)
+        state["tokens"] = min(self.burst, state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+        if state["ceiling"] and now >= state["ceiling_until"]:
+            state["ceiling"] = 0.0
+
+    def _try_acquire(self, state: State) -> float:
+        now = self.clock()
+        self._refill(state, now)
+        if now < state["blocked_until"]:
+            return state["blocked_until"] - now
+        if state["tokens"] >= 1.0:
+            state["tokens"] -= 1.0
+            return 0.0
+        return (1.0 - state["tokens"]) / state["rate"]
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        リクエスト1件分のトークンを取得する
+
+        トークンが不足している場合は補充されるまで待機します。
+
+        Args:
+            max_wait (Optional[float], optional): 待機できる合計秒数（期限までの残り時間など）
+
+        Returns:
+            float: 待機した秒数
+
+        Raises:
+            LogilessDeadlineExceeded: 待機が max_wait を超える場合（トークンは消費しません）
+        """
+        waited = 0.0
+        while True:
+            wait = self.backend.transact(self._try_acquire)
+            if wait <= 0:
+                break
+            if max_wait is not None and waited + wait > max_wait:
+                raise LogilessDeadlineExceeded("レートリミッターの待機が処理の期限を超えます")
+            self.sleep(wait)
+            waited += wait
+        if waited:
+            self.backend.transact(lambda state: state.__setitem__("waited", state["waited"] + waited))
+        return waited
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        レスポンスに応じて送信レートを調整する
+
+        Args:
+            status_code (int): HTTPステータスコード
+            headers (Mapping[str, str]): レスポンスヘッダー
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After"), now=self.clock())
+        remaining = _header(headers, REMAINING_HEADERS)
+        reset = _header(headers, RESET_HEADERS)
+
+        def apply(state: State) -> None:
+            now = self.clock()
+            self._refill(state, now)
+            rate = state["rate"]
+            if status_code == 429:
+                state["throttled"] += 1
+                state["ceiling"] = rate * self.ceiling_margin
+                state["ceiling_until"] = now + self.ceiling_ttl
+                rate = max(rate * self.decrease_factor, self.min_rate)
+                state["tokens"] = min(state["tokens"], 0.0)
+                if retry_after is None:
+                    state["blocked_until"] = max(state["blocked_until"], now + 1.0 / rate)
+            elif status_code < 400:
+                limit = state["ceiling"] or self.max_rate
+                rate = min(rate + self.increase, limit, self.max_rate)
+
+            if retry_after is not None:
+                state["blocked_until"] = max(state["blocked_until"], now + retry_after)
+
+            reset_in = self._reset_seconds(reset, now)
+            if remaining is not None and reset_in is not None:
+                try:
+                    left = float(remaining)
+                except ValueError:
+                    left = None
+                if left is not None:
+                    if left <= 0:
+                        state["blocked_until"] = max(state["blocked_until"], now + reset_in)
+                    elif reset_in > 0:
+                        # 残数をリセットまでの時間で均等に使い切るレートに抑える
+                        rate = min(rate, max(left / reset_in, self.min_rate))
+            state["rate"] = max(rate, self.min_rate)
+
+        self.backend.transact(apply)
+
+    @staticmethod
+    def _reset_seconds(value: Optional[str], now: float) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            reset = float(value)
+        except ValueError:
+            return None
+        # 大きな値はUNIX時刻、それ以外はリセットまでの秒数として扱う
+        if reset > 1e9:
+            reset -= now
+        return max(reset, 0.0)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        レート制限の状態を取得する
+
+        Returns:
+            Dict[str, float]: 現在のレート、残りトークン、429受信回数、累計待機秒数などを含む辞書
+        """
+        def snapshot(state: State) -> Dict[str, float]:
+            self._refill(state, self.clock())
+            return {
+                "rate": state["rate"],
+                "tokens": state["tokens"],
+                "ceiling": state["ceiling"],
+                "blocked_until": state["blocked_until"],
+                "throttled": state["throttled"],
+                "waited": state["waited"],
+            }
+
+        return self.backend.transact(snapshot)
@@ -0,0 +1,166 @@
+"""
+一時的なエラーに対するリトライを制御するモジュール
+"""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from requests.exceptions import RequestException
+
+from .errors import LogilessError
+from .ratelimit import parse_retry_after
+
+# 冪等なHTTPメソッド（既定でリトライ対象とする）
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# リトライ対象とするHTTPステータスコード
+RETRY_STATUSES: FrozenSet[int] = frozenset({423, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    指数バックオフ（フルジッター）によるリトライポリシー
+
+    - 既定では冪等なメソッドのみをリトライします
+    - 423/429/5xx と通信エラーをリトライ対象とします
+    - Retry-Afterヘッダーがある場合はその秒数以上待機します
+    - 1回の呼び出しあたりのリトライ回数と合計時間に上限を設けます
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        budget: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_transport_errors: bool = True,
+        respect_retry_after: bool = True,
+        on_retry: Optional[Callable[[Dict[str, Any]], None]] = None,
+        random_func: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        RetryPolicyクラスの初期化
+
+        Args:
+            max_retries (int, optional): 1回の呼び出しあたりの最大リトライ回数
+            backoff_base (float, optional): バックオフの基準秒数
+            backoff_max (float, optional): バックオフの最大秒数
+            budget (Optional[float], optional): 1回の呼び出しでリトライに費やせる合計秒数
+            retry_statuses (Iterable[int], optional): リトライ対象のステータスコード
+            retry_methods (Iterable[str], optional): リトライ対象のHTTPメソッド
+            retry_transport_errors (bool, optional): 通信エラーをリトライするかどうか
+            respect_retry_after (bool, optional): Retry-Afterヘッダーに従うかどうか
+            on_retry (Optional[Callable[[Dict[str, Any]], None]], optional): リトライ時に呼び出す関数
+            random_func (Callable[[], float], optional): 0以上1未満の乱数を返す関数
+            sleep (Callable[[float], None], optional): 待機に使用する関数
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.retry_transport_errors = retry_transport_errors
+        self.respect_retry_after = respect_retry_after
+        self.on_retry: List[Callable[[Dict[str, Any]], None]] = [on_retry] if on_retry else []
+        self.random_func = random_func
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._stats = {"retries": 0, "recovered": 0, "exhausted": 0}
+
+    def is_retryable(self, method: str, error: LogilessError) -> bool:
+        """
+        エラーがリトライ対象かどうかを判定する
+
+        Args:
+            method (str): HTTPメソッド
+            error (LogilessError): 発生したエラー
+
+        Returns:
+            bool: リトライ対象の場合はTrue
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        if error.status_code is not None:
+            return error.status_code in self.retry_statuses
+        return self.retry_transport_errors and isinstance(error.__cause__, RequestException)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        フルジッター付きの指数バックオフ秒数を計算する
+
+        Args:
+            attempt (int): これまでのリトライ回数
+
+        Returns:
+            float: 待機秒数
+        """
+        return self.random_func() * min(self.backoff_max, self.backoff_base * (2 ** attempt))
+
+    def next_delay(self, method: str, attempt: int, error: LogilessError, elapsed: float) -> Optional[float]:
+        """
+        次のリトライまでの待機秒数を決定する
+
+        Args:
+            method (str): HTTPメソッド
+            attempt (int): これまでのリトライ回数
+            error (LogilessError): 発生したエラー
+            elapsed (float): 呼び出し開始からの経過秒数
+
+        Returns:
+            Optional[float]: 待機秒数（リトライしない場合はNone）
+        """
+        if not self.is_retryable(method, error):
+            return None
+        if attempt >= self.max_retries:
+            self._count("exhausted")
+            return None
+        delay = self.backoff(attempt)
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(error.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+        if self.budget is not None and elapsed + delay > self.budget:
+            self._count("exhausted")
+            return None
+        return delay
+
+    def notify(self, event: Dict[str, Any]) -> None:
+        """
+        リトライの発生を記録し、登録された関数に通知する
+
+        Args:
+            event (Dict[str, Any]): method, url, attempt, delay, error を含む辞書
+        """
+        self._count("retries")
+        for callback in self.on_retry:
+            callback(event)
+
+    def record_success(self, retries: int) -> None:
+        """
+        リトライ後に成功したことを記録する
+
+        Args:
+            retries (int): 成功までにリトライした回数
+        """
+        if retries:
+            self._count("recovered")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        リトライの統計を取得する
+
+        Returns:
+            Dict[str, int]: retries（リトライ回数）、recovered（リトライ後に成功した呼び出し数）、
+                exhausted（上限に達して諦めた呼び出し数）を含む辞書
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,225 @@
+"""
+HTTPコネクションプールを管理するセッションモジュール
+"""
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class PoolStatsAdapter(HTTPAdapter):
+    """
+    コネクションの新規作成数と再利用数を集計するHTTPAdapter
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        PoolStatsAdapterクラスの初期化
+
+        Args:
+            *args: HTTPAdapterに渡す位置引数
+            **kwargs: HTTPAdapterに渡すキーワード引数
+        """
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._connects = 0
+        # スレッドごとの新規接続にかかった時間（フックのイベントに記録）
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        PoolManagerを初期化し、ソケット接続の発生を数えるプールクラスを設定する
+
+        Args:
+            *args: PoolManagerに渡す位置引数
+            **kwargs: PoolManagerに渡すキーワード引数
+        """
+        super().init_poolmanager(*args, **kwargs)
+        pool_classes = dict(self.poolmanager.pool_classes_by_scheme)
+        for scheme, pool_cls in pool_classes.items():
+            pool_classes[scheme] = self._counting_pool_class(pool_cls)
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+    def _counting_pool_class(self, pool_cls: type) -> type:
+        """
+        connect() の呼び出しを数えるコネクションを使うプールクラスを生成する
+
+        Args:
+            pool_cls (type): 元となるコネクションプールクラス
+
+        Returns:
+            type: 集計用のコネクションプールクラス
+        """
+        adapter = self
+        conn_cls = pool_cls.ConnectionCls
+
+        def connect(conn: Any) -> None:
+            started = time.perf_counter()
+            conn_cls.connect(conn)
+            adapter._local.connect_time = getattr(adapter._local, "connect_time", 0.0) + time.perf_counter() - started
+            with adapter._stats_lock:
+                adapter._connects += 1
+
+        counting_conn = type(conn_cls.__name__, (conn_cls,), {"connect": connect})
+        return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": counting_conn})
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """
+        リクエストを送信し、リクエスト数を集計する
+
+        Args:
+            request (requests.PreparedRequest): 送信するリクエスト
+            **kwargs: HTTPAdapter.send に渡すキーワード引数
+
+        Returns:
+            requests.Response: レスポンス
+        """
+        with self._stats_lock:
+            self._requests += 1
+        return super().send(request, **kwargs)
+
+    def take_connect_time(self) -> float:
+        """
+        現在のスレッドで前回の呼び出し以降に新規接続にかかった時間を取得し、リセットする
+
+        Returns:
+            float: 秒数（新規接続がなかった場合は0）
+        """
+        connect_time = getattr(self._local, "connect_time", 0.0)
+        self._local.connect_time = 0.0
+        return connect_time
+
+    def stats(self) -> Dict[str, int]:
+        """
+        コネクションの利用統計を取得する
+
+        Returns:
+            Dict[str, int]: requests（総リクエスト数）、new_connections（新規接続数）、
+                reused_connections（再利用数）、pools（ホスト別プール数）を含む辞書
+        """
+        with self._stats_lock:
+            total = self._requests
+            connects = self._connects
+        return {
+            "requests": total,
+            "new_connections": connects,
+            "reused_connections": max(total - connects, 0),
+            "pools": len(self.poolmanager.pools),
+        }
+
+
+class LogilessSession(requests.Session):
+    """
+    LOGILESS APIへの接続を再利用するためのセッションクラス
+
+    複数スレッドおよび全てのAPIResourceから共有されることを前提としています。
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        """
+        LogilessSessionクラスの初期化
+
+        Args:
+            pool_connections (int, optional): キャッシュするホスト別プールの数
+            pool_maxsize (int, optional): ホストごとの最大コネクション数
+            pool_block (bool, optional): プールが満杯の場合に空きを待つかどうか
+            keep_alive (bool, optional): コネクションを維持して再利用するかどうか
+        """
+        super().__init__()
+        self.keep_alive = keep_alive
+        self.adapter = PoolStatsAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.mount("https://", self.adapter)
+        self.mount("http://", self.adapter)
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        コネクションの利用統計を取得する
+
+        Returns:
+            Dict[str, int]: PoolStatsAdapter.stats() の結果
+        """
+        return self.adapter.stats()
+
+    def take_connect_time(self) -> float:
+        """
+        現在のスレッドで前回の呼び出し以降に新規接続にかかった時間を取得し、リセットする
+
+        Returns:
+            float: PoolStatsAdapter.take_connect_time() の結果
+        """
+        return self.adapter.take_connect_time()
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    session: Optional[requests.Session] = None,
+) -> requests.Session:
+    """
+    LogilessClient用のセッションを生成する
+
+    Args:
+        pool_connections (int, optional): キャッシュするホスト別プールの数
+        pool_maxsize (int, optional): ホストごとの最大コネクション数
+        pool_block (bool, optional): プールが満杯の場合に空きを待つかどうか
+        keep_alive (bool, optional): コネクションを維持して再利用するかどうか
+        session (Optional[requests.Session], optional): 利用する既存のセッション
+
+    Returns:
+        requests.Session: 生成または指定されたセッション
+    """
+    if session is not None:
+        return session
+    return LogilessSession(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        keep_alive=keep_alive,
+    )
+
+
+def build_response(
+    status_code: int,
+    headers: Mapping[str, str],
+    body: bytes,
+    url: Optional[str] = None,
+) -> requests.Response:
+    """
+    保存済みの内容から requests.Response を組み立てる
+
+    Args:
+        status_code (int): HTTPステータスコード
+        headers (Mapping[str, str]): レスポンスヘッダー
+        body (bytes): レスポンスボディ
+        url (Optional[str], optional): リクエストURL
+
+    Returns:
+        requests.Response: レスポンス
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    # iter_content() が保存済みの本文を返すように、読み込み済みとして扱う
+    response._content_consumed = True
+    response.url = url
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+    return response
@@ -0,0 +1,274 @@
+"""
+在庫サマリを列指向のNumPy配列で保持するモジュール
+
+商品IDと倉庫IDは整数コードに変換して保持し、集計や絞り込みをベクトル演算で行います。
+"""
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy未インストール時
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("InventorySnapshotを利用するにはnumpyが必要です: pip install pylogiless[numpy]")
+
+
+class InventorySnapshot:
+    """
+    在庫サマリの列指向スナップショット
+
+    各行は (商品コード, 倉庫コード, 在庫数) の3つの配列で表され、
+    商品ID・倉庫IDとコードの対応は articles / warehouses に保持されます。
+    """
+
+    def __init__(
+        self,
+        article_codes: "np.ndarray",
+        warehouse_codes: "np.ndarray",
+        quantities: "np.ndarray",
+        articles: Sequence[Any],
+        warehouses: Sequence[Any],
+    ):
+        """
+        InventorySnapshotクラスの初期化
+
+        Args:
+            article_codes (np.ndarray): 各行の商品コード（int32）
+            warehouse_codes (np.ndarray): 各行の倉庫コード（int32）
+            quantities (np.ndarray): 各行の在庫数（float64）
+            articles (Sequence[Any]): 商品コードに対応する商品ID
+            warehouses (Sequence[Any]): 倉庫コードに対応する倉庫ID
+        """
+        _require_numpy()
+        self.article_codes = article_codes
+        self.warehouse_codes = warehouse_codes
+        self.quantities = quantities
+        self.articles = list(articles)
+        self.warehouses = list(warehouses)
+        self._article_index = {article: code for code, article in enumerate(self.articles)}
+        self._warehouse_index = {warehouse: code for code, warehouse in enumerate(self.warehouses)}
+        self._sorted_keys: Optional["np.ndarray"] = None
+        self._sort_order: Optional["np.ndarray"] = None
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        article_field: str = "article_id",
+        warehouse_field: str = "warehouse_id",
+        quantity_field: str = "quantity",
+    ) -> "InventorySnapshot":
+        """
+        レコードの列からスナップショットを生成する
+
+        レコードは1件ずつ読み込まれ、辞書のリストを保持しません。
+
+        Args:
+            records (Iterable[Dict[str, Any]]): 在庫サマリのレコード
+            article_field (str, optional): 商品IDのフィールド名
+            warehouse_field (str, optional): 倉庫IDのフィールド名
+            quantity_field (str, optional): 在庫数のフィールド名
+
+        Returns:
+            InventorySnapshot: スナップショット
+        """
+        _require_numpy()
+        article_index: Dict[Any, int] = {}
+        warehouse_index: Dict[Any, int] = {}
+        article_codes = array("i")
+        warehouse_codes = array("i")
+        quantities = array("d")
+        for record in records:
+            article = record.get(article_field)
+            warehouse = record.get(warehouse_field)
+            article_codes.append(article_index.setdefault(article, len(article_index)))
+            warehouse_codes.append(warehouse_index.setdefault(warehouse, len(warehouse_index)))
+            quantities.append(float(record.get(quantity_field) or 0))
+        return cls(
+            np.frombuffer(article_codes, dtype=np.int32).copy() if article_codes else np.zeros(0, np.int32),
+            np.frombuffer(warehouse_codes, dtype=np.int32).copy() if warehouse_codes else np.zeros(0, np.int32),
+            np.frombuffer(quantities, dtype=np.float64).copy() if quantities else np.zeros(0, np.float64),
+            list(article_index),
+            list(warehouse_index),
+        )
+
+    @classmethod
+    def from_resource(cls, resource: Any, limit: int = 500, parallelism: int = 1, **params) -> "InventorySnapshot":
+        """
+        在庫サマリリソースの全ページからスナップショットを生成する
+
+        Args:
+            resource (APIResource): actual_inventory_summary または logical_inventory_summary
+            limit (int, optional): 1ページあたりの件数
+            parallelism (int, optional): 並列に取得するワーカー数
+            **params: クエリパラメータ
+
+        Returns:
+            InventorySnapshot: スナップショット
+        """
+        return cls.from_records(resource.iter_all(limit=limit, parallelism=parallelism, **params))
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        配列が使用するバイト数
+
+        Returns:
+            int: 3つの配列の合計バイト数
+        """
+        return self.article_codes.nbytes + self.warehouse_codes.nbytes + self.quantities.nbytes
+
+    def _mask(
+        self,
+        article: Any = None,
+        warehouse: Any = None,
+        min_quantity: Optional[float] = None,
+        max_quantity: Optional[float] = None,
+    ) -> "np.ndarray":
+        mask = np.ones(len(self), dtype=bool)
+        if article is not None:
+            mask &= self.article_codes == self._article_index.get(article, -1)
+        if warehouse is not None:
+            mask &= self.warehouse_codes == self._warehouse_index.get(warehouse, -1)
+        if min_quantity is not None:
+            mask &= self.quantities >= min_quantity
+        if max_quantity is not None:
+            mask &= self.quantities <= max_quantity
+        return mask
+
+    def filter(
+        self,
+        article: Any = None,
+        warehouse: Any = None,
+        min_quantity: Optional[float] = None,
+        max_quantity: Optional[float] = None,
+    ) -> "InventorySnapshot":
+        """
+        条件に一致する行のみを含むスナップショットを返す
+
+        Args:
+            article (Any, optional): 商品ID
+            warehouse (Any, optional): 倉庫ID
+            min_quantity (Optional[float], optional): 在庫数の下限（以上）
+            max_quantity (Optional[float], optional): 在庫数の上限（以下）
+
+        Returns:
+            InventorySnapshot: 絞り込んだスナップショット（商品・倉庫の対応表は共有）
+        """
+        mask = self._mask(article, warehouse, min_quantity, max_quantity)
+        return InventorySnapshot(
+            self.article_codes[mask],
+            self.warehouse_codes[mask],
+            self.quantities[mask],
+            self.articles,
+            self.warehouses,
+        )
+
+    def total(self) -> float:
+        """
+        在庫数の合計を取得する
+
+        Returns:
+            float: 在庫数の合計
+        """
+        return float(self.quantities.sum())
+
+    def total_by_warehouse(self) -> Dict[Any, float]:
+        """
+        倉庫ごとの在庫数の合計を取得する
+
+        Returns:
+            Dict[Any, float]: 倉庫IDをキーとする合計在庫数
+        """
+        totals = np.bincount(self.warehouse_codes, weights=self.quantities, minlength=len(self.warehouses))
+        return dict(zip(self.warehouses, totals.tolist()))
+
+    def total_by_article(self, warehouse: Any = None) -> Dict[Any, float]:
+        """
+        商品ごとの在庫数の合計を取得する
+
+        Args:
+            warehouse (Any, optional): 倉庫ID（指定した場合はその倉庫のみ集計）
+
+        Returns:
+            Dict[Any, float]: 商品IDをキーとする合計在庫数
+        """
+        return dict(zip(self.articles, self._article_totals(warehouse).tolist()))
+
+    def _article_totals(self, warehouse: Any = None) -> "np.ndarray":
+        codes, quantities = self.article_codes, self.quantities
+        if warehouse is not None:
+            mask = self._mask(warehouse=warehouse)
+            codes, quantities = codes[mask], quantities[mask]
+        return np.bincount(codes, weights=quantities, minlength=len(self.articles))
+
+    def below(self, threshold: float, warehouse: Any = None) -> List[Any]:
+        """
+        合計在庫数が閾値未満の商品IDを取得する
+
+        Args:
+            threshold (float): 閾値
+            warehouse (Any, optional): 倉庫ID（指定した場合はその倉庫の在庫で判定）
+
+        Returns:
+            List[Any]: 商品IDのリスト
+        """
+        codes = np.flatnonzero(self._article_totals(warehouse) < threshold)
+        return [self.articles[code] for code in codes.tolist()]
+
+    def zero_stock(self, warehouse: Any = None) -> List[Any]:
+        """
+        合計在庫数が0以下の商品IDを取得する
+
+        Args:
+            warehouse (Any, optional): 倉庫ID（指定した場合はその倉庫の在庫で判定）
+
+        Returns:
+            List[Any]: 商品IDのリスト
+        """
+        codes = np.flatnonzero(self._article_totals(warehouse) <= 0)
+        return [self.articles[code] for code in codes.tolist()]
+
+    def _build_lookup(self) -> None:
+        keys = self.article_codes.astype(np.int64) * max(len(self.warehouses), 1) + self.warehouse_codes
+        self._sort_order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._sort_order]
+
+    def quantity(self, article: Any, warehouse: Any) -> float:
+        """
+        商品×倉庫の在庫数を取得する
+
+        Args:
+            article (Any): 商品ID
+            warehouse (Any): 倉庫ID
+
+        Returns:
+            float: 在庫数（該当する行がない場合は0）
+        """
+        article_code = self._article_index.get(article)
+        warehouse_code = self._warehouse_index.get(warehouse)
+        if article_code is None or warehouse_code is None:
+            return 0.0
+        if self._sorted_keys is None:
+            self._build_lookup()
+        key = article_code * max(len(self.warehouses), 1) + warehouse_code
+        start, end = np.searchsorted(self._sorted_keys, [key, key + 1])
+        return float(self.quantities[self._sort_order[start:end]].sum())
+
+    def matrix(self) -> "np.ndarray":
+        """
+        商品×倉庫の在庫数の行列を取得する
+
+        Returns:
+            np.ndarray: 行が商品コード、列が倉庫コードに対応する2次元配列
+        """
+        result = np.zeros((len(self.articles), len(self.warehouses)), dtype=np.float64)
+        np.add.at(result, (self.article_codes, self.warehouse_codes), self.quantities)
+        return result
@@ -0,0 +1,182 @@
+"""
+一覧レスポンスを逐次解析するモジュール
+
+レスポンス本文をチャンク単位で受け取りながら、レコード配列の要素を
+1件ずつデコードして返します。ページ全体を保持しないため、メモリ使用量は
+おおむね1レコード分とチャンクサイズに収まります。
+"""
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+from .pagination import ITEMS_KEYS
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ItemStream:
+    """
+    JSON本文のレコード配列を逐次デコードするイテレータ
+
+    トップレベルが配列の場合はその要素を、オブジェクトの場合は items_keys に含まれる
+    最初の配列の要素を返します。それ以外のキー（total など）は読み進めた時点で meta に格納されます。
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        items_keys: Sequence[str] = ITEMS_KEYS,
+        transform: Optional[Callable[[Any], Any]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        ItemStreamクラスの初期化
+
+        Args:
+            chunks (Iterable[bytes]): レスポンス本文のチャンク
+            items_keys (Sequence[str], optional): レコード配列を表すキー
+            transform (Optional[Callable[[Any], Any]], optional): 各レコードに適用する変換（モデルクラスなど）
+            on_close (Optional[Callable[[], None]], optional): 読み終えたとき・閉じたときに呼ばれる関数
+        """
+        self.meta: Dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._items_keys = tuple(items_keys)
+        self._transform = transform
+        self._on_close = on_close
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._iterator: Optional[Iterator[Any]] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._iterator is None:
+            self._iterator = self._items()
+        return self._iterator
+
+    def __next__(self) -> Any:
+        return next(iter(self))
+
+    def __enter__(self) -> "ItemStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        ストリームを閉じる（読み終える前に中断する場合に呼び出す）
+        """
+        if self._iterator is not None:
+            self._iterator.close()
+        self._release()
+
+    def _release(self) -> None:
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
+
+    def _fill(self) -> bool:
+        """
+        次のチャンクを読み込んでバッファに追加する
+
+        Returns:
+            bool: データを追加できた場合はTrue（本文の終端に達した場合はFalse）
+        """
+        if self._eof:
+            return False
+        text = ""
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                break
+        else:
+            self._eof = True
+            text = self._text.decode(b"", final=True)
+        if not text:
+            return False
+        # 読み終えた部分はチャンクを読み込むときにまとめて捨てる
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """
+        空白を読み飛ばして次の文字を取得する（終端の場合は空文字）
+        """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, allowed: str) -> str:
+        char = self._peek()
+        if not char or char not in allowed:
+            raise ValueError(f"JSONの形式が不正です: {allowed!r} が必要な位置に {char!r} があります")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """
+        次の値を1つデコードする
+
+        値が途中で途切れている場合は、次のチャンクを読み込んでからデコードし直します。
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # バッファ末尾で終わる数値などは続きがある可能性がある
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            item = self._value()
+            yield item if self._transform is None else self._transform(item)
+            if self._expect(",]") == "]":
+                return
+
+    def _items(self) -> Iterator[Any]:
+        try:
+            if self._peek() == "[":
+                yield from self._array()
+            else:
+                yield from self._object()
+            if self._peek():
+                raise ValueError("JSONの終端の後に余分なデータがあります")
+        finally:
+            self._release()
+
+    def _object(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        streamed = False
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("JSONの形式が不正です: オブジェクトのキーが文字列ではありません")
+            self._expect(":")
+            if not streamed and key in self._items_keys and self._peek() == "[":
+                streamed = True
+                yield from self._array()
+            else:
+                self.meta[key] = self._value()
+            if self._expect(",}") == "}":
+                return
@@ -0,0 +1,532 @@
+"""
+取引ログ（transaction_log）を使って在庫ミラーを差分同期するモジュール
+
+最初に実在庫サマリのスナップショットを取得し、以降は前回のカーソルより新しい
+取引ログのみを適用します。ミラーとカーソルはSQLiteに保存されるため、
+プロセスが停止しても前回の続きから再開できます。
+"""
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .errors import LogilessError
+from .pagination import extract_items
+
+Key = Tuple[str, str]
+
+
+def _cursor_sort_key(value: Any) -> Tuple[int, Any]:
+    """
+    カーソル値を比較可能なキーに変換する（数値として解釈できる場合は数値で比較）
+    """
+    try:
+        return 0, float(value)
+    except (TypeError, ValueError):
+        return 1, str(value)
+
+
+class InventoryMirror:
+    """
+    在庫のローカルミラーと同期チェックポイントを保存するSQLiteストア
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        InventoryMirrorクラスの初期化
+
+        Args:
+            path (str, optional): SQLiteデータベースのパス（省略時はメモリ上）
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._staging_ids = itertools.count(1)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS inventory (
+                article_id TEXT NOT NULL,
+                warehouse_id TEXT NOT NULL,
+                quantity REAL NOT NULL,
+                record TEXT,
+                PRIMARY KEY (article_id, warehouse_id)
+            );
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def get_quantity(self, article_id: str, warehouse_id: str) -> Optional[float]:
+        """
+        在庫数を取得する
+
+        Args:
+            article_id (str): 商品ID
+            warehouse_id (str): 倉庫ID
+
+        Returns:
+            Optional[float]: 在庫数（ミラーに存在しない場合はNone）
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT quantity FROM inventory WHERE article_id = ? AND warehouse_id = ?",
+                (str(article_id), str(warehouse_id)),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def quantities(self) -> Dict[Key, float]:
+        """
+        全ての在庫数を取得する
+
+        Returns:
+            Dict[Key, float]: (商品ID, 倉庫ID) をキーとする在庫数
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT article_id, warehouse_id, quantity FROM inventory").fetchall()
+        return {(row[0], row[1]): row[2] for row in rows}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM inventory").fetchone()[0]
+
+    def get_checkpoint(self, name: str) -> Optional[Any]:
+        """
+        チェックポイントを取得する
+
+        Args:
+            name (str): チェックポイント名
+
+        Returns:
+            Optional[Any]: 保存された値（存在しない場合はNone）
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM checkpoints WHERE name = ?", (name,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set_checkpoint(self, name: str, value: Any) -> None:
+        """
+        チェックポイントを保存する
+
+        Args:
+            name (str): チェックポイント名
+            value (Any): JSONに変換可能な値
+        """
+        with self._lock:
+            self._set_checkpoint(name, value)
+            self._conn.commit()
+
+    def _set_checkpoint(self, name: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checkpoints (name, value) VALUES (?, ?)", (name, json.dumps(value))
+        )
+
+    def stage_snapshot(
+        self, rows: Iterable[Tuple[str, str, float, Dict[str, Any]]], batch_size: int = 500
+    ) -> Tuple[str, int]:
+        """
+        スナップショットを作業用の一時テーブルに保存する（ミラーの内容は変更しない）
+
+        rowsの取得（APIの呼び出し）はロックの外で行い、batch_size件ごとに短くロックを取得して
+        書き込むため、保存中もミラーの読み込みや apply_deltas() を待たせません。
+        一時テーブルは呼び出しごとに別の名前で作成するため、bootstrap() と verify() が同時に
+        実行されても互いの保存内容を消しません。
+
+        Args:
+            rows (Iterable[Tuple[str, str, float, Dict[str, Any]]]): (商品ID, 倉庫ID, 在庫数, レコード) の列
+            batch_size (int, optional): 1回のロックで書き込む件数
+
+        Returns:
+            Tuple[str, int]: swap_snapshot() に渡す一時テーブル名と、保存した件数
+        """
+        with self._lock:
+            staging = f"inventory_staging_{next(self._staging_ids)}"
+            self._conn.execute(
+                f"""
+                CREATE TEMP TABLE {staging} (
+                    article_id TEXT NOT NULL,
+                    warehouse_id TEXT NOT NULL,
+                    quantity REAL NOT NULL,
+                    record TEXT,
+                    PRIMARY KEY (article_id, warehouse_id)
+                )
+                """
+            )
+            self._conn.commit()
+        try:
+            count = 0
+            batch: List[Tuple[str, str, float, str]] = []
+            for article_id, warehouse_id, quantity, record in rows:
+                batch.append((str(article_id), str(warehouse_id), quantity, json.dumps(record, default=str)))
+                if len(batch) >= batch_size:
+                    count += self._write_staging(staging, batch)
+                    batch = []
+            if batch:
+                count += self._write_staging(staging, batch)
+        except BaseException:
+            self.discard_staging(staging)
+            raise
+        return staging, count
+
+    def _write_staging(self, staging: str, batch: List[Tuple[str, str, float, str]]) -> int:
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {staging} (article_id, warehouse_id, quantity, record) VALUES (?, ?, ?, ?)",
+                    batch,
+                )
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return len(batch)
+
+    def discard_staging(self, staging: str) -> None:
+        """
+        stage_snapshot() で作成した一時テーブルを削除する
+
+        Args:
+            staging (str): 一時テーブル名
+        """
+        with self._lock:
+            self._conn.execute(f"DROP TABLE IF EXISTS {staging}")
+            self._conn.commit()
+
+    def swap_snapshot(
+        self, staging: str, checkpoints: Dict[str, Any], deltas: Iterable[Tuple[str, str, float]] = ()
+    ) -> int:
+        """
+        一時テーブルのスナップショットでミラーの内容を置き換える
+
+        置き換え、deltasの適用、チェックポイントの保存は1つのトランザクションで行われます。
+        deltasはスナップショットに含まれない（商品, 倉庫）にのみ適用します。一時テーブルは成否にかかわらず削除します。
+
+        Args:
+            staging (str): stage_snapshot() が返した一時テーブル名
+            checkpoints (Dict[str, Any]): 同時に保存するチェックポイント
+            deltas (Iterable[Tuple[str, str, float]], optional): スナップショット取得中の取引ログの (商品ID, 倉庫ID, 増減数) の列
+
+        Returns:
+            int: ミラーの件数
+        """
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM inventory")
+                self._conn.execute(f"INSERT INTO inventory SELECT * FROM {staging}")
+                for article_id, warehouse_id, delta in deltas:
+                    # スナップショットの行（record が NULL でない）は取引を反映済みとみなす
+                    self._conn.execute(
+                        """
+                        INSERT INTO inventory (article_id, warehouse_id, quantity, record) VALUES (?, ?, ?, NULL)
+                        ON CONFLICT (article_id, warehouse_id) DO UPDATE SET quantity = quantity + excluded.quantity
+                        WHERE record IS NULL
+                        """,
+                        (str(article_id), str(warehouse_id), delta),
+                    )
+                for name, value in checkpoints.items():
+                    self._set_checkpoint(name, value)
+                self._conn.commit()
+                return self._conn.execute("SELECT COUNT(*) FROM inventory").fetchone()[0]
+            except BaseException:
+                self._conn.rollback()
+                raise
+            finally:
+                self._conn.execute(f"DROP TABLE IF EXISTS {staging}")
+                self._conn.commit()
+
+    def replace_all(self, rows: Iterable[Tuple[str, str, float, Dict[str, Any]]], checkpoints: Dict[str, Any]) -> int:
+        """
+        ミラーの内容をスナップショットで置き換える
+
+        rowsを一時テーブルに保存してから、置き換えとチェックポイントの保存を1つのトランザクションで行います。
+
+        Args:
+            rows (Iterable[Tuple[str, str, float, Dict[str, Any]]]): (商品ID, 倉庫ID, 在庫数, レコード) の列
+            checkpoints (Dict[str, Any]): 同時に保存するチェックポイント
+
+        Returns:
+            int: 保存した件数
+        """
+        staging, count = self.stage_snapshot(rows)
+        self.swap_snapshot(staging, checkpoints)
+        return count
+
+    def apply_deltas(self, deltas: Iterable[Tuple[str, str, float]], checkpoints: Dict[str, Any]) -> int:
+        """
+        在庫の増減を適用する
+
+        増減の適用とチェックポイント（カーソル）の保存は1つのトランザクションで行われるため、
+        途中で停止しても二重適用や適用漏れは発生しません。
+
+        Args:
+            deltas (Iterable[Tuple[str, str, float]]): (商品ID, 倉庫ID, 増減数) の列
+            checkpoints (Dict[str, Any]): 同時に保存するチェックポイント
+
+        Returns:
+            int: 適用した件数
+        """
+        count = 0
+        with self._lock:
+            try:
+                for article_id, warehouse_id, delta in deltas:
+                    self._conn.execute(
+                        """
+                        INSERT INTO inventory (article_id, warehouse_id, quantity, record) VALUES (?, ?, ?, NULL)
+                        ON CONFLICT (article_id, warehouse_id) DO UPDATE SET quantity = quantity + excluded.quantity
+                        """,
+                        (str(article_id), str(warehouse_id), delta),
+                    )
+                    count += 1
+                for name, value in checkpoints.items():
+                    self._set_checkpoint(name, value)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return count
+
+    def close(self) -> None:
+        """
+        データベース接続を閉じる
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class InventorySync:
+    """
+    実在庫サマリのスナップショットと取引ログによる差分同期エンジン
+
+    - bootstrap(): スナップショットを取得し、取得中に発生した取引ログを重複しないように反映します
+    - sync(): カーソルより新しい取引ログを取得し、在庫の増減として適用します
+    - verify(): スナップショットを再取得してミラーとの差異を検出し、ミラーを置き換えます
+    - run_once(): 未初期化なら bootstrap、それ以外は sync を行い、間隔が経過していれば verify します
+    """
+
+    CURSOR = "transaction_log_cursor"
+    BOOTSTRAPPED_AT = "bootstrapped_at"
+    VERIFIED_AT = "verified_at"
+
+    def __init__(
+        self,
+        client: Any,
+        mirror: InventoryMirror,
+        page_limit: int = 500,
+        verify_interval: Optional[float] = 3600.0,
+        cursor_field: str = "id",
+        cursor_param: Optional[str] = "since_id",
+        latest_params: Optional[Dict[str, Any]] = None,
+        article_field: str = "article_id",
+        warehouse_field: str = "warehouse_id",
+        quantity_field: str = "quantity",
+        delta_field: str = "quantity",
+        snapshot_params: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        InventorySyncクラスの初期化
+
+        Args:
+            client (LogilessClient): LogilessClientインスタンス
+            mirror (InventoryMirror): 在庫ミラー
+            page_limit (int, optional): 1ページあたりの取得件数
+            verify_interval (Optional[float], optional): スナップショットとの照合間隔（秒、Noneの場合は照合しない）
+            cursor_field (str, optional): 取引ログの単調増加するフィールド名
+            cursor_param (Optional[str], optional): カーソルより新しい取引ログを絞り込むクエリパラメータ名
+            latest_params (Optional[Dict[str, Any]], optional): 最新の取引ログを取得するクエリパラメータ
+            article_field (str, optional): 商品IDのフィールド名
+            warehouse_field (str, optional): 倉庫IDのフィールド名
+            quantity_field (str, optional): 実在庫サマリの在庫数フィールド名
+            delta_field (str, optional): 取引ログの増減数フィールド名
+            snapshot_params (Optional[Dict[str, Any]], optional): スナップショット取得時のクエリパラメータ
+            clock (Callable[[], float], optional): 現在時刻を返す関数
+        """
+        self.client = client
+        self.mirror = mirror
+        self.page_limit = page_limit
+        self.verify_interval = verify_interval
+        self.cursor_field = cursor_field
+        self.cursor_param = cursor_param
+        self.latest_params = latest_params if latest_params is not None else {"sort": f"-{cursor_field}", "limit": 1}
+        self.article_field = article_field
+        self.warehouse_field = warehouse_field
+        self.quantity_field = quantity_field
+        self.delta_field = delta_field
+        self.snapshot_params = snapshot_params or {}
+        self.clock = clock
+
+    @property
+    def cursor(self) -> Optional[Any]:
+        """
+        適用済みの取引ログのカーソル
+
+        Returns:
+            Optional[Any]: カーソル（未初期化の場合はNone）
+        """
+        return self.mirror.get_checkpoint(self.CURSOR)
+
+    def _latest_cursor(self) -> Optional[Any]:
+        items = extract_items(self.client.transaction_log.list(**self.latest_params))
+        cursors = [item[self.cursor_field] for item in items if item.get(self.cursor_field) is not None]
+        return max(cursors, key=_cursor_sort_key) if cursors else None
+
+    def _snapshot_rows(self) -> Iterator[Tuple[str, str, float, Dict[str, Any]]]:
+        records = self.client.actual_inventory_summary.iter_all(limit=self.page_limit, **self.snapshot_params)
+        for record in records:
+            yield (
+                record[self.article_field],
+                record[self.warehouse_field],
+                float(record.get(self.quantity_field) or 0),
+                record,
+            )
+
+    def _load_snapshot(self, rows: Iterable[Tuple[str, str, float, Dict[str, Any]]], checkpoints: Dict[str, Any]) -> int:
+        """
+        スナップショットを一時テーブルに取得し、取得中の取引ログとあわせてミラーを置き換える
+
+        スナップショットの取得前後で取引ログのカーソルを読み、その間の取引ログのうちスナップショットに
+        含まれない（商品, 倉庫）の増減のみを適用します。スナップショットに含まれる行は取得時点の在庫数を
+        正とし、カーソルは取得後の位置に進めるため、次回の sync() で同じ増減が二重に適用されることはありません。
+        """
+        before = self._latest_cursor()
+        staging, count = self.mirror.stage_snapshot(rows)
+        try:
+            after = self._latest_cursor()
+            overlap = self._entries_between(before, after) if after is not None else []
+            deltas = [
+                (entry[self.article_field], entry[self.warehouse_field], float(entry.get(self.delta_field) or 0))
+                for entry in overlap
+            ]
+        except BaseException:
+            self.mirror.discard_staging(staging)
+            raise
+        self.mirror.swap_snapshot(staging, {**checkpoints, self.CURSOR: after}, deltas)
+        return count
+
+    def bootstrap(self) -> int:
+        """
+        スナップショットを取得してミラーを初期化する
+
+        スナップショットの取得（APIの呼び出し）中はミラーをロックしません。
+
+        Returns:
+            int: 保存したレコード数
+        """
+        now = self.clock()
+        return self._load_snapshot(self._snapshot_rows(), {self.BOOTSTRAPPED_AT: now, self.VERIFIED_AT: now})
+
+    def _entries_between(self, after: Optional[Any], upto: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        カーソルが after より新しく upto 以前の取引ログをカーソル順に取得する
+        """
+        params: Dict[str, Any] = {}
+        if after is not None and self.cursor_param:
+            params[self.cursor_param] = after
+        entries = []
+        for entry in self.client.transaction_log.iter_all(limit=self.page_limit, **params):
+            value = entry.get(self.cursor_field)
+            if value is None:
+                continue
+            key = _cursor_sort_key(value)
+            if after is not None and key <= _cursor_sort_key(after):
+                continue
+            if upto is not None and key > _cursor_sort_key(upto):
+                continue
+            entries.append(entry)
+        entries.sort(key=lambda entry: _cursor_sort_key(entry[self.cursor_field]))
+        return entries
+
+    def pending_entries(self) -> List[Dict[str, Any]]:
+        """
+        カーソルより新しい取引ログをカーソル順に取得する
+
+        Returns:
+            List[Dict[str, Any]]: 未適用の取引ログ
+        """
+        return self._entries_between(self.cursor)
+
+    def sync(self) -> int:
+        """
+        未適用の取引ログをミラーに適用する
+
+        Returns:
+            int: 適用した取引ログの件数
+
+        Raises:
+            LogilessError: bootstrap() が実行されていない場合
+        """
+        if self.mirror.get_checkpoint(self.BOOTSTRAPPED_AT) is None:
+            raise LogilessError("在庫ミラーが初期化されていません。先にbootstrap()を実行してください")
+        entries = self.pending_entries()
+        if not entries:
+            return 0
+        deltas = [
+            (entry[self.article_field], entry[self.warehouse_field], float(entry.get(self.delta_field) or 0))
+            for entry in entries
+        ]
+        return self.mirror.apply_deltas(deltas, {self.CURSOR: entries[-1][self.cursor_field]})
+
+    def verify(self) -> Dict[str, Any]:
+        """
+        スナップショットを再取得してミラーと照合し、ミラーを置き換える
+
+        Returns:
+            Dict[str, Any]: checked（照合件数）、mismatched（在庫数の差異）、missing（ミラーにない件数）、
+                extra（スナップショットにない件数）、drift（差異のあったキーの一部）を含む辞書
+        """
+        before = self.mirror.quantities()
+        report: Dict[str, Any] = {"checked": 0, "mismatched": 0, "missing": 0, "extra": 0, "drift": []}
+        seen = set()
+
+        def compare(rows: Iterable[Tuple[str, str, float, Dict[str, Any]]]) -> Iterator[Tuple[str, str, float, Dict[str, Any]]]:
+            for row in rows:
+                key = (str(row[0]), str(row[1]))
+                seen.add(key)
+                report["checked"] += 1
+                if key not in before:
+                    report["missing"] += 1
+                    report["drift"].append(key)
+                elif before[key] != row[2]:
+                    report["mismatched"] += 1
+                    report["drift"].append(key)
+                yield row
+
+        self._load_snapshot(compare(self._snapshot_rows()), {self.VERIFIED_AT: self.clock()})
+        extra = [key for key, quantity in before.items() if key not in seen and quantity != 0]
+        report["extra"] = len(extra)
+        report["drift"] = (report["drift"] + extra)[:100]
+        return report
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        同期処理を1回実行する
+
+        Returns:
+            Dict[str, Any]: 実行した処理（bootstrapped / applied / verification）を含む辞書
+        """
+        result: Dict[str, Any] = {"bootstrapped": 0, "applied": 0, "verification": None}
+        if self.mirror.get_checkpoint(self.BOOTSTRAPPED_AT) is None:
+            result["bootstrapped"] = self.bootstrap()
+            return result
+        result["applied"] = self.sync()
+        verified_at = self.mirror.get_checkpoint(self.VERIFIED_AT) or 0
+        if self.verify_interval is not None and self.clock() - verified_at >= self.verify_interval:
+            result["verification"] = self.verify()
+        return result
+
+    def run_forever(self, interval: float = 60.0, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        stop_event がセットされるまで一定間隔で run_once() を実行する
+
+        Args:
+            interval (float, optional): 実行間隔（秒）
+            stop_event (Optional[threading.Event], optional): 停止を通知するイベント
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.run_once()
+            stop_event.wait(interval)
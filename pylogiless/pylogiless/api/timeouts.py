@@ -0,0 +1,184 @@
+"""
+タイムアウトと期限（デッドライン）を扱うモジュール
+
+deadline() で設定した期限は、同じコンテキスト内の全てのリクエスト（ページング・一括処理・
+リトライを含む）に適用されます。期限を過ぎると、以降のリクエストは送信せずに
+LogilessDeadlineExceeded を送出します。ワーカースレッドへはコンテキストごと引き継がれます。
+"""
+import contextvars
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+
+from .errors import LogilessDeadlineExceeded
+
+# 接続タイムアウトと読み込みタイムアウト（秒）。数値1つの場合は両方に使用する
+Timeout = Union[float, Tuple[Optional[float], Optional[float]], None]
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (10.0, 60.0)
+
+_deadline: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar("pylogiless_deadline", default=None)
+_timeout: "contextvars.ContextVar[Optional[Timeout]]" = contextvars.ContextVar("pylogiless_timeout", default=None)
+
+
+class Deadline:
+    """
+    処理全体の期限
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        """
+        Deadlineクラスの初期化
+
+        Args:
+            seconds (float): 現在からの秒数
+        """
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """
+        期限までの残り秒数を取得する
+
+        Returns:
+            float: 残り秒数（期限を過ぎている場合は0以下）
+        """
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """
+        期限を過ぎたかどうか
+        """
+        return self.remaining() <= 0
+
+    def check(self) -> float:
+        """
+        期限を過ぎていないことを確認する
+
+        Returns:
+            float: 残り秒数
+
+        Raises:
+            LogilessDeadlineExceeded: 期限を過ぎている場合
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise LogilessDeadlineExceeded("処理の期限を過ぎました")
+        return remaining
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """
+    ブロック内のリクエストに期限を設定する
+
+    既に期限が設定されている場合は、早い方の期限を使用します。
+
+    Args:
+        seconds (float): 現在からの秒数
+
+    Yields:
+        Deadline: 有効な期限
+    """
+    new = Deadline(seconds)
+    current = _deadline.get()
+    if current is not None and current.expires_at <= new.expires_at:
+        new = current
+    token = _deadline.set(new)
+    try:
+        yield new
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    現在のコンテキストの期限を取得する
+
+    Returns:
+        Optional[Deadline]: 期限（設定されていない場合はNone）
+    """
+    return _deadline.get()
+
+
+def current_timeout() -> Timeout:
+    """
+    request_timeout() で指定された現在のコンテキストのタイムアウトを取得する
+
+    Returns:
+        Timeout: タイムアウト（指定されていない場合はNone）
+    """
+    return _timeout.get()
+
+
+@contextmanager
+def request_timeout(timeout: Timeout) -> Iterator[None]:
+    """
+    ブロック内のリクエストのタイムアウトを変更する（リソースのメソッド経由の呼び出し用）
+
+    Args:
+        timeout (Timeout): 秒数、または (接続タイムアウト, 読み込みタイムアウト) のタプル
+    """
+    token = _timeout.set(timeout)
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def resolve_timeout(default: Timeout, override: Timeout = None) -> Timeout:
+    """
+    1回の送信に使うタイムアウトを決定する
+
+    優先順位は、引数の override、request_timeout() の指定、クライアントの既定値の順です。
+    期限が設定されている場合は、接続・読み込みのタイムアウトを期限までの残り秒数以下にします。
+
+    Args:
+        default (Timeout): クライアントの既定値
+        override (Timeout, optional): 呼び出し単位の指定
+
+    Returns:
+        Timeout: requestsに渡すタイムアウト
+
+    Raises:
+        LogilessDeadlineExceeded: 期限を過ぎている場合
+    """
+    timeout = override if override is not None else _timeout.get()
+    if timeout is None:
+        timeout = default
+    current = _deadline.get()
+    if current is None:
+        return timeout
+
+    remaining = current.check()
+    if timeout is None:
+        return (remaining, remaining)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return (
+        remaining if connect is None else min(connect, remaining),
+        remaining if read is None else min(read, remaining),
+    )
+
+
+def submit_with_context(executor: Executor, func: Callable[..., Any], *args: Any) -> Future:
+    """
+    現在のコンテキスト（期限とタイムアウトの指定を含む）を引き継いで関数を実行する
+
+    Args:
+        executor (Executor): 実行するエグゼキューター
+        func (Callable[..., Any]): 関数
+        *args: 関数に渡す引数
+
+    Returns:
+        Future: 実行結果
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args)
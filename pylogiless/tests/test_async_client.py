@@ -0,0 +1,171 @@
+"""
+非同期クライアントモジュールのテスト
+"""
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from pylogiless import AsyncLogilessClient
+from pylogiless.api.errors import (
+    LogilessError,
+    LogilessResourceLockedError,
+    LogilessTimeoutError,
+    LogilessValidationError,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncLogilessClient:
+    """
+    AsyncLogilessClientクラスのテストケース
+    """
+
+    def _client(self, handler, **kwargs):
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncLogilessClient("test_access_token", "test_merchant_id", http_client=http_client, **kwargs)
+
+    def test_resources_mirror_sync_client(self):
+        """
+        同期クライアントと同じリソースを持つことをテスト
+        """
+        client = self._client(lambda request: httpx.Response(200))
+        assert client.article.resource_path == "merchant/test_merchant_id/articles"
+        assert client.sales_order.resource_path == "merchant/test_merchant_id/sales_orders"
+        assert client.inter_warehouse_transfer.resource_path == "merchant/test_merchant_id/inter_warehouse_transfers"
+
+    def test_resource_get(self):
+        """
+        get()がURL・ヘッダー・クエリを正しく送信することをテスト
+        """
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["Authorization"]
+            return httpx.Response(200, json={"id": "123"})
+
+        async def main():
+            async with self._client(handler) as client:
+                return await client.article.get("123", expand="all")
+
+        assert _run(main()) == {"id": "123"}
+        assert seen["method"] == "GET"
+        assert seen["url"] == f"{AsyncLogilessClient.API_BASE_URL}/merchant/test_merchant_id/articles/123?expand=all"
+        assert seen["auth"] == "Bearer test_access_token"
+
+    def test_resource_create(self):
+        """
+        create()がJSONボディを送信することをテスト
+        """
+        def handler(request):
+            assert request.method == "POST"
+            assert json.loads(request.content) == {"code": "NEW001"}
+            return httpx.Response(201, json={"id": "1"})
+
+        async def main():
+            async with self._client(handler) as client:
+                return await client.sales_order.create({"code": "NEW001"})
+
+        assert _run(main()) == {"id": "1"}
+
+    def test_json_codec(self):
+        """
+        コーデック指定時も同じボディを送受信することをテスト
+        """
+        def handler(request):
+            assert json.loads(request.content) == {"code": "商品1"}
+            assert request.headers["Content-Type"] == "application/json"
+            return httpx.Response(201, json={"id": "1"})
+
+        async def main():
+            async with self._client(handler, json_codec="auto") as client:
+                return await client.sales_order.create({"code": "商品1"})
+
+        assert _run(main()) == {"id": "1"}
+
+    def test_errors_are_mapped(self):
+        """
+        エラーステータスが同じ例外階層に変換されることをテスト
+        """
+        def handler(request):
+            if request.method == "PUT":
+                return httpx.Response(423, json={"error": "locked"})
+            return httpx.Response(400, json={"message": "Validation Failed", "errors": {"name": "必須項目です"}})
+
+        async def main():
+            async with self._client(handler) as client:
+                with pytest.raises(LogilessValidationError):
+                    await client.article.create({})
+                with pytest.raises(LogilessResourceLockedError):
+                    await client.article.update("1", {})
+
+        _run(main())
+
+    def test_transport_error(self):
+        """
+        通信エラーがLogilessErrorに変換されることをテスト
+        """
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        async def main():
+            async with self._client(handler) as client:
+                await client.article.list()
+
+        with pytest.raises(LogilessError, match="APIリクエストエラー") as excinfo:
+            _run(main())
+        assert isinstance(excinfo.value.__cause__, httpx.ConnectError)
+
+    def test_timeout_error(self):
+        """
+        タイムアウトがLogilessTimeoutErrorに変換され、元の例外を保持することをテスト
+        """
+        def handler(request):
+            raise httpx.ReadTimeout("timed out")
+
+        async def main():
+            async with self._client(handler) as client:
+                await client.article.list()
+
+        with pytest.raises(LogilessTimeoutError) as excinfo:
+            _run(main())
+        assert isinstance(excinfo.value.__cause__, httpx.ReadTimeout)
+
+    def test_default_timeout_matches_sync_client(self):
+        """
+        既定のタイムアウトが同期クライアントと同じ（接続10秒・読み込み60秒）であることをテスト
+        """
+        client = AsyncLogilessClient("test_access_token", "test_merchant_id")
+        assert client.http_client.timeout == httpx.Timeout(60.0, connect=10.0, pool=10.0)
+        _run(client.aclose())
+
+        client = AsyncLogilessClient("test_access_token", "test_merchant_id", timeout=None)
+        assert client.http_client.timeout == httpx.Timeout(None)
+        _run(client.aclose())
+
+    def test_bounded_concurrency(self):
+        """
+        同時実行数がmax_concurrencyを超えないことをテスト
+        """
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return httpx.Response(200, json={"items": []})
+
+        async def main():
+            async with self._client(handler, max_concurrency=3) as client:
+                await asyncio.gather(*(client.article.list(page=i) for i in range(20)))
+
+        _run(main())
+        assert state["peak"] == 3
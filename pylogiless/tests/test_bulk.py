@@ -0,0 +1,103 @@
+"""
+一括登録・更新モジュールのテスト
+"""
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from pylogiless import BulkReport, LogilessClient
+from pylogiless.api.bulk import run_bulk
+from pylogiless.api.errors import LogilessError, LogilessValidationError
+
+
+class TestRunBulk:
+    """
+    run_bulk関数のテストケース
+    """
+
+    def test_concurrency_limit_and_order(self):
+        """
+        同時実行数が上限を超えず、結果が入力順に並ぶことをテスト
+        """
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def work(item):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            # 後の要素ほど早く終わる
+            time.sleep(0.002 * (20 - item))
+            with lock:
+                active["now"] -= 1
+            return item * 10
+
+        report = run_bulk(work, range(20), concurrency=3)
+
+        assert [result.response for result in report] == [i * 10 for i in range(20)]
+        assert [result.index for result in report] == list(range(20))
+        assert active["max"] == 3
+
+    def test_unexpected_errors_propagate(self):
+        def work(item):
+            raise TypeError("bug")
+
+        with pytest.raises(TypeError):
+            run_bulk(work, [1, 2, 3], concurrency=2)
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            run_bulk(lambda item: item, [1], concurrency=0)
+
+
+class TestResourceBulk:
+    """
+    APIResource.bulk_create / bulk_updateのテスト
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("token", "merchant")
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_bulk_create_reports_partial_failures(self, mock_request):
+        """
+        失敗したレコードがあっても残りを処理し、結果を入力順に返すことをテスト
+        """
+        def fake_request(method, url, json=None, **kwargs):
+            if json["code"] == "BAD":
+                raise LogilessValidationError("Validation Failed", status_code=400, validation_errors={"code": "invalid"})
+            return {"id": json["code"]}
+
+        mock_request.side_effect = fake_request
+        orders = [{"code": "SO-1"}, {"code": "BAD"}, {"code": "SO-3"}]
+
+        report = self.client.sales_order.bulk_create(orders, concurrency=2)
+
+        assert isinstance(report, BulkReport)
+        assert [result.ok for result in report] == [True, False, True]
+        assert report[2].response == {"id": "SO-3"}
+        assert isinstance(report[1].error, LogilessValidationError)
+        assert report.failed_items() == [{"code": "BAD"}]
+        assert report.stats() == {"total": 3, "succeeded": 2, "failed": 1}
+        assert not report.ok
+        with pytest.raises(LogilessValidationError):
+            report.raise_for_errors()
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_bulk_update(self, mock_request):
+        mock_request.side_effect = lambda method, url, json=None, **kwargs: {"url": url, **json}
+
+        report = self.client.outbound_delivery.bulk_update({"D1": {"status": "shipped"}, "D2": {"status": "held"}})
+
+        assert report.ok
+        assert [result.item for result in report] == [("D1", {"status": "shipped"}), ("D2", {"status": "held"})]
+        assert report[1].response["url"].endswith("/outbound_deliveries/D2")
+        assert all(call[0][0] == "PUT" for call in mock_request.call_args_list)
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_transport_errors_are_reported(self, mock_request):
+        mock_request.side_effect = LogilessError("APIリクエストエラー")
+        report = self.client.sales_order.bulk_update([("1", {}), ("2", {})])
+        assert len(report.failed) == 2
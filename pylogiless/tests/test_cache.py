@@ -0,0 +1,150 @@
+"""
+レスポンスキャッシュモジュールのテスト
+"""
+from unittest import mock
+
+from pylogiless import LogilessClient, ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    """
+    ResponseCacheクラスのテストケース
+    """
+
+    def test_ttl_expiration(self):
+        """
+        TTLを過ぎたエントリが破棄されることをテスト
+        """
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"warehouses": 10.0}, clock=clock)
+        cache.set("merchant/1/warehouses", "key", {"items": []})
+
+        assert cache.get("merchant/1/warehouses", "key") == (True, {"items": []})
+        clock.now = 11.0
+        assert cache.get("merchant/1/warehouses", "key") == (False, None)
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """
+        最大エントリ数を超えると最も古く使われたエントリが破棄されることをテスト
+        """
+        cache = ResponseCache(max_entries=2, default_ttl=60.0)
+        cache.set("r", "a", 1)
+        cache.set("r", "b", 2)
+        cache.get("r", "a")
+        cache.set("r", "c", 3)
+
+        assert cache.get("r", "a") == (True, 1)
+        assert cache.get("r", "b") == (False, None)
+        assert cache.stats()["evictions"] == 1
+
+    def test_uncached_endpoints(self):
+        """
+        TTLが設定されていないエンドポイントは保存されないことをテスト
+        """
+        cache = ResponseCache()
+        assert cache.ttl_for("merchant/1/sales_orders") is None
+        cache.set("merchant/1/sales_orders", "key", {"id": 1})
+        assert cache.stats()["size"] == 0
+
+    def test_returns_copies(self):
+        """
+        取得したレスポンスを変更してもキャッシュに影響しないことをテスト
+        """
+        cache = ResponseCache(default_ttl=60.0)
+        cache.set("r", "k", {"items": [1]})
+        hit, value = cache.get("r", "k")
+        value["items"].append(2)
+        assert cache.get("r", "k") == (True, {"items": [1]})
+
+    def test_stale_set_after_invalidate_is_ignored(self):
+        """
+        取得中に破棄された場合は古いレスポンスを保存しないことをテスト
+        """
+        cache = ResponseCache(default_ttl=60.0)
+        generation = cache.generation("r")
+        cache.invalidate("r")
+        cache.set("r", "k", {"old": True}, generation=generation)
+        assert cache.get("r", "k") == (False, None)
+
+        generation = cache.generation("r")
+        cache.clear()
+        cache.set("r", "k", {"old": True}, generation=generation)
+        assert cache.get("r", "k") == (False, None)
+        cache.set("r", "k", {"new": True}, generation=cache.generation("r"))
+        assert cache.get("r", "k") == (True, {"new": True})
+
+
+class TestClientResponseCache:
+    """
+    APIResourceとレスポンスキャッシュの連携テスト
+    """
+
+    def setup_method(self):
+        self.cache = ResponseCache()
+        self.client = LogilessClient("token", "merchant", response_cache=self.cache)
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_reference_resources_are_cached(self, mock_request):
+        """
+        参照系リソースのGETがキャッシュから返されることをテスト
+        """
+        mock_request.return_value = {"items": [{"id": "W1"}]}
+
+        for _ in range(3):
+            assert self.client.warehouse.list() == {"items": [{"id": "W1"}]}
+        self.client.location.get("L1")
+        self.client.location.get("L1")
+
+        assert mock_request.call_count == 2
+        stats = self.cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 2
+        assert stats["endpoints"]["warehouses"] == {"hits": 2, "misses": 1}
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_params_are_part_of_key(self, mock_request):
+        """
+        クエリパラメータが異なる場合は別のエントリとなることをテスト
+        """
+        mock_request.return_value = {"items": []}
+        self.client.store.list(page=1)
+        self.client.store.list(page=2)
+        self.client.store.list(page=1)
+        assert mock_request.call_count == 2
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_writes_invalidate_resource(self, mock_request):
+        """
+        create/update/deleteで同じリソースのキャッシュが破棄されることをテスト
+        """
+        mock_request.return_value = {"items": []}
+        self.client.supplier.list()
+        self.client.warehouse.list()
+
+        self.client.supplier.update("S1", {"name": "new"})
+        self.client.supplier.list()
+        self.client.warehouse.list()
+
+        # supplierのみ再取得される（list x2 + update + list）
+        assert mock_request.call_count == 4
+        assert self.cache.stats()["invalidations"] == 1
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_transactional_resources_bypass_cache(self, mock_request):
+        """
+        TTLが設定されていないリソースはキャッシュを経由しないことをテスト
+        """
+        mock_request.return_value = {"items": []}
+        self.client.sales_order.list()
+        self.client.sales_order.list()
+        assert mock_request.call_count == 2
+        assert self.cache.stats()["misses"] == 0
@@ -0,0 +1,178 @@
+"""
+記録・再生モジュールのテスト
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from pylogiless import Cassette, LogilessClient
+from pylogiless.api.cassette import read_cassette
+from pylogiless.api.errors import LogilessError, LogilessValidationError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = []
+
+    def _respond(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.calls.append(self.path)
+        if self.path.endswith("/articles/404"):
+            self._respond(400, {"message": "invalid", "errors": {"code": "不正です"}})
+        else:
+            self._respond(200, {"items": [{"id": len(self.calls), "name": "商品"}], "total": 1})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length))
+        self.calls.append(self.path)
+        self._respond(201, {**data, "id": 100})
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.calls = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _record(server, path):
+    with LogilessClient("token", "m1", api_base_url=server, cassette=Cassette(path, mode="record")) as client:
+        first = client.article.list(page=1, limit=10)
+        second = client.article.list(limit=10, page=1)
+        created = client.sales_order.create({"code": "SO-1"})
+        with pytest.raises(LogilessValidationError):
+            client.article.get("404")
+    return first, second, created
+
+
+@pytest.mark.parametrize("name", ["day.jsonl", "day.jsonl.gz"])
+def test_record_then_replay_offline(server, tmp_path, name):
+    """
+    記録したやり取りを、APIに接続せずに記録順で再生することをテスト
+    """
+    path = str(tmp_path / name)
+    first, second, created = _record(server, path)
+    assert len(_Handler.calls) == 4
+
+    entries = read_cassette(path)
+    assert [entry["status"] for entry in entries] == [200, 200, 201, 400]
+    assert all("Authorization" not in json.dumps(entry) for entry in entries)
+
+    cassette = Cassette(path)
+    assert cassette.remaining() == 4
+    with LogilessClient("token", "m1", api_base_url=server, cassette=cassette) as client:
+        # クエリパラメータの順序が異なっても同じリクエストとして照合し、同じキーは記録順に返す
+        assert client.article.list(limit=10, page=1) == first
+        assert client.article.list(page=1, limit=10) == second
+        assert client.sales_order.create({"code": "SO-1"}) == created
+        with pytest.raises(LogilessValidationError) as excinfo:
+            client.article.get("404")
+        assert excinfo.value.validation_errors == {"code": "不正です"}
+    assert len(_Handler.calls) == 4
+    assert cassette.stats() == {"recorded": 0, "replayed": 4, "misses": 0, "incomplete": 0}
+
+
+def test_unmatched_request_and_repeats(server, tmp_path):
+    path = str(tmp_path / "day.jsonl")
+    _record(server, path)
+
+    with LogilessClient("token", "m1", api_base_url=server, cassette=Cassette(path)) as client:
+        # リクエストボディが異なる場合は照合しない
+        with pytest.raises(LogilessError, match="カセットに記録がない"):
+            client.sales_order.create({"code": "SO-2"})
+        client.article.list(page=1, limit=10)
+        client.article.list(page=1, limit=10)
+        with pytest.raises(LogilessError):
+            client.article.list(page=1, limit=10)
+
+    cassette = Cassette(path, allow_repeats=True)
+    with LogilessClient("token", "m1", api_base_url=server, cassette=cassette) as client:
+        pages = [client.article.list(page=1, limit=10) for _ in range(3)]
+    assert pages[1] == pages[2]
+    assert cassette.stats()["misses"] == 0
+
+
+def test_replay_with_original_latency(server, tmp_path):
+    path = str(tmp_path / "day.jsonl")
+    _record(server, path)
+    entries = read_cassette(path)
+    for entry in entries:
+        entry["elapsed"] = 0.05
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
+
+    client = LogilessClient("token", "m1", api_base_url=server, cassette=Cassette(path, timing="latency", speed=2.0))
+    started = time.monotonic()
+    client.article.list(page=1, limit=10)
+    assert 0.02 <= time.monotonic() - started < 0.5
+
+
+def test_stream_from_cassette(server, tmp_path):
+    path = str(tmp_path / "day.jsonl")
+    _record(server, path)
+    client = LogilessClient("token", "m1", api_base_url=server, cassette=Cassette(path))
+    assert list(client.article.list(page=1, limit=10, stream=True)) == [{"id": 1, "name": "商品"}]
+
+
+def test_record_streamed_response(server, tmp_path):
+    """
+    stream=True のレスポンスを読み終えた時点で記録し、途中で閉じたものは記録しないことをテスト
+    """
+    path = str(tmp_path / "day.jsonl")
+    cassette = Cassette(path, mode="record")
+    with LogilessClient("token", "m1", api_base_url=server, cassette=cassette) as client:
+        stream = client.article.list(page=1, limit=10, stream=True)
+        assert cassette.stats()["recorded"] == 0
+        assert list(stream) == [{"id": 1, "name": "商品"}]
+        assert cassette.stats()["recorded"] == 1
+
+        with client.article.list(page=2, limit=10, stream=True):
+            pass
+    assert cassette.stats() == {"recorded": 1, "replayed": 0, "misses": 0, "incomplete": 1}
+    assert [entry["url"].endswith("page=1") for entry in read_cassette(path)] == [True]
+
+    client = LogilessClient("token", "m1", api_base_url=server, cassette=Cassette(path))
+    assert list(client.article.list(page=1, limit=10, stream=True)) == [{"id": 1, "name": "商品"}]
+
+
+
+@pytest.mark.parametrize("mode", ["record", "replay"])
+def test_shared_session_is_restored_on_close(server, tmp_path, mode):
+    """
+    呼び出し元のセッションに組み込んだカセットを、close() で元のアダプタに戻すことをテスト
+    """
+    path = str(tmp_path / "day.jsonl")
+    _record(server, path)
+    session = requests.Session()
+    adapters = list(session.adapters.items())
+
+    with LogilessClient("token", "m1", api_base_url=server, session=session, cassette=Cassette(path, mode=mode)) as client:
+        client.article.list(page=1, limit=10)
+        assert list(session.adapters.items()) != adapters
+    assert list(session.adapters.items()) == adapters
+
+
+def test_invalid_options(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "x.jsonl"), mode="write")
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "x.jsonl"), mode="record", timing="realtime")
@@ -0,0 +1,132 @@
+"""
+サーキットブレーカーのテスト
+"""
+import json
+
+import pytest
+from requests.adapters import BaseAdapter
+
+from pylogiless import CircuitBreaker, LogilessCircuitOpenError, LogilessClient, RetryPolicy
+from pylogiless.api.circuit import CLOSED, HALF_OPEN, OPEN
+from pylogiless.api.errors import LogilessError, LogilessServerError, LogilessValidationError
+from pylogiless.api.session import build_response
+
+DELIVERIES = "merchant/{merchant_id}/outbound_deliveries"
+
+
+class _Adapter(BaseAdapter):
+    """
+    outbound_deliveries だけが status を返し、それ以外は200を返すアダプタ
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.status = 503
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        status = self.status if "outbound_deliveries" in request.url else 200
+        body = json.dumps({"id": "1"} if status < 400 else {"message": "error"}).encode()
+        response = build_response(status, {"Content-Type": "application/json"}, body)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def setup():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10.0, clock=clock)
+    client = LogilessClient("token", "m1", api_base_url="https://api.test/v1", circuit_breaker=breaker)
+    adapter = _Adapter()
+    client.session.mount("https://api.test/", adapter)
+    changes = []
+    client.hooks.register("on_circuit_state", changes.append)
+    return client, breaker, adapter, clock, changes
+
+
+def test_opens_after_threshold_and_fails_fast(setup):
+    client, breaker, adapter, clock, changes = setup
+    for _ in range(3):
+        with pytest.raises(LogilessServerError):
+            client.outbound_delivery.get("1")
+    assert breaker.state(DELIVERIES) == OPEN
+    assert [(c.key, c.old_state, c.new_state, c.failures) for c in changes] == [(DELIVERIES, CLOSED, OPEN, 3)]
+
+    sent = len(adapter.sent)
+    with pytest.raises(LogilessCircuitOpenError) as excinfo:
+        client.outbound_delivery.list()
+    assert excinfo.value.key == DELIVERIES
+    assert excinfo.value.retry_after == pytest.approx(10.0)
+    # サーキットを開いた最後の障害を保持する
+    assert isinstance(excinfo.value.last_error, LogilessServerError)
+    assert excinfo.value.__cause__ is excinfo.value.last_error
+    assert len(adapter.sent) == sent
+
+    # 他のエンドポイントには影響しない
+    assert client.article.get("1") == {"id": "1"}
+
+
+def test_half_open_probe_closes_or_reopens(setup):
+    client, breaker, adapter, clock, changes = setup
+    for _ in range(3):
+        with pytest.raises(LogilessServerError):
+            client.outbound_delivery.get("1")
+
+    clock.now = 10.0
+    with pytest.raises(LogilessServerError):
+        client.outbound_delivery.get("1")
+    assert [c.new_state for c in changes] == [OPEN, HALF_OPEN, OPEN]
+
+    clock.now = 20.0
+    adapter.status = 200
+    assert client.outbound_delivery.get("1") == {"id": "1"}
+    assert [c.new_state for c in changes] == [OPEN, HALF_OPEN, OPEN, HALF_OPEN, CLOSED]
+    assert breaker.states() == {DELIVERIES: {"state": CLOSED, "failures": 0}}
+
+
+def test_half_open_limits_concurrent_probes():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1.0, clock=clock)
+    breaker.record("key", LogilessServerError("unavailable", 503))
+    clock.now = 1.0
+    breaker.before_call("key")
+    with pytest.raises(LogilessCircuitOpenError):
+        breaker.before_call("key")
+    breaker.release("key")
+    breaker.before_call("key")
+
+
+def test_client_errors_do_not_count_and_open_circuit_is_not_retried(setup):
+    client, breaker, adapter, clock, changes = setup
+    adapter.status = 400
+    for _ in range(5):
+        with pytest.raises(LogilessValidationError):
+            client.outbound_delivery.get("1")
+    assert breaker.state(DELIVERIES) == CLOSED
+
+    adapter.status = 503
+    client.retry_policy = RetryPolicy(max_retries=5, sleep=lambda delay: None)
+    with pytest.raises(LogilessCircuitOpenError) as excinfo:
+        client.outbound_delivery.get("1")
+    # 3回目の失敗で開き、4回目は送信せずに失敗してリトライを打ち切る
+    assert excinfo.value.retries == 3
+    assert excinfo.value.last_error.status_code == 503
+    assert len([url for url in adapter.sent if "outbound_deliveries" in url]) == 5 + 3
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    assert issubclass(LogilessCircuitOpenError, LogilessError)
@@ -2,12 +2,15 @@
 クライアントモジュールのテスト
 """
 import json
+import os
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
 import requests
 
-from pylogiless import LogilessClient
+from pylogiless import ArticleResource, LogilessClient
 from pylogiless.api.errors import (
     LogilessAuthError,
     LogilessError,
@@ -152,7 +155,7 @@ class TestLogilessClient:
             "DELETE", f"{self.client.api_base_url}/merchant/{self.client.auth.merchant_id}/articles/123"
         )
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_success(self, mock_request):
         """
         requestメソッドの成功をテスト
@@ -176,7 +179,7 @@ class TestLogilessClient:
         assert mock_request.call_args[0][0] == "GET"
         assert mock_request.call_args[0][1] == "https://app2.logiless.com/api/article/123"
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_invalid_token(self, mock_request):
         """
         無効なトークンを使用した場合のrequestメソッドをテスト
@@ -192,7 +195,7 @@ class TestLogilessClient:
         # requestが呼ばれていないことを確認
         mock_request.assert_not_called()
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_validation_error(self, mock_request):
         """
         バリデーションエラーが発生した場合のrequestメソッドをテスト
@@ -215,7 +218,7 @@ class TestLogilessClient:
         with pytest.raises(LogilessValidationError):
             self.client.request("POST", "https://app2.logiless.com/api/article", json={"code": "TEST"})
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_auth_error(self, mock_request):
         """
         認証エラーが発生した場合のrequestメソッドをテスト
@@ -237,7 +240,7 @@ class TestLogilessClient:
         with pytest.raises(LogilessAuthError):
             self.client.request("GET", "https://app2.logiless.com/api/article/123")
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_rate_limit_error(self, mock_request):
         """
         レート制限エラーが発生した場合のrequestメソッドをテスト
@@ -259,7 +262,7 @@ class TestLogilessClient:
         with pytest.raises(LogilessRateLimitError):
             self.client.request("GET", "https://app2.logiless.com/api/article/123")
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_server_error(self, mock_request):
         """
         サーバーエラーが発生した場合のrequestメソッドをテスト
@@ -281,7 +284,7 @@ class TestLogilessClient:
         with pytest.raises(LogilessServerError):
             self.client.request("GET", "https://app2.logiless.com/api/article/123")
 
-    @mock.patch("requests.request")
+    @mock.patch.object(requests.Session, "request")
     def test_request_with_non_json_response(self, mock_request):
         """
         非JSONレスポンスの場合のrequestメソッドをテスト
@@ -301,3 +304,61 @@ class TestLogilessClient:
 
         # 期待される結果を検証
         assert result == {"text": "プレーンテキストレスポンス"}
+
+
+class TestLazyStartup:
+    """
+    リソースとセッションの遅延生成のテスト
+    """
+
+    def test_resources_are_created_on_first_access(self):
+        client = LogilessClient("token", "merchant")
+        assert "article" not in vars(client)
+
+        article = client.article
+        assert isinstance(article, ArticleResource)
+        assert article.resource_path == "merchant/merchant/articles"
+        assert client.article is article
+        assert vars(client)["article"] is article
+        # クライアントごとに別のリソース
+        assert LogilessClient("token", "other").article is not article
+
+    def test_session_is_created_on_first_use(self):
+        client = LogilessClient("token", "merchant")
+        assert client._session is None
+        client.close()
+        assert client._session is None
+        assert client.session is client.session
+
+    def test_import_does_not_load_heavy_modules(self):
+        """
+        import と クライアント生成で requests などを読み込まないことをテスト
+        """
+        code = (
+            "import sys\n"
+            "import pylogiless\n"
+            "client = pylogiless.LogilessClient('token', 'merchant')\n"
+            "client.sales_order\n"
+            "print(','.join(m for m in ('requests', 'httpx', 'numpy', 'orjson', 'sqlite3') if m in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+        assert subprocess.check_output([sys.executable, "-c", code], env=env, text=True).strip() == ""
+
+    def test_unknown_attribute(self):
+        import pylogiless
+
+        with pytest.raises(AttributeError):
+            pylogiless.NoSuchName
+        assert "LogilessClient" in dir(pylogiless)
+
+    def test_top_level_exports_match_api(self):
+        """
+        トップレベルと pylogiless.api の公開名が同じオブジェクトを指すことをテスト
+        """
+        import pylogiless
+        import pylogiless.api
+
+        assert pylogiless.__all__ == pylogiless.api.__all__
+        for name in pylogiless.api.__all__:
+            assert getattr(pylogiless, name) is getattr(pylogiless.api, name)
@@ -0,0 +1,190 @@
+"""
+リクエストのまとめ（single-flight）モジュールのテスト
+"""
+import threading
+import time
+from unittest import mock
+
+from pylogiless import LogilessClient, SingleFlight, deadline, request_timeout
+from pylogiless.api.errors import LogilessDeadlineExceeded, LogilessServerError
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """
+    SingleFlightクラスとクライアントの連携テスト
+    """
+
+    def setup_method(self):
+        self.flight = SingleFlight()
+        self.client = LogilessClient("token", "merchant", single_flight=self.flight)
+        self.release = threading.Event()
+
+    def _run_concurrently(self, count, func):
+        results = [None] * count
+
+        def worker(index):
+            try:
+                results[index] = func()
+            except Exception as error:
+                results[index] = error
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        _wait_until(lambda: self.flight.stats()["calls"] == count)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_gets_share_one_call(self):
+        """
+        同時に実行された同一のGETが1回の送信にまとめられることをテスト
+        """
+        def slow_send(*args, **kwargs):
+            self.release.wait(5)
+            return {"id": "A1", "tags": ["x"]}
+
+        with mock.patch.object(LogilessClient, "_send", side_effect=slow_send) as mock_send:
+            results = self._run_concurrently(8, lambda: self.client.article.get("A1"))
+
+        assert mock_send.call_count == 1
+        assert all(result == {"id": "A1", "tags": ["x"]} for result in results)
+        # 呼び出し元ごとに別のオブジェクトを受け取る
+        assert len({id(result) for result in results}) == 8
+        assert self.flight.stats() == {"calls": 8, "executions": 1, "collapsed": 7, "errors": 0}
+        assert self.flight.in_flight() == 0
+
+    def test_errors_are_shared(self):
+        def failing_send(*args, **kwargs):
+            self.release.wait(5)
+            raise LogilessServerError("サーバーエラー", status_code=503)
+
+        with mock.patch.object(LogilessClient, "_send", side_effect=failing_send) as mock_send:
+            results = self._run_concurrently(4, lambda: self.client.warehouse.list())
+
+        assert mock_send.call_count == 1
+        assert all(isinstance(result, LogilessServerError) for result in results)
+        assert all(result.status_code == 503 for result in results)
+        # 待機していた呼び出し元には別の例外オブジェクトを送出し、トレースバックを共有しない
+        assert len({id(result) for result in results}) == 4
+        assert self.flight.stats()["errors"] == 1
+
+    @mock.patch.object(LogilessClient, "_send", return_value={"items": []})
+    def test_different_params_and_writes_are_not_collapsed(self, mock_send):
+        self.client.article.list(page=1)
+        self.client.article.list(page=2)
+        self.client.article.update("A1", {"name": "x"})
+        assert mock_send.call_count == 3
+        assert self.flight.stats()["executions"] == 2
+
+    def test_different_timeouts_are_not_collapsed(self):
+        def slow_send(*args, **kwargs):
+            self.release.wait(5)
+            return {"id": "A1"}
+
+        def with_timeout(index):
+            if index % 2:
+                return self.client.article.get("A1")
+            with request_timeout(1.0):
+                return self.client.article.get("A1")
+
+        counter = iter(range(4))
+        with mock.patch.object(LogilessClient, "_send", side_effect=slow_send) as mock_send:
+            results = self._run_concurrently(4, lambda: with_timeout(next(counter)))
+
+        assert mock_send.call_count == 2
+        assert all(result == {"id": "A1"} for result in results)
+
+    def test_waiter_is_bounded_by_its_own_deadline(self):
+        """
+        待機している呼び出し元が、実行中の呼び出しを待たずに自身の期限で打ち切られることをテスト
+        """
+        def slow_send(*args, **kwargs):
+            self.release.wait(5)
+            return {"id": "A1"}
+
+        with mock.patch.object(LogilessClient, "_send", side_effect=slow_send) as mock_send:
+            leader = threading.Thread(target=lambda: self.client.article.get("A1"))
+            leader.start()
+            _wait_until(lambda: self.flight.in_flight() == 1)
+            started = time.monotonic()
+            try:
+                with deadline(0.05):
+                    self.client.article.get("A1")
+            except LogilessDeadlineExceeded:
+                pass
+            else:
+                raise AssertionError("期限切れになりませんでした")
+            assert time.monotonic() - started < 1.0
+            self.release.set()
+            leader.join()
+
+        assert mock_send.call_count == 1
+
+    def test_leader_deadline_is_not_inherited(self):
+        """
+        実行した呼び出し元の期限切れが、期限のない待機中の呼び出し元に伝わらないことをテスト
+        """
+        def send(*args, **kwargs):
+            if mock_send.call_count == 1:
+                _wait_until(lambda: self.flight.stats()["collapsed"] == 1)
+                raise LogilessDeadlineExceeded("処理の期限を過ぎました")
+            return {"id": "A1"}
+
+        errors = []
+
+        def leader():
+            try:
+                with deadline(5):
+                    self.client.article.get("A1")
+            except LogilessDeadlineExceeded as error:
+                errors.append(error)
+
+        with mock.patch.object(LogilessClient, "_send", side_effect=send) as mock_send:
+            thread = threading.Thread(target=leader)
+            thread.start()
+            _wait_until(lambda: self.flight.in_flight() == 1)
+            assert self.client.article.get("A1") == {"id": "A1"}
+            thread.join()
+
+        assert len(errors) == 1
+        assert mock_send.call_count == 2
+        # 実行し直した呼び出し元は1回の呼び出しとして数える
+        assert self.flight.stats() == {"calls": 2, "executions": 2, "collapsed": 0, "errors": 1}
+
+    def test_interrupts_are_not_shared(self):
+        """
+        実行した呼び出し元の SystemExit などを待機中の呼び出し元に送出せず、実行し直すことをテスト
+        """
+        def interrupted():
+            _wait_until(lambda: self.flight.stats()["collapsed"] == 1)
+            raise SystemExit
+
+        def run_leader():
+            try:
+                self.flight.do("key", interrupted)
+            except SystemExit:
+                pass
+
+        leader = threading.Thread(target=run_leader)
+        leader.start()
+        _wait_until(lambda: self.flight.in_flight() == 1)
+        assert self.flight.do("key", lambda: "result") == "result"
+        leader.join()
+        assert self.flight.stats() == {"calls": 2, "executions": 2, "collapsed": 0, "errors": 0}
+
+    def test_key_includes_merchant(self):
+        key = SingleFlight.make_key("GET", "https://example.com/a", {"page": 1}, "m1")
+        assert key == SingleFlight.make_key("get", "https://example.com/a", {"page": 1}, "m1")
+        assert key != SingleFlight.make_key("GET", "https://example.com/a", {"page": 1}, "m2")
+
+    def test_disabled_by_default(self):
+        assert LogilessClient("token", "merchant").single_flight is None
@@ -0,0 +1,81 @@
+"""
+JSONコーデックモジュールのテスト
+"""
+import json
+from unittest import mock
+
+import pytest
+import requests
+
+from pylogiless import JSONCodec, LogilessClient, get_codec
+from pylogiless.api.errors import LogilessError, LogilessValidationError
+from pylogiless.api.session import build_response
+
+PAYLOAD = {"items": [{"article_id": "商品1", "quantity": 3, "price": 1.5, "tags": None}], "total": 1}
+
+
+class TestCodecs:
+    """
+    コーデックのテストケース
+    """
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_round_trip(self, name):
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        codec = get_codec(name)
+        encoded = codec.dumps(PAYLOAD)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == PAYLOAD
+        assert codec.loads(encoded) == PAYLOAD
+        with pytest.raises(ValueError):
+            codec.loads(b"{invalid")
+
+    def test_get_codec(self):
+        codec = JSONCodec()
+        assert get_codec(codec) is codec
+        assert isinstance(get_codec("auto"), JSONCodec)
+        with pytest.raises(ValueError):
+            get_codec("unknown")
+
+
+class TestClientCodec:
+    """
+    LogilessClientとコーデックの連携テスト
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("token", "merchant", json_codec="auto")
+
+    @mock.patch.object(requests.Session, "request")
+    def test_decodes_response_bytes(self, mock_request):
+        mock_request.return_value = build_response(
+            200, {"Content-Type": "application/json"}, json.dumps(PAYLOAD).encode("utf-8")
+        )
+        with mock.patch.object(requests.Response, "json", side_effect=AssertionError("response.json()は使用しない")):
+            assert self.client.actual_inventory_summary.list() == PAYLOAD
+
+    @mock.patch.object(requests.Session, "request")
+    def test_encodes_request_body(self, mock_request):
+        mock_request.return_value = build_response(201, {"Content-Type": "application/json"}, b'{"id":"1"}')
+        orders = {"orders": [{"code": "SO-1", "lines": [{"article_id": "A1", "quantity": 1}]}]}
+
+        assert self.client.sales_order.create(orders) == {"id": "1"}
+
+        kwargs = mock_request.call_args[1]
+        assert kwargs["json"] is None
+        assert json.loads(kwargs["data"]) == orders
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    @mock.patch.object(requests.Session, "request")
+    def test_error_bodies(self, mock_request):
+        mock_request.return_value = build_response(
+            400, {"Content-Type": "application/json"}, b'{"message": "Validation Failed", "errors": {"code": "required"}}'
+        )
+        with pytest.raises(LogilessValidationError):
+            self.client.sales_order.create({})
+
+        mock_request.return_value = build_response(200, {"Content-Type": "application/json"}, b"{broken")
+        with pytest.raises(LogilessError) as excinfo:
+            self.client.sales_order.list()
+        assert isinstance(excinfo.value.__cause__, ValueError)
@@ -0,0 +1,102 @@
+"""
+条件付きリクエストモジュールのテスト
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pylogiless import LogilessClient, ValidatorStore
+
+BODY = json.dumps({"items": [{"id": i, "name": f"商品{i}"} for i in range(50)], "total": 50}).encode("utf-8")
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    ETagに対応したテスト用ハンドラ
+    """
+
+    protocol_version = "HTTP/1.1"
+    seen = []
+
+    def do_GET(self):
+        self.seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestConditionalRequests:
+    """
+    ValidatorStoreとLogilessClientの連携テスト
+    """
+
+    def test_not_modified_serves_stored_body(self, server):
+        """
+        304の場合に保存済みの本文が返されることをテスト
+        """
+        store = ValidatorStore()
+        client = LogilessClient("token", "merchant", api_base_url=server, validator_store=store)
+
+        first = client.article.list(page=1)
+        second = client.article.list(page=1)
+
+        assert first == second == json.loads(BODY)
+        assert _Handler.seen == [None, ETAG]
+        stats = store.stats()
+        assert stats["not_modified"] == 1
+        assert stats["bytes_saved"] == len(BODY)
+        assert stats["entries"] == 1
+
+    def test_params_and_merchant_are_part_of_key(self, server):
+        """
+        クエリパラメータやマーチャントが異なる場合は検証子を送らないことをテスト
+        """
+        store = ValidatorStore()
+        LogilessClient("token", "m1", api_base_url=server, validator_store=store).article.list(page=1)
+        LogilessClient("token", "m1", api_base_url=server, validator_store=store).article.list(page=2)
+        LogilessClient("token", "m2", api_base_url=server, validator_store=store).article.list(page=1)
+
+        assert _Handler.seen == [None, None, None]
+        assert store.stats()["entries"] == 3
+
+    def test_store_persists_between_runs(self, server, tmp_path):
+        """
+        SQLiteファイルに保存した検証子が次回起動時にも使われることをテスト
+        """
+        path = str(tmp_path / "validators.sqlite3")
+        store = ValidatorStore(path)
+        LogilessClient("token", "merchant", api_base_url=server, validator_store=store).article.list()
+        store.close()
+
+        store = ValidatorStore(path)
+        result = LogilessClient("token", "merchant", api_base_url=server, validator_store=store).article.list()
+
+        assert result["total"] == 50
+        assert _Handler.seen == [None, ETAG]
+        assert store.stats()["not_modified"] == 1
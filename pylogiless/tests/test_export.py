@@ -0,0 +1,192 @@
+"""
+ファイルへの書き出しのテスト
+"""
+import csv
+import json
+import os
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests.adapters import BaseAdapter
+
+from pylogiless import LogilessClient
+from pylogiless.api.errors import LogilessError, LogilessServerError
+from pylogiless.api.export import apply_column_types, checkpoint_path, infer_schema
+from pylogiless.api.session import build_response
+
+
+def _article(i):
+    return {"id": i, "code": f"A-{i:03d}", "price": 100 + i * 0.5, "active": i % 2 == 0, "tags": ["x"], "note": None}
+
+
+class _Adapter(BaseAdapter):
+    """
+    総件数25件の商品一覧をページ単位で返すアダプタ（fail_page のページは1回だけ500を返す）
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+        self.fail_page = None
+
+    def send(self, request, **kwargs):
+        query = parse_qs(urlsplit(request.url).query)
+        page, limit = int(query["page"][0]), int(query["limit"][0])
+        self.pages.append(page)
+        if page == self.fail_page:
+            self.fail_page = None
+            status, data = 500, {"message": "error"}
+        else:
+            items = [_article(i) for i in range((page - 1) * limit, min(page * limit, 25))]
+            status, data = 200, {"items": items, "total": 25}
+        response = build_response(status, {"Content-Type": "application/json"}, json.dumps(data).encode())
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    client = LogilessClient("token", "m1", api_base_url="https://api.test/v1")
+    client.session.mount("https://api.test/", _Adapter())
+    return client
+
+
+def _adapter(client):
+    return client.session.get_adapter("https://api.test/")
+
+
+def test_infer_schema():
+    schema = infer_schema([{"a": 1, "b": None, "c": "x"}, {"a": 1.5, "b": None, "c": 2, "d": {"k": 1}, "e": True}])
+    assert schema == [("a", "number"), ("b", "string"), ("c", "string"), ("d", "json"), ("e", "boolean")]
+
+
+def test_apply_column_types():
+    schema = [("id", "integer"), ("price", "integer")]
+    assert apply_column_types(schema, None) == schema
+    assert apply_column_types(schema, {"price": "number", "note": "string"}) == [
+        ("id", "integer"), ("price", "number"), ("note", "string")
+    ]
+    with pytest.raises(ValueError):
+        apply_column_types(schema, {"price": "decimal"})
+
+
+def test_export_csv_in_chunks(client, tmp_path):
+    path = str(tmp_path / "articles.csv")
+    stats = client.article.export(path, chunk_size=10, limit=5, prefetch=False)
+    assert stats == {"rows": 25, "chunks": 3, "pages": 5, "resumed": False}
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["code"] for row in rows] == [f"A-{i:03d}" for i in range(25)]
+    assert rows[0] == {"id": "0", "code": "A-000", "price": "100.0", "active": "True", "tags": '["x"]', "note": ""}
+    assert not os.path.exists(checkpoint_path(path))
+
+
+def test_export_jsonl_resumes_after_interruption(client, tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    adapter = _adapter(client)
+    adapter.fail_page = 4
+    with pytest.raises(LogilessServerError):
+        client.article.export(path, chunk_size=10, limit=5, prefetch=False)
+    with open(checkpoint_path(path), encoding="utf-8") as handle:
+        checkpoint = json.load(handle)
+    assert checkpoint["next_page"] == 3 and checkpoint["rows"] == 10
+    # 書きかけの行が残っていても切り詰めて再開する
+    with open(path, "ab") as handle:
+        handle.write(b'{"id": 10, "co')
+
+    adapter.pages.clear()
+    stats = client.article.export(path, chunk_size=10, limit=5, prefetch=False)
+    assert stats == {"rows": 25, "chunks": 3, "pages": 3, "resumed": True}
+    assert adapter.pages == [3, 4, 5]
+    with open(path, encoding="utf-8") as handle:
+        records = [json.loads(line) for line in handle]
+    assert records == [_article(i) for i in range(25)]
+    assert not os.path.exists(checkpoint_path(path))
+
+
+def test_checkpoint_conditions_must_match(client, tmp_path):
+    path = str(tmp_path / "articles.csv")
+    _adapter(client).fail_page = 3
+    with pytest.raises(LogilessServerError):
+        client.article.export(path, chunk_size=5, limit=5, prefetch=False)
+    with pytest.raises(LogilessError, match="limit"):
+        client.article.export(path, chunk_size=5, limit=10, prefetch=False)
+    stats = client.article.export(path, chunk_size=5, limit=10, resume=False)
+    assert stats["rows"] == 25 and not stats["resumed"]
+    with pytest.raises(ValueError):
+        client.article.export(str(tmp_path / "articles.xlsx"))
+
+
+@pytest.mark.parametrize("content", ["", '{"version": 1, "next_p', "[]", '{"version": 1}'])
+def test_corrupt_checkpoint(client, tmp_path, content):
+    path = str(tmp_path / "articles.csv")
+    with open(checkpoint_path(path), "w", encoding="utf-8") as handle:
+        handle.write(content)
+    with pytest.raises(LogilessError, match="resume=False"):
+        client.article.export(path, chunk_size=10, limit=5)
+    assert client.article.export(path, chunk_size=10, limit=5, resume=False)["rows"] == 25
+
+
+def test_export_parquet(client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "articles.parquet")
+    stats = client.article.export(path, chunk_size=10, limit=5)
+    assert stats["chunks"] == 3
+    assert sorted(os.listdir(path)) == ["part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+    table = pq.read_table(path)
+    assert table.num_rows == 25
+    assert str(table.schema.field("price").type) == "double"
+    assert table.column("tags").to_pylist()[0] == '["x"]'
+
+
+def test_parquet_refuses_non_empty_directory(client, tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "articles.parquet"
+    path.mkdir()
+    (path / "part-00007.parquet").write_bytes(b"other")
+    (path / "README").write_text("keep")
+    with pytest.raises(LogilessError, match="overwrite=True"):
+        client.article.export(str(path), chunk_size=10, limit=5)
+    assert sorted(os.listdir(path)) == ["README", "part-00007.parquet"]
+
+    stats = client.article.export(str(path), chunk_size=10, limit=5, overwrite=True)
+    assert stats["chunks"] == 3
+    assert sorted(os.listdir(path)) == ["README", "part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+
+
+def test_parquet_resume_removes_only_unfinished_parts(client, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "articles.parquet")
+    _adapter(client).fail_page = 4
+    with pytest.raises(LogilessServerError):
+        client.article.export(path, chunk_size=10, limit=5, prefetch=False)
+    # 中断後に残った書きかけのパーツファイル
+    with open(os.path.join(path, "part-00001.parquet.tmp"), "wb") as handle:
+        handle.write(b"partial")
+
+    stats = client.article.export(path, chunk_size=10, limit=5, prefetch=False)
+    assert stats["resumed"] and stats["chunks"] == 3
+    assert sorted(os.listdir(path)) == ["part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+    assert pq.read_table(path).num_rows == 25
+
+
+def test_parquet_column_types(client, tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    import pylogiless.api.export as export_module
+
+    # 最初のページは整数、以降のページは小数の価格（整数値の小数は integer のまま書き込める）
+    monkeypatch.setattr(
+        export_module, "infer_schema", lambda records: [("id", "integer"), ("price", "integer"), ("note", "string")]
+    )
+    path = str(tmp_path / "articles.parquet")
+    with pytest.raises(LogilessError, match="列 price.*column_types"):
+        client.article.export(path, chunk_size=10, limit=5)
+
+    stats = client.article.export(path, chunk_size=10, limit=5, resume=False, overwrite=True, column_types={"price": "number"})
+    assert stats["rows"] == 25
+    table = pq.read_table(path)
+    assert str(table.schema.field("price").type) == "double"
+    assert table.column("price").to_pylist()[:2] == [100.0, 100.5]
@@ -0,0 +1,96 @@
+"""
+APIResource.get_manyのテスト
+"""
+from unittest import mock
+
+import pytest
+
+from pylogiless import LogilessClient, ResponseCache
+from pylogiless.api.errors import LogilessError, LogilessServerError
+
+ARTICLES = {str(i): {"id": str(i), "name": f"商品{i}"} for i in range(1, 8)}
+
+
+def fake_request(method, url, params=None, **kwargs):
+    """
+    ID絞り込み（ids=1,2,...）と個別取得に応答するrequestの代替
+    """
+    params = params or {}
+    if url.endswith("/articles"):
+        ids = params["ids"].split(",")
+        return {"items": [ARTICLES[i] for i in ids if i in ARTICLES], "total": len(ids)}
+    resource_id = url.rsplit("/", 1)[-1]
+    if resource_id == "boom":
+        raise LogilessServerError("サーバーエラー", status_code=500)
+    if resource_id not in ARTICLES:
+        raise LogilessError("Not Found", status_code=404)
+    return ARTICLES[resource_id]
+
+
+class TestGetMany:
+    """
+    get_manyのテストケース
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("token", "merchant")
+
+    @mock.patch.object(LogilessClient, "request", side_effect=fake_request)
+    def test_chunked_filter(self, mock_request):
+        """
+        IDを分割して絞り込み取得し、見つからないIDを報告することをテスト
+        """
+        result = self.client.article.get_many(["1", "2", "3", "99", "4", "5", "2"], filter_param="ids", chunk_size=2)
+
+        assert list(result) == ["1", "2", "3", "4", "5"]
+        assert result["4"] == ARTICLES["4"]
+        assert result.missing == ["99"]
+        assert mock_request.call_count == 3
+        assert sorted(call[1]["params"]["ids"] for call in mock_request.call_args_list) == ["1,2", "3,99", "4,5"]
+        assert all(call[1]["params"]["limit"] == 2 for call in mock_request.call_args_list)
+
+    @mock.patch.object(LogilessClient, "request", side_effect=fake_request)
+    def test_concurrent_get_fallback(self, mock_request):
+        """
+        絞り込みに対応していない場合は個別のgetを並行に実行することをテスト
+        """
+        assert self.client.article.id_filter_param is None
+        result = self.client.article.get_many([1, 2, 42], concurrency=3)
+
+        assert result == {1: ARTICLES["1"], 2: ARTICLES["2"]}
+        assert result.missing == [42]
+        assert mock_request.call_count == 3
+
+    @mock.patch.object(LogilessClient, "request", side_effect=fake_request)
+    def test_other_errors_propagate(self, mock_request):
+        with pytest.raises(LogilessServerError):
+            self.client.article.get_many(["1", "boom"])
+
+    @mock.patch.object(LogilessClient, "request", side_effect=fake_request)
+    def test_uses_response_cache(self, mock_request):
+        """
+        キャッシュ済みのIDは送信せず、取得したレコードをキャッシュに保存することをテスト
+        """
+        client = LogilessClient("token", "merchant", response_cache=ResponseCache(ttls={"articles": 60}))
+        client.article.get("1")
+        mock_request.reset_mock()
+
+        result = client.article.get_many(["1", "2", "3"], filter_param="ids")
+        assert set(result) == {"1", "2", "3"}
+        assert mock_request.call_args[1]["params"]["ids"] == "2,3"
+
+        # 一覧のレコードは詳細と形が異なる場合があるため、getのキーには保存しない
+        mock_request.reset_mock()
+        assert set(client.article.get_many(["2", "3"], filter_param="ids")) == {"2", "3"}
+        assert mock_request.call_count == 0
+        client.article.get("3")
+        assert mock_request.call_count == 1
+
+    @mock.patch.object(LogilessClient, "request", side_effect=fake_request)
+    def test_list_records_fill_get_cache_when_shapes_match(self, mock_request):
+        client = LogilessClient("token", "merchant", response_cache=ResponseCache(ttls={"articles": 60}))
+        client.article.list_record_matches_detail = True
+        client.article.get_many(["2", "3"], filter_param="ids")
+        mock_request.reset_mock()
+        assert client.article.get("3") == ARTICLES["3"]
+        assert mock_request.call_count == 0
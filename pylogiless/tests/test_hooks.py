@@ -0,0 +1,157 @@
+"""
+リクエストのライフサイクルフックのテスト
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pylogiless import Hooks, LogilessClient, RetryPolicy
+from pylogiless.api.client import ENDPOINT_RESOURCES
+from pylogiless.api.errors import LogilessServerError
+from pylogiless.api.hooks import parse_route
+
+BASE = "https://app2.logiless.com/api/v1"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        data = json.loads(self.rfile.read(length)) if length else {}
+        if "/failing" in self.path:
+            status, payload = 503, {"error": "unavailable"}
+        else:
+            status, payload = 200, {"id": "123", **data}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _recording_hooks():
+    hooks = Hooks()
+    events = []
+    for name in ("before_request", "after_response", "on_retry", "on_error"):
+        hooks.register(name, lambda event, name=name: events.append((name, event)))
+    return hooks, events
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (f"{BASE}/merchant/m1/articles", ("article", "merchant/{merchant_id}/articles", None)),
+        (f"{BASE}/merchant/m1/sales_orders/42?x=1", ("sales_order", "merchant/{merchant_id}/sales_orders/{id}", "42")),
+        (f"{BASE}/merchant/m1/outbound_deliveries/7/cancel", ("outbound_delivery", "merchant/{merchant_id}/outbound_deliveries/{id}/cancel", "7")),
+        (f"{BASE}/merchant/m1/unknown", (None, "merchant/{merchant_id}/unknown", None)),
+        ("https://example.com/api/article/123", (None, "api/article/123", None)),
+    ],
+)
+def test_parse_route(url, expected):
+    route = parse_route(url, BASE, ENDPOINT_RESOURCES)
+    assert (route.resource, route.url_template, route.resource_id) == expected
+
+
+def test_events_carry_route_status_bytes_and_timings(server):
+    """
+    イベントにリソース名・URLテンプレート・ステータス・バイト数・所要時間が記録されることをテスト
+    """
+    hooks, events = _recording_hooks()
+    client = LogilessClient("token", "m1", api_base_url=server, hooks=hooks)
+
+    client.article.get("123")
+    client.sales_order.create({"code": "SO-1"})
+
+    assert [name for name, _ in events] == ["before_request", "after_response"] * 2
+    first, created = events[1][1], events[3][1]
+    assert first.resource == "article"
+    assert first.method == "GET"
+    assert first.url_template == "merchant/{merchant_id}/articles/{id}"
+    assert first.resource_path == "merchant/{merchant_id}/articles"
+    assert first.resource_id == "123"
+    assert first.merchant_id == "m1"
+    assert first.status_code == 200
+    assert first.bytes_sent == 0
+    assert first.bytes_received == len(b'{"id": "123"}')
+    # 最初のリクエストのみ新規接続の時間を含む
+    assert first.connect_time > 0
+    assert created.connect_time == 0
+    for event in (first, created):
+        assert event.wait_time >= 0 and event.receive_time >= 0 and event.decode_time >= 0
+        assert event.elapsed >= event.connect_time + event.wait_time
+    assert created.resource == "sales_order"
+    assert created.resource_id is None
+    assert created.bytes_sent == len(json.dumps({"code": "SO-1"}))
+
+
+def test_retry_and_error_events(server):
+    hooks, events = _recording_hooks()
+    policy = RetryPolicy(max_retries=1, sleep=lambda delay: None)
+    client = LogilessClient("token", "m1", api_base_url=server, hooks=hooks, retry_policy=policy)
+
+    with pytest.raises(LogilessServerError):
+        client.request("GET", f"{server}/merchant/m1/failing")
+
+    assert [name for name, _ in events] == [
+        "before_request", "after_response", "on_retry",
+        "before_request", "after_response", "on_error",
+    ]
+    retry, error = events[2][1], events[5][1]
+    assert retry.attempt == 0 and retry.retry_delay is not None
+    assert error.attempt == 1 and error.status_code == 503
+    assert isinstance(error.error, LogilessServerError)
+
+
+def test_register_decorator_and_unregister():
+    hooks = Hooks()
+    assert not hooks.active
+
+    @hooks.register("after_response")
+    def callback(event):
+        pass
+
+    assert hooks.active
+    hooks.unregister("after_response", callback)
+    assert not hooks.active
+    with pytest.raises(ValueError):
+        hooks.register("on_success", callback)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_hook_errors_propagate_unchanged(server, stream):
+    """
+    フックの例外がJSONパースエラーなどに変換されずにそのまま伝わることをテスト
+    """
+    error = ValueError("hook failed")
+    hooks = Hooks()
+
+    @hooks.register("after_response")
+    def callback(event):
+        raise error
+
+    client = LogilessClient("token", "m1", api_base_url=server, hooks=hooks)
+    with pytest.raises(ValueError) as excinfo:
+        if stream:
+            client.stream("GET", f"{server}/merchant/m1/articles")
+        else:
+            client.request("GET", f"{server}/merchant/m1/articles")
+    assert excinfo.value is error
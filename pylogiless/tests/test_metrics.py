@@ -0,0 +1,133 @@
+"""
+メトリクス集計モジュールのテスト
+"""
+import json
+
+import pytest
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+
+from pylogiless import CircuitBreaker, LogilessClient, MetricsRegistry, RetryPolicy
+from pylogiless.api.errors import LogilessCircuitOpenError, LogilessError, LogilessServerError
+from pylogiless.api.hooks import Hooks, RequestEvent, Route
+from pylogiless.api.session import build_response
+
+
+class _Adapter(BaseAdapter):
+    """
+    パスに応じて固定のレスポンスを返すアダプタ
+    """
+
+    def send(self, request, **kwargs):
+        if request.url.endswith("/broken"):
+            raise ConnectionError("connection reset")
+        status = 503 if "outbound_deliveries" in request.url else 200
+        response = build_response(status, {"Content-Type": "application/json"}, json.dumps({"id": "1"}).encode())
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _client(**kwargs):
+    client = LogilessClient("token", "m1", api_base_url="https://api.test/v1", **kwargs)
+    client.session.mount("https://api.test/", _Adapter())
+    return client
+
+
+def _event(resource, elapsed):
+    event = RequestEvent("GET", "https://api.test", Route(resource, "", "", None))
+    event.elapsed = elapsed
+    event.status_code = 200
+    return event
+
+
+def test_counts_errors_retries_and_bytes_per_resource():
+    metrics = MetricsRegistry()
+    client = _client(metrics=metrics, retry_policy=RetryPolicy(max_retries=1, sleep=lambda delay: None))
+
+    client.article.get("1")
+    client.sales_order.create({"code": "SO-1"})
+    with pytest.raises(LogilessServerError):
+        client.outbound_delivery.get("9")
+    with pytest.raises(LogilessError):
+        client.request("GET", "https://api.test/v1/merchant/m1/articles/broken")
+
+    snapshot = metrics.snapshot()
+    article = snapshot["article"]["GET"]
+    assert article["requests"] == 3
+    assert article["retries"] == 1
+    assert article["errors"] == {"LogilessError": 1}
+    assert article["bytes_received"] == len(b'{"id": "1"}')
+    assert article["latency"]["count"] == 3
+
+    created = snapshot["sales_order"]["POST"]
+    assert created["requests"] == 1 and created["errors"] == {}
+    assert created["bytes_sent"] == len(json.dumps({"code": "SO-1"}))
+
+    delivery = snapshot["outbound_delivery"]["GET"]
+    assert delivery["requests"] == 2
+    assert delivery["errors"] == {"LogilessServerError": 1}
+
+
+def test_circuit_open_is_counted_separately():
+    """
+    サーキットが開いていて送信しなかった呼び出しを、エラーやリクエストとして数えないことをテスト
+    """
+    metrics = MetricsRegistry(prefix="app")
+    client = _client(metrics=metrics, circuit_breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(LogilessServerError):
+        client.outbound_delivery.get("9")
+    for _ in range(2):
+        with pytest.raises(LogilessCircuitOpenError):
+            client.outbound_delivery.get("9")
+
+    delivery = metrics.snapshot()["outbound_delivery"]["GET"]
+    assert delivery["requests"] == 1
+    assert delivery["errors"] == {"LogilessServerError": 1}
+    assert delivery["circuit_open"] == 2
+    assert delivery["latency"]["count"] == 1
+    assert 'app_circuit_open_total{resource="outbound_delivery",method="GET"} 2' in metrics.to_prometheus()
+
+
+def test_percentiles_from_histogram():
+    metrics = MetricsRegistry(buckets=[0.1, 0.2, 0.5, 1.0])
+    hooks = Hooks()
+    metrics.install(hooks)
+    for elapsed in [0.05] * 90 + [0.3] * 9 + [5.0]:
+        hooks.emit("after_response", _event("article", elapsed))
+
+    latency = metrics.snapshot()["article"]["GET"]["latency"]
+    assert latency["count"] == 100
+    assert latency["p50"] == pytest.approx(0.1 * 50 / 90)
+    assert 0.2 < latency["p95"] <= 0.5
+    assert latency["p99"] == pytest.approx(0.5)
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_text():
+    metrics = MetricsRegistry(buckets=[0.1, 1.0], prefix="app")
+    hooks = Hooks()
+    metrics.install(hooks)
+    hooks.emit("after_response", _event("article", 0.05))
+    hooks.emit("after_response", _event("article", 2.0))
+    error = _event("article", 0.5)
+    error.error = LogilessServerError("unavailable", 503)
+    hooks.emit("on_error", error)
+
+    text = metrics.to_prometheus()
+    assert "# TYPE app_request_duration_seconds histogram" in text
+    assert 'app_requests_total{resource="article",method="GET"} 2' in text
+    assert 'app_request_duration_seconds_bucket{resource="article",method="GET",le="0.1"} 1' in text
+    assert 'app_request_duration_seconds_bucket{resource="article",method="GET",le="1.0"} 1' in text
+    assert 'app_request_duration_seconds_bucket{resource="article",method="GET",le="+Inf"} 2' in text
+    assert 'app_errors_total{resource="article",method="GET",error="LogilessServerError"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_invalid_buckets():
+    with pytest.raises(ValueError):
+        MetricsRegistry(buckets=[1.0, 0.5])
@@ -0,0 +1,115 @@
+"""
+レコードモデルモジュールのテスト
+"""
+import pickle
+import tracemalloc
+from unittest import mock
+
+import pytest
+
+from pylogiless import ActualInventorySummary, LogilessClient, SalesOrder
+from pylogiless.api.errors import LogilessError
+from pylogiless.api.models import SalesOrderLine
+
+ORDER = {
+    "id": 1,
+    "code": "SO-1",
+    "status": "open",
+    "lines": [{"id": 10, "article_id": "A1", "quantity": 2}],
+    "memo": "gift",
+}
+
+
+class TestRecord:
+    """
+    Recordクラスのテストケース
+    """
+
+    def test_dict_style_access(self):
+        order = SalesOrder(ORDER)
+        assert order.code == "SO-1"
+        assert order["status"] == "open"
+        assert order["memo"] == order.memo == "gift"
+        assert order.get("store_id") is None
+        assert order.store_id is None
+        assert "store_id" not in order
+        assert set(order) == {"id", "code", "status", "lines", "memo"}
+        with pytest.raises(KeyError):
+            order["store_id"]
+        with pytest.raises(AttributeError):
+            order.unknown_field
+
+    def test_nested_fields_are_decoded_lazily(self):
+        order = SalesOrder(ORDER)
+        assert isinstance(object.__getattribute__(order, "_lines")[0], dict)
+
+        line = order.lines[0]
+        assert isinstance(line, SalesOrderLine)
+        assert line.quantity == 2
+        # 2回目以降は変換済みのモデルを返す
+        assert order.lines[0] is line
+
+    def test_equality_and_round_trip(self):
+        order = SalesOrder(ORDER)
+        assert order == ORDER
+        assert order.to_dict() == ORDER
+        assert pickle.loads(pickle.dumps(order)) == ORDER
+
+    def test_no_instance_dict(self):
+        record = ActualInventorySummary({"article_id": "A1", "quantity": 1})
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.new_attribute = 1
+
+    def test_uses_less_memory_than_dict(self):
+        """
+        宣言済みフィールドのみのレコードは辞書よりメモリ使用量が小さいことをテスト
+        """
+        rows = [
+            {"id": i, "article_id": f"A{i}", "warehouse_id": "W1", "quantity": i, "updated_at": "2024-01-01"}
+            for i in range(2000)
+        ]
+
+        def measure(factory):
+            tracemalloc.start()
+            try:
+                objects = [factory(row) for row in rows]
+                return tracemalloc.get_traced_memory()[0], objects
+            finally:
+                tracemalloc.stop()
+
+        dict_bytes, _ = measure(dict)
+        record_bytes, _ = measure(ActualInventorySummary)
+        assert record_bytes < dict_bytes * 0.6
+
+
+class TestResourceRecords:
+    """
+    APIResourceのas_recordsオプションのテスト
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("token", "merchant")
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_opt_in_per_call(self, mock_request):
+        mock_request.return_value = {"items": [ORDER], "total": 1}
+
+        assert isinstance(self.client.sales_order.list()["items"][0], dict)
+        page = self.client.sales_order.list(as_records=True)
+        assert isinstance(page["items"][0], SalesOrder)
+        assert page["total"] == 1
+        assert mock_request.call_args[1]["params"] == {}
+
+        records = list(self.client.sales_order.iter_all(as_records=True))
+        assert records[0].lines[0].article_id == "A1"
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_get_as_record(self, mock_request):
+        mock_request.return_value = {"id": "A1", "code": "C1"}
+        article = self.client.article.get("A1", as_records=True)
+        assert article.code == "C1"
+
+    def test_resource_without_model(self):
+        with pytest.raises(LogilessError):
+            self.client.warehouse.list(as_records=True)
@@ -0,0 +1,241 @@
+"""
+ページングモジュールのテスト
+"""
+import threading
+from unittest import mock
+
+from pylogiless import LogilessClient
+from pylogiless.api.pagination import extract_items, extract_total, infer_page_size, is_last_page
+
+
+def _fake_pages(total, requested=None, max_limit=None):
+    """
+    総件数totalの一覧を返すrequestの代替関数を生成する（max_limitを超えるlimitはサーバー側で切り詰める）
+    """
+    def request(method, url, params=None, **kwargs):
+        page, limit = params["page"], params["limit"]
+        if max_limit is not None:
+            limit = min(limit, max_limit)
+        if requested is not None:
+            requested.append(page)
+        start = (page - 1) * limit
+        items = [{"id": i} for i in range(start, min(start + limit, total))]
+        return {"items": items, "total": total}
+    return request
+
+
+class TestPaginationHelpers:
+    """
+    ページング補助関数のテストケース
+    """
+
+    def test_extract_items(self):
+        assert extract_items({"items": [{"id": 1}]}) == [{"id": 1}]
+        assert extract_items({"data": [{"id": 2}]}) == [{"id": 2}]
+        assert extract_items([{"id": 3}]) == [{"id": 3}]
+        assert extract_items({"text": "x"}) == []
+
+    def test_extract_total(self):
+        assert extract_total({"total": "5"}) == 5
+        assert extract_total({"total_count": 7}) == 7
+        assert extract_total({"items": []}) is None
+
+    def test_is_last_page(self):
+        assert is_last_page({"items": [1, 2]}, 1, 3) is True
+        assert is_last_page({"items": [1, 2, 3], "total": 6}, 2, 3) is True
+        assert is_last_page({"items": [1, 2, 3], "total": 7}, 2, 3) is False
+        # サーバーがlimitより少ない件数に制限している場合は総件数で判定する
+        assert is_last_page({"items": [1, 2], "total": 7}, 1, 3, page_size=2) is False
+        assert is_last_page({"items": [1], "total": 7}, 4, 3, page_size=2) is True
+        assert is_last_page({"items": [], "total": 7}, 5, 3, page_size=2) is True
+
+
+class TestAPIResourceIteration:
+    """
+    APIResource.iter_pages / iter_all のテストケース
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("test_access_token", "test_merchant_id")
+
+    def test_infer_page_size(self):
+        page = {"items": [{"id": i} for i in range(5)], "total": 95}
+        # 最終ページの件数が少ないだけの場合はlimitを使う
+        assert infer_page_size(page, 10, 10) == 10
+        # 最終ページでないのにlimitに満たない場合はサーバーの制限とみなす
+        assert infer_page_size(page, 1, 10) == 5
+        assert infer_page_size({"items": page["items"]}, 1, 10) == 10
+
+    def test_iter_all_yields_every_record(self):
+        """
+        全ページのレコードが順番通りに返されることをテスト
+        """
+        requested = []
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(25, requested)):
+            ids = [item["id"] for item in self.client.article.iter_all(limit=10, status="active")]
+
+        assert ids == list(range(25))
+        assert requested == [1, 2, 3]
+
+    def test_server_capped_page_size(self):
+        """
+        サーバーが1ページの件数をlimitより小さく制限していても全ページを取得することをテスト
+        """
+        for prefetch in (True, False):
+            requested = []
+            with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(250, requested, max_limit=100)):
+                ids = [item["id"] for item in self.client.article.iter_all(limit=500, prefetch=prefetch)]
+
+            assert ids == list(range(250))
+            assert requested == [1, 2, 3]
+
+    def test_iter_pages_without_prefetch(self):
+        """
+        先読みを無効にしても全ページが返されることをテスト
+        """
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(20)) as mock_request:
+            pages = list(self.client.transaction_log.iter_pages(limit=10, prefetch=False))
+
+        assert [len(page["items"]) for page in pages] == [10, 10]
+        assert mock_request.call_args_list[0] == mock.call(
+            "GET",
+            f"{self.client.api_base_url}/merchant/test_merchant_id/transaction_logs",
+            params={"page": 1, "limit": 10},
+        )
+
+    def test_next_page_is_prefetched(self):
+        """
+        現在のページを処理している間に次のページが取得されることをテスト
+        """
+        fetched_second = threading.Event()
+        fake = _fake_pages(30)
+
+        def request(method, url, params=None, **kwargs):
+            if params["page"] == 2:
+                fetched_second.set()
+            return fake(method, url, params=params)
+
+        with mock.patch.object(LogilessClient, "request", side_effect=request):
+            pages = self.client.article.iter_pages(limit=10)
+            next(pages)
+            assert fetched_second.wait(timeout=1)
+            pages.close()
+
+    def test_early_close_stops_fetching(self):
+        """
+        途中で反復を止めた場合に以降のページを取得しないことをテスト
+        """
+        requested = []
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(100, requested)):
+            records = self.client.article.iter_all(limit=10, prefetch=False)
+            assert next(records) == {"id": 0}
+            records.close()
+
+        assert requested == [1]
+
+
+class TestParallelScan:
+    """
+    並列スキャンのテストケース
+    """
+
+    def setup_method(self):
+        self.client = LogilessClient("test_access_token", "test_merchant_id")
+
+    def test_parallel_scan_in_order(self):
+        """
+        並列取得でもページ番号順にレコードが返されることをテスト
+        """
+        requested = []
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(95, requested)):
+            ids = [item["id"] for item in self.client.article.iter_all(limit=10, parallelism=4)]
+
+        assert ids == list(range(95))
+        assert sorted(requested) == list(range(1, 11))
+
+    def test_parallel_scan_with_server_capped_page_size(self):
+        """
+        サーバーが1ページの件数を制限している場合に、実際の件数から残りのページ数を求めることをテスト
+        """
+        requested = []
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(950, requested, max_limit=100)):
+            ids = [item["id"] for item in self.client.article.iter_all(limit=500, parallelism=4)]
+
+        assert ids == list(range(950))
+        assert sorted(requested) == list(range(1, 11))
+
+    def test_parallel_scan_resumed_on_short_last_page(self):
+        """
+        途中のページから再開し、最初のページが件数の少ない最終ページの場合に余分なページを取得しないことをテスト
+        """
+        requested = []
+        with mock.patch.object(LogilessClient, "request", side_effect=_fake_pages(95, requested)):
+            ids = [item["id"] for item in self.client.article.iter_all(limit=10, start_page=10, parallelism=4)]
+
+        assert ids == list(range(90, 95))
+        assert requested == [10]
+
+    def test_parallel_scan_unordered(self):
+        """
+        順序を問わない場合に取得完了順で全レコードが返されることをテスト
+        """
+        fake = _fake_pages(50)
+        last_page_seen = threading.Event()
+
+        def request(method, url, params=None, **kwargs):
+            # 2ページ目は最後のページが呼び出し元に届くまで返さない
+            if params["page"] == 2:
+                last_page_seen.wait(timeout=1)
+            return fake(method, url, params=params)
+
+        order = []
+        with mock.patch.object(LogilessClient, "request", side_effect=request):
+            for page in self.client.article.iter_pages(limit=10, parallelism=4, ordered=False):
+                order.append(page["items"][0]["id"] // 10 + 1)
+                if order[-1] == 5:
+                    last_page_seen.set()
+
+        assert order[0] == 1
+        assert sorted(order) == [1, 2, 3, 4, 5]
+        assert order.index(5) < order.index(2)
+
+    def test_parallelism_is_bounded(self):
+        """
+        同時に実行されるリクエスト数がparallelismを超えないことをテスト
+        """
+        fake = _fake_pages(200)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def request(method, url, params=None, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                threading.Event().wait(0.005)
+                return fake(method, url, params=params)
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        with mock.patch.object(LogilessClient, "request", side_effect=request):
+            count = sum(1 for _ in self.client.article.iter_all(limit=10, parallelism=3))
+
+        assert count == 200
+        assert state["peak"] <= 3
+
+    def test_parallel_scan_without_total_falls_back(self):
+        """
+        総件数がない場合に逐次取得へ切り替わることをテスト
+        """
+        fake = _fake_pages(25)
+
+        def request(method, url, params=None, **kwargs):
+            page = fake(method, url, params=params)
+            del page["total"]
+            return page
+
+        with mock.patch.object(LogilessClient, "request", side_effect=request):
+            ids = [item["id"] for item in self.client.article.iter_all(limit=10, parallelism=4)]
+
+        assert ids == list(range(25))
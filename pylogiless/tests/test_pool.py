@@ -0,0 +1,120 @@
+"""
+複数マーチャントのクライアントプールと公平なスケジューラーのテスト
+"""
+import json
+import threading
+import time
+
+import pytest
+from requests.adapters import BaseAdapter
+
+from pylogiless import ClientPool, FairScheduler, LogilessDeadlineExceeded, LogilessError, RateLimiter
+from pylogiless.api.session import build_response
+
+
+class _Adapter(BaseAdapter):
+    """
+    受信したURLと認証ヘッダーを記録して200を返すアダプタ
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append((request.url, request.headers["Authorization"], request.headers["X-Merchant-ID"]))
+        body = json.dumps({"items": [], "total": 0}).encode()
+        response = build_response(200, {"Content-Type": "application/json"}, body)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _wait_for(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        time.sleep(0.002)
+    raise AssertionError("条件が満たされませんでした")
+
+
+def _run_queued(scheduler, keys):
+    """
+    枠を1つ保持した状態で keys の順に待機させ、枠を返却して割り当てられた順を返す
+    """
+    order = []
+    scheduler.acquire("holder")
+
+    def worker(key):
+        with scheduler.slot(key):
+            order.append(key)
+
+    threads = []
+    for i, key in enumerate(keys):
+        thread = threading.Thread(target=worker, args=(key,))
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: sum(scheduler.stats()["waiting"].values()) == i + 1)
+    scheduler.release("holder")
+    for thread in threads:
+        thread.join(5)
+    return order
+
+
+def test_round_robin_prevents_starvation():
+    scheduler = FairScheduler(max_concurrency=1)
+    order = _run_queued(scheduler, ["bulk"] * 5 + ["orders", "orders"])
+    assert order == ["bulk", "orders", "bulk", "orders", "bulk", "bulk", "bulk"]
+    assert scheduler.stats() == {"active": 0, "in_flight": {}, "waiting": {}}
+
+
+def test_weights_and_per_key_limit():
+    scheduler = FairScheduler(max_concurrency=1)
+    scheduler.set_weight("orders", 2)
+    order = _run_queued(scheduler, ["bulk"] * 3 + ["orders"] * 4)
+    assert order == ["bulk", "orders", "orders", "bulk", "orders", "orders", "bulk"]
+
+    limited = FairScheduler(max_concurrency=3, max_per_key=1)
+    limited.acquire("bulk")
+    with pytest.raises(LogilessDeadlineExceeded):
+        limited.acquire("bulk", max_wait=0.01)
+    assert limited.acquire("orders", max_wait=0.01) == 0.0
+    assert limited.stats()["waiting"] == {}
+
+
+def test_pool_shares_session_and_keeps_merchants_separate():
+    limiters = {}
+    pool = ClientPool(
+        api_base_url="https://api.test/v1",
+        rate_limiter_factory=lambda merchant_id: limiters.setdefault(merchant_id, RateLimiter(rate=100)),
+    )
+    adapter = _Adapter()
+    pool.session.mount("https://api.test/", adapter)
+    m1 = pool.add_merchant("m1", "token-1")
+    m2 = pool.add_merchant("m2", "token-2", weight=3)
+
+    m1.sales_order.list()
+    pool["m2"].sales_order.list()
+    assert adapter.sent == [
+        ("https://api.test/v1/merchant/m1/sales_orders", "Bearer token-1", "m1"),
+        ("https://api.test/v1/merchant/m2/sales_orders", "Bearer token-2", "m2"),
+    ]
+    assert m1.session is m2.session is pool.session
+    assert m1.rate_limiter is limiters["m1"] and m2.rate_limiter is limiters["m2"]
+    assert m1.scheduler is m2.scheduler is pool.scheduler
+
+    pool.update_token("m1", "token-1b")
+    m1.article.get("a1")
+    assert adapter.sent[-1][1] == "Bearer token-1b"
+
+    # マーチャントのクライアントを閉じてもプールのセッションは閉じない
+    m1.close()
+    assert sorted(pool.merchants()) == ["m1", "m2"] and "m2" in pool and len(pool) == 2
+    with pytest.raises(ValueError):
+        pool.add_merchant("m1", "token")
+    pool.remove_merchant("m1")
+    with pytest.raises(LogilessError):
+        pool.client("m1")
+    pool.close()
@@ -0,0 +1,189 @@
+"""
+レート制限モジュールのテスト
+"""
+import multiprocessing
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from pylogiless import LogilessClient
+from pylogiless.api.errors import LogilessRateLimitError
+from pylogiless.api.ratelimit import FileBackend, RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """
+    sleepで進む仮想時計
+    """
+
+    def __init__(self, now=1700000000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _try_acquire_in_process(path, count, results):
+    limiter = RateLimiter(rate=0.001, burst=5.0, min_rate=0.001, backend=FileBackend(path))
+    granted = 0
+    for _ in range(count):
+        granted += limiter.backend.transact(limiter._try_acquire) == 0.0
+    results.put(granted)
+
+
+class TestParseRetryAfter:
+    """
+    parse_retry_afterのテストケース
+    """
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("invalid") is None
+
+    def test_http_date(self):
+        assert parse_retry_after("Thu, 01 Jan 1970 00:00:10 GMT", now=4.0) == 6.0
+
+
+class TestRateLimiter:
+    """
+    RateLimiterクラスのテストケース
+    """
+
+    def test_burst_then_throttle(self):
+        """
+        バケット容量を使い切った後はレートに従って待機することをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=2.0, burst=2.0)
+
+        for _ in range(2):
+            assert limiter.acquire() == 0.0
+        assert limiter.acquire() == pytest.approx(0.5)
+        assert limiter.acquire() == pytest.approx(0.5)
+
+    def test_429_decreases_rate_and_sets_ceiling(self):
+        """
+        429を受けるとレートを下げ、以後は上限の手前で止まることをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10.0, max_rate=20.0, increase=1.0)
+
+        limiter.update(429, {})
+        stats = limiter.stats()
+        assert stats["rate"] == 5.0
+        assert stats["ceiling"] == 9.0
+        assert stats["throttled"] == 1
+
+        for _ in range(10):
+            limiter.update(200, {})
+        assert limiter.stats()["rate"] == 9.0
+
+    def test_ceiling_expires(self):
+        """
+        一定時間が経過すると上限が解除されることをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10.0, max_rate=20.0, increase=5.0, ceiling_ttl=30.0)
+        limiter.update(429, {})
+        clock.now += 31
+        for _ in range(5):
+            limiter.update(200, {})
+        assert limiter.stats()["rate"] == 20.0
+
+    def test_retry_after_blocks(self):
+        """
+        Retry-Afterの間は送信を待機することをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=100.0)
+        limiter.update(429, {"Retry-After": "2"})
+        assert limiter.acquire() == pytest.approx(2.0)
+
+    def test_remaining_headers(self):
+        """
+        残数ヘッダーに応じてレートを抑えることをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10.0)
+        limiter.update(200, {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "60"})
+        assert limiter.stats()["rate"] == pytest.approx(0.5)
+
+        limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.now + 5)})
+        assert limiter.acquire() == pytest.approx(5.0)
+
+    def test_shared_between_threads(self):
+        """
+        複数スレッドで共有してもトークンを超えて送信しないことをテスト
+        """
+        limiter = RateLimiter(rate=0.001, burst=5.0, min_rate=0.001)
+        acquired = []
+
+        def worker():
+            limiter.backend.transact(lambda state: acquired.append(limiter._try_acquire(state) == 0.0))
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert acquired.count(True) == 5
+
+    def test_file_backend_shared_between_processes(self, tmp_path):
+        """
+        FileBackendで複数プロセス間の状態を共有できることをテスト
+        """
+        path = str(tmp_path / "ratelimit.json")
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_try_acquire_in_process, args=(path, 10, results))
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert sum(results.get(timeout=1) for _ in processes) == 5
+
+
+class TestClientRateLimiting:
+    """
+    LogilessClientとレート制限の連携テスト
+    """
+
+    @mock.patch.object(requests.Session, "request")
+    def test_client_feeds_responses_to_limiter(self, mock_request):
+        """
+        レスポンスがレートリミッターに渡されることをテスト
+        """
+        clock = FakeClock()
+        limiter = _limiter(clock, rate=10.0)
+        client = LogilessClient("token", "merchant", rate_limiter=limiter)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Content-Type": "application/json", "Retry-After": "1"}
+        mock_response.json.return_value = {"error": "rate_limit_exceeded"}
+        mock_request.return_value = mock_response
+
+        with pytest.raises(LogilessRateLimitError):
+            client.article.list()
+        assert limiter.stats()["throttled"] == 1
+
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"items": []}
+        client.article.list()
+        assert clock.slept == [pytest.approx(1.0)]
@@ -0,0 +1,134 @@
+"""
+リトライモジュールのテスト
+"""
+from unittest import mock
+
+import pytest
+import requests
+
+from pylogiless import LogilessClient, RetryPolicy
+from pylogiless.api.errors import (
+    LogilessError,
+    LogilessResourceLockedError,
+    LogilessServerError,
+    LogilessValidationError,
+)
+
+
+def _response(status_code, body=None, headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = {"Content-Type": "application/json", **(headers or {})}
+    response.json.return_value = body if body is not None else {}
+    return response
+
+
+class TestRetryPolicy:
+    """
+    RetryPolicyクラスのテストケース
+    """
+
+    def test_full_jitter_backoff(self):
+        """
+        バックオフが指数的に増え、上限で打ち切られることをテスト
+        """
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, random_func=lambda: 1.0)
+        assert [policy.backoff(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+        policy = RetryPolicy(backoff_base=1.0, random_func=lambda: 0.25)
+        assert policy.backoff(2) == 1.0
+
+    def test_only_idempotent_methods(self):
+        """
+        既定では冪等なメソッドのみリトライ対象となることをテスト
+        """
+        policy = RetryPolicy()
+        error = LogilessServerError("error", 503)
+        assert policy.is_retryable("GET", error)
+        assert policy.is_retryable("PUT", error)
+        assert not policy.is_retryable("POST", error)
+        assert RetryPolicy(retry_methods={"POST"}).is_retryable("POST", error)
+
+    def test_retryable_errors(self):
+        """
+        423/429/5xxと通信エラーのみがリトライ対象となることをテスト
+        """
+        policy = RetryPolicy()
+        assert policy.is_retryable("GET", LogilessResourceLockedError("locked", 423))
+        assert not policy.is_retryable("GET", LogilessValidationError("invalid", 400))
+        assert not policy.is_retryable("GET", LogilessError("no token"))
+
+        transport_error = LogilessError("APIリクエストエラー")
+        transport_error.__cause__ = requests.ConnectionError()
+        assert policy.is_retryable("GET", transport_error)
+
+    def test_retry_after_and_budget(self):
+        """
+        Retry-Afterの尊重と合計時間の上限をテスト
+        """
+        policy = RetryPolicy(random_func=lambda: 0.0, budget=10.0)
+        error = LogilessServerError("busy", 503, headers={"Retry-After": "4"})
+        assert policy.next_delay("GET", 0, error, elapsed=0.0) == 4.0
+        assert policy.next_delay("GET", 0, error, elapsed=7.0) is None
+        assert policy.stats()["exhausted"] == 1
+
+
+class TestClientRetry:
+    """
+    LogilessClientのリトライ動作のテストケース
+    """
+
+    def setup_method(self):
+        self.sleeps = []
+        self.events = []
+        self.policy = RetryPolicy(
+            max_retries=3,
+            random_func=lambda: 0.5,
+            sleep=self.sleeps.append,
+            on_retry=self.events.append,
+        )
+        self.client = LogilessClient("token", "merchant", retry_policy=self.policy)
+
+    @mock.patch.object(requests.Session, "request")
+    def test_recovers_after_transient_errors(self, mock_request):
+        """
+        一時的なエラーの後に成功した場合に結果が返ることをテスト
+        """
+        mock_request.side_effect = [
+            _response(503),
+            requests.ConnectionError("reset"),
+            _response(200, {"id": "1"}),
+        ]
+
+        assert self.client.article.get("1") == {"id": "1"}
+        assert mock_request.call_count == 3
+        assert self.sleeps == [0.25, 0.5]
+        assert [event["attempt"] for event in self.events] == [1, 2]
+        assert self.policy.stats() == {"retries": 2, "recovered": 1, "exhausted": 0}
+
+    @mock.patch.object(requests.Session, "request")
+    def test_gives_up_and_reports_retries(self, mock_request):
+        """
+        上限に達した場合に最後のエラーとリトライ回数が返ることをテスト
+        """
+        mock_request.return_value = _response(423, {"error": "locked"})
+
+        with pytest.raises(LogilessResourceLockedError) as excinfo:
+            self.client.outbound_delivery.update("1", {"status": "shipped"})
+
+        assert excinfo.value.retries == 3
+        assert mock_request.call_count == 4
+        assert self.policy.stats()["exhausted"] == 1
+
+    @mock.patch.object(requests.Session, "request")
+    def test_post_is_not_retried(self, mock_request):
+        """
+        POSTは既定でリトライされないことをテスト
+        """
+        mock_request.return_value = _response(500)
+
+        with pytest.raises(LogilessServerError) as excinfo:
+            self.client.sales_order.create({"code": "A"})
+
+        assert excinfo.value.retries == 0
+        assert mock_request.call_count == 1
@@ -0,0 +1,81 @@
+"""
+セッションモジュールのテスト
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pylogiless import LogilessClient
+from pylogiless.api.session import LogilessSession
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    keep-aliveに対応したテスト用ハンドラ
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"items": [], "total": 0}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestLogilessSession:
+    """
+    LogilessSessionクラスのテストケース
+    """
+
+    def test_client_owns_pooled_session(self):
+        """
+        クライアントがプール設定付きのセッションを保持することをテスト
+        """
+        client = LogilessClient("token", "merchant", pool_connections=3, pool_maxsize=7)
+        assert isinstance(client.session, LogilessSession)
+        assert client.session.adapter._pool_connections == 3
+        assert client.session.adapter._pool_maxsize == 7
+        assert client.article.client.session is client.sales_order.client.session
+
+    def test_connections_are_reused(self, server):
+        """
+        keep-aliveによりコネクションが再利用されることをテスト
+        """
+        with LogilessClient("token", "merchant", api_base_url=server) as client:
+            for _ in range(3):
+                client.article.list()
+            stats = client.connection_stats()
+
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+
+    def test_keep_alive_disabled(self, server):
+        """
+        keep-aliveを無効にした場合に毎回新規接続となることをテスト
+        """
+        with LogilessClient("token", "merchant", api_base_url=server, keep_alive=False) as client:
+            for _ in range(2):
+                client.article.list()
+            stats = client.connection_stats()
+
+        assert stats["new_connections"] == 2
+        assert stats["reused_connections"] == 0
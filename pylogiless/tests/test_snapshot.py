@@ -0,0 +1,81 @@
+"""
+在庫スナップショットモジュールのテスト
+"""
+from unittest import mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pylogiless import InventorySnapshot, LogilessClient  # noqa: E402
+
+RECORDS = [
+    {"article_id": "A1", "warehouse_id": "W1", "quantity": 10},
+    {"article_id": "A2", "warehouse_id": "W1", "quantity": 0},
+    {"article_id": "A1", "warehouse_id": "W2", "quantity": 3},
+    {"article_id": "A3", "warehouse_id": "W2", "quantity": 2},
+    {"article_id": "A1", "warehouse_id": "W1", "quantity": 1},
+]
+
+
+class TestInventorySnapshot:
+    """
+    InventorySnapshotクラスのテストケース
+    """
+
+    def setup_method(self):
+        self.snapshot = InventorySnapshot.from_records(iter(RECORDS))
+
+    def test_columns_are_integer_encoded(self):
+        assert len(self.snapshot) == 5
+        assert self.snapshot.articles == ["A1", "A2", "A3"]
+        assert self.snapshot.warehouses == ["W1", "W2"]
+        assert self.snapshot.article_codes.tolist() == [0, 1, 0, 2, 0]
+        assert self.snapshot.quantities.dtype == np.float64
+        assert self.snapshot.nbytes == 5 * (4 + 4 + 8)
+
+    def test_group_by_sums(self):
+        assert self.snapshot.total() == 16.0
+        assert self.snapshot.total_by_warehouse() == {"W1": 11.0, "W2": 5.0}
+        assert self.snapshot.total_by_article() == {"A1": 14.0, "A2": 0.0, "A3": 2.0}
+        assert self.snapshot.total_by_article(warehouse="W2") == {"A1": 3.0, "A2": 0.0, "A3": 2.0}
+
+    def test_threshold_queries(self):
+        assert self.snapshot.zero_stock() == ["A2"]
+        assert self.snapshot.below(3) == ["A2", "A3"]
+        assert self.snapshot.zero_stock(warehouse="W1") == ["A2", "A3"]
+
+    def test_lookup_sums_duplicate_rows(self):
+        assert self.snapshot.quantity("A1", "W1") == 11.0
+        assert self.snapshot.quantity("A3", "W2") == 2.0
+        assert self.snapshot.quantity("A3", "W1") == 0.0
+        assert self.snapshot.quantity("unknown", "W1") == 0.0
+        assert self.snapshot.matrix().tolist() == [[11.0, 3.0], [0.0, 0.0], [0.0, 2.0]]
+
+    def test_filter(self):
+        filtered = self.snapshot.filter(warehouse="W2", min_quantity=3)
+        assert len(filtered) == 1
+        assert filtered.quantity("A1", "W2") == 3.0
+        assert len(self.snapshot.filter(article="unknown")) == 0
+
+    def test_empty(self):
+        snapshot = InventorySnapshot.from_records([])
+        assert len(snapshot) == 0
+        assert snapshot.total_by_warehouse() == {}
+        assert snapshot.quantity("A1", "W1") == 0.0
+
+    @mock.patch.object(LogilessClient, "request")
+    def test_from_resource_reads_all_pages(self, mock_request):
+        """
+        リソースの全ページを読み込んでスナップショットを生成することをテスト
+        """
+        def fake_request(method, url, params=None, **kwargs):
+            page, limit = params["page"], params["limit"]
+            return {"items": RECORDS[(page - 1) * limit:page * limit], "total": len(RECORDS)}
+
+        mock_request.side_effect = fake_request
+        client = LogilessClient("token", "merchant")
+        snapshot = InventorySnapshot.from_resource(client.actual_inventory_summary, limit=2)
+
+        assert mock_request.call_count == 3
+        assert snapshot.total_by_warehouse() == {"W1": 11.0, "W2": 5.0}
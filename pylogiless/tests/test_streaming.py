@@ -0,0 +1,164 @@
+"""
+一覧レスポンスの逐次解析モジュールのテスト
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pylogiless import ItemStream, LogilessClient, SalesOrder
+from pylogiless.api.errors import LogilessAuthError, LogilessError
+
+PAGE = {
+    "total": 3,
+    "items": [
+        {"id": 1, "name": "商品①", "quantity": 12345},
+        {"id": 2, "name": "\\u00e9\\n", "tags": [1, 2.5e3, None, True]},
+        {"id": 3, "nested": {"items": [{"id": 99}]}},
+    ],
+    "next": None,
+}
+
+
+def _chunks(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestItemStream:
+    """
+    ItemStreamクラスのテストケース
+    """
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 4096])
+    def test_items_across_chunk_boundaries(self, size):
+        """
+        マルチバイト文字や数値がチャンク境界で分割されても正しくデコードすることをテスト
+        """
+        body = json.dumps(PAGE, ensure_ascii=False).encode("utf-8")
+        stream = ItemStream(_chunks(body, size))
+        assert list(stream) == PAGE["items"]
+        assert stream.meta == {"total": 3, "next": None}
+
+    def test_meta_before_items_is_available_first(self):
+        stream = ItemStream([json.dumps(PAGE).encode("utf-8")])
+        first = next(stream)
+        assert first["id"] == 1
+        assert stream.meta == {"total": 3}
+
+    def test_top_level_array_and_alternate_key(self):
+        assert list(ItemStream([b" [1, 2 ,3] "])) == [1, 2, 3]
+        assert list(ItemStream([b'{"data": [{"id": 1}], "total_count": 1}'])) == [{"id": 1}]
+        assert list(ItemStream([b'{"items": []}'])) == []
+        assert list(ItemStream([b"{}"])) == []
+
+    def test_transform_and_close_callback(self):
+        closed = []
+        stream = ItemStream([json.dumps(PAGE).encode("utf-8")], transform=SalesOrder, on_close=lambda: closed.append(1))
+        assert isinstance(next(stream), SalesOrder)
+        stream.close()
+        assert closed == [1]
+        stream.close()
+        assert closed == [1]
+
+    def test_transform_errors_propagate_unchanged(self):
+        """
+        変換関数の例外はJSONの解析エラーに変換されずにそのまま伝わることをテスト
+        """
+        error = ValueError("invalid record")
+
+        def transform(item):
+            raise error
+
+        closed = []
+        stream = ItemStream([json.dumps(PAGE).encode("utf-8")], transform=transform, on_close=lambda: closed.append(1))
+        with pytest.raises(ValueError) as excinfo:
+            next(stream)
+        assert excinfo.value is error
+        assert closed == [1]
+
+    @pytest.mark.parametrize("body", [b'{"items": [1, 2', b'{"items": [1 2]}', b'{"items": []} x', b"", b'{"items": [tru]}'])
+    def test_invalid_json(self, body):
+        with pytest.raises(ValueError):
+            list(ItemStream(_chunks(body, 3)))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    レコードを分割して送信し、途中でテスト側の合図を待つハンドラ
+    """
+
+    protocol_version = "HTTP/1.1"
+    first_item_seen = None
+
+    def do_GET(self):
+        if self.path.startswith("/merchant/m/sales_orders/denied"):
+            body = b'{"error": "invalid_token"}'
+            self.send_response(401)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(b'{"total": 2, "items": [{"id": 1},')
+        # 1件目がクライアントに届くまで残りを送らない
+        self.first_item_seen.wait(5)
+        self._chunk(b' {"id": 2}]}')
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.first_item_seen = threading.Event()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    _Handler.first_item_seen.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestClientStreaming:
+    """
+    APIResource.list(stream=True)のテスト
+    """
+
+    def test_items_arrive_before_body_completes(self, server):
+        """
+        本文の受信完了前に最初のレコードを受け取れることをテスト
+        """
+        client = LogilessClient("token", "m", api_base_url=server)
+        stream = client.sales_order.list(stream=True, as_records=True)
+
+        first = next(stream)
+        assert first.id == 1
+        _Handler.first_item_seen.set()
+        assert [order.id for order in stream] == [2]
+        assert stream.meta == {"total": 2}
+
+        # 読み終えたコネクションはプールに返却され、次のリクエストで再利用される
+        _Handler.first_item_seen.set()
+        assert len(list(client.sales_order.list(stream=True))) == 2
+        assert client.connection_stats()["new_connections"] == 1
+
+    def test_error_status(self, server):
+        client = LogilessClient("token", "m", api_base_url=server)
+        with pytest.raises(LogilessAuthError):
+            client.stream("GET", f"{server}/merchant/m/sales_orders/denied")
+
+    def test_transport_error(self):
+        client = LogilessClient("token", "m", api_base_url="http://127.0.0.1:9")
+        with pytest.raises(LogilessError):
+            client.sales_order.list(stream=True)
@@ -0,0 +1,198 @@
+"""
+在庫差分同期モジュールのテスト
+"""
+import threading
+from unittest import mock
+
+import pytest
+
+from pylogiless import InventoryMirror, InventorySync, LogilessClient
+from pylogiless.api.errors import LogilessError
+
+
+class FakeLogiless:
+    """
+    実在庫サマリと取引ログを返すrequestの代替
+    """
+
+    def __init__(self):
+        self.inventory = {("A1", "W1"): 10.0, ("A2", "W1"): 5.0}
+        self.logs = [{"id": 1, "article_id": "A1", "warehouse_id": "W1", "quantity": 0}]
+        self.calls = []
+        # 実在庫サマリのページを返す前に呼び出す関数（ページ番号を受け取る）
+        self.on_snapshot_page = None
+
+    def add_log(self, article_id, warehouse_id, quantity):
+        entry = {"id": self.logs[-1]["id"] + 1, "article_id": article_id, "warehouse_id": warehouse_id, "quantity": quantity}
+        self.logs.append(entry)
+        key = (article_id, warehouse_id)
+        self.inventory[key] = self.inventory.get(key, 0) + quantity
+
+    def __call__(self, method, url, params=None, **kwargs):
+        params = dict(params or {})
+        self.calls.append((url.rsplit("/", 1)[-1], params))
+        if url.endswith("transaction_logs"):
+            if params.get("sort") == "-id":
+                return {"items": self.logs[-1:], "total": len(self.logs)}
+            since = params.get("since_id", 0)
+            items = [entry for entry in self.logs if entry["id"] > since]
+            return self._page(items, params)
+        if self.on_snapshot_page is not None:
+            self.on_snapshot_page(params.get("page", 1))
+        items = [
+            {"article_id": article_id, "warehouse_id": warehouse_id, "quantity": quantity}
+            for (article_id, warehouse_id), quantity in sorted(self.inventory.items())
+        ]
+        return self._page(items, params)
+
+    @staticmethod
+    def _page(items, params):
+        page, limit = params.get("page", 1), params.get("limit", 100)
+        return {"items": items[(page - 1) * limit:page * limit], "total": len(items)}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInventorySync:
+    """
+    InventorySyncクラスのテストケース
+    """
+
+    def setup_method(self):
+        self.fake = FakeLogiless()
+        self.clock = FakeClock()
+        self.mirror = InventoryMirror()
+        self.client = LogilessClient("token", "merchant")
+        self.patcher = mock.patch.object(LogilessClient, "request", side_effect=self.fake)
+        self.patcher.start()
+        self.sync = InventorySync(self.client, self.mirror, page_limit=2, verify_interval=600, clock=self.clock)
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_sync_requires_bootstrap(self):
+        with pytest.raises(LogilessError):
+            self.sync.sync()
+
+    def test_bootstrap_then_apply_deltas(self):
+        """
+        スナップショット後に取引ログの増減のみが適用されることをテスト
+        """
+        assert self.sync.run_once()["bootstrapped"] == 2
+        assert self.sync.cursor == 1
+
+        self.fake.add_log("A1", "W1", -3)
+        self.fake.add_log("A3", "W2", 7)
+        self.fake.calls.clear()
+
+        assert self.sync.run_once()["applied"] == 2
+        assert self.mirror.quantities() == self.fake.inventory
+        assert self.sync.cursor == 3
+        # 差分同期では実在庫サマリを取得しない
+        assert all(endpoint == "transaction_logs" for endpoint, _ in self.fake.calls)
+        assert self.fake.calls[0][1]["since_id"] == 1
+
+        assert self.sync.run_once()["applied"] == 0
+
+    def test_transactions_during_bootstrap_are_not_double_counted(self):
+        """
+        スナップショット取得中の取引ログを二重に適用せず、取得中もミラーを読めることをテスト
+        """
+        self.fake.inventory = {("A1", "W1"): 10.0, ("A2", "W1"): 5.0, ("A3", "W1"): 1.0}
+        reads = []
+
+        def during_scan(page):
+            if page != 2:
+                return
+            # 2ページ目の取得前に発生した取引: A3は2ページ目に反映され、A0は取得済みの範囲に入るため漏れる
+            self.fake.add_log("A3", "W1", 4)
+            self.fake.add_log("A0", "W1", 2)
+            reader = threading.Thread(target=lambda: reads.append(self.mirror.get_quantity("A1", "W1")))
+            reader.start()
+            reader.join(1)
+
+        self.fake.on_snapshot_page = during_scan
+        self.sync.bootstrap()
+        self.fake.on_snapshot_page = None
+
+        assert reads == [None]
+        assert self.sync.cursor == 3
+        assert self.mirror.quantities() == self.fake.inventory
+
+        self.fake.add_log("A3", "W1", -1)
+        assert self.sync.sync() == 1
+        assert self.mirror.quantities() == self.fake.inventory
+
+    def test_concurrent_staging_does_not_interfere(self):
+        """
+        同時に保存中のスナップショットが互いの作業用テーブルを消さないことをテスト
+        """
+        first, first_count = self.mirror.stage_snapshot([("A1", "W1", 1.0, {}), ("A2", "W1", 2.0, {})])
+        second, _ = self.mirror.stage_snapshot([("B1", "W1", 3.0, {})])
+        assert first != second
+
+        self.mirror.swap_snapshot(second, {})
+        assert self.mirror.quantities() == {("B1", "W1"): 3.0}
+        assert self.mirror.swap_snapshot(first, {}) == first_count == 2
+        assert self.mirror.quantities() == {("A1", "W1"): 1.0, ("A2", "W1"): 2.0}
+
+        def failing_rows():
+            yield ("C1", "W1", 1.0, {})
+            raise LogilessError("取得に失敗しました")
+
+        with pytest.raises(LogilessError):
+            self.mirror.stage_snapshot(failing_rows(), batch_size=1)
+        assert self.mirror._conn.execute("SELECT COUNT(*) FROM sqlite_temp_master").fetchone()[0] == 0
+
+    def test_resume_from_persisted_cursor(self, tmp_path):
+        """
+        プロセスを再起動しても保存されたカーソルから再開することをテスト
+        """
+        path = str(tmp_path / "mirror.sqlite3")
+        mirror = InventoryMirror(path)
+        InventorySync(self.client, mirror).bootstrap()
+        self.fake.add_log("A2", "W1", 4)
+        mirror.close()
+
+        mirror = InventoryMirror(path)
+        sync = InventorySync(self.client, mirror)
+        assert sync.sync() == 1
+        assert mirror.get_quantity("A2", "W1") == 9.0
+
+    def test_failed_apply_does_not_advance_cursor(self):
+        """
+        適用中に失敗した場合はカーソルも在庫も更新されないことをテスト
+        """
+        self.sync.bootstrap()
+        self.fake.add_log("A1", "W1", 1)
+        self.fake.logs.append({"id": 3, "article_id": "A1", "warehouse_id": "W1", "quantity": "invalid"})
+
+        with pytest.raises(ValueError):
+            self.sync.sync()
+
+        assert self.sync.cursor == 1
+        assert self.mirror.get_quantity("A1", "W1") == 10.0
+
+    def test_periodic_verification_detects_drift(self):
+        """
+        一定間隔でスナップショットと照合し、差異を修正することをテスト
+        """
+        self.sync.bootstrap()
+        # 取引ログに現れない在庫変動
+        self.fake.inventory[("A2", "W1")] = 1.0
+
+        self.clock.now += 601
+        result = self.sync.run_once()
+
+        assert result["verification"]["mismatched"] == 1
+        assert result["verification"]["drift"] == [("A2", "W1")]
+        assert self.mirror.get_quantity("A2", "W1") == 1.0
+
+        self.clock.now += 10
+        assert self.sync.run_once()["verification"] is None
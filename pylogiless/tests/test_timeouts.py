@@ -0,0 +1,154 @@
+"""
+タイムアウトと期限のテスト
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+import requests
+
+from pylogiless import (
+    LogilessClient,
+    LogilessDeadlineExceeded,
+    LogilessTimeoutError,
+    RateLimiter,
+    RetryPolicy,
+    deadline,
+    request_timeout,
+)
+from pylogiless.api.timeouts import resolve_timeout
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """
+    クエリの delay 秒だけ待ってから、総件数100件の一覧ページを返すハンドラ
+    """
+
+    protocol_version = "HTTP/1.1"
+    requests = 0
+
+    def _respond(self):
+        type(self).requests += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        delay = float(self.path.split("delay=")[1].split("&")[0]) if "delay=" in self.path else 0.0
+        time.sleep(delay)
+        body = json.dumps({"items": [{"id": i} for i in range(10)], "total": 100}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _SlowHandler.requests = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_resolve_timeout_precedence_and_deadline_cap():
+    assert resolve_timeout((10.0, 60.0)) == (10.0, 60.0)
+    assert resolve_timeout((10.0, 60.0), 5.0) == 5.0
+    with request_timeout((1.0, 2.0)):
+        assert resolve_timeout((10.0, 60.0)) == (1.0, 2.0)
+        assert resolve_timeout((10.0, 60.0), 5.0) == 5.0
+    with deadline(3.0):
+        connect, read = resolve_timeout((10.0, 60.0))
+        assert connect <= 3.0 and read <= 3.0
+        # 内側の期限が外側より遅い場合は外側の期限を使う
+        with deadline(100.0) as inner:
+            assert inner.remaining() <= 3.0
+        connect, read = resolve_timeout((1.0, None))
+        assert connect == 1.0 and 2.0 < read <= 3.0
+
+
+@mock.patch.object(requests.Session, "request")
+def test_client_passes_default_and_per_call_timeouts(mock_request):
+    response = mock.Mock(status_code=200, headers={"Content-Type": "application/json"})
+    response.json.return_value = {"id": "1"}
+    mock_request.return_value = response
+
+    client = LogilessClient("token", "m1")
+    client.article.get("1")
+    assert mock_request.call_args.kwargs["timeout"] == (10.0, 60.0)
+    client.request("GET", f"{client.api_base_url}/merchant/m1/articles/1", timeout=3.0)
+    assert mock_request.call_args.kwargs["timeout"] == 3.0
+    with request_timeout((1.0, 5.0)):
+        client.article.get("1")
+    assert mock_request.call_args.kwargs["timeout"] == (1.0, 5.0)
+
+    LogilessClient("token", "m1", timeout=None).article.get("1")
+    assert mock_request.call_args.kwargs["timeout"] is None
+
+
+def test_read_timeout_raises_timeout_error(server):
+    client = LogilessClient("token", "m1", api_base_url=server, timeout=(1.0, 0.1))
+    with pytest.raises(LogilessTimeoutError) as excinfo:
+        client.article.list(delay=0.5)
+    assert not isinstance(excinfo.value, LogilessDeadlineExceeded)
+
+
+def test_deadline_stops_pagination(server):
+    """
+    期限を過ぎると残りのページを取得せずに失敗することをテスト
+    """
+    client = LogilessClient("token", "m1", api_base_url=server)
+    started = time.monotonic()
+    with pytest.raises(LogilessDeadlineExceeded):
+        with deadline(0.35):
+            for _ in client.article.iter_all(limit=10, delay=0.1):
+                pass
+    assert time.monotonic() - started < 1.0
+    assert _SlowHandler.requests < 10
+
+
+def test_deadline_propagates_to_parallel_workers(server):
+    client = LogilessClient("token", "m1", api_base_url=server)
+    with pytest.raises(LogilessDeadlineExceeded):
+        with deadline(0.3):
+            list(client.article.iter_all(limit=10, parallelism=4, delay=0.2))
+
+
+def test_deadline_fails_remaining_bulk_items_fast(server):
+    client = LogilessClient("token", "m1", api_base_url=server)
+    with deadline(0.01):
+        time.sleep(0.02)
+        report = client.sales_order.bulk_create([{"code": f"SO-{i}"} for i in range(20)], concurrency=4)
+    assert report.stats() == {"total": 20, "succeeded": 0, "failed": 20}
+    assert all(isinstance(result.error, LogilessDeadlineExceeded) for result in report)
+    assert _SlowHandler.requests == 0
+
+
+def test_retry_is_skipped_when_backoff_exceeds_deadline(server):
+    slept = []
+    policy = RetryPolicy(max_retries=3, backoff_base=5.0, random_func=lambda: 0.99, sleep=slept.append)
+    client = LogilessClient("token", "m1", api_base_url=server, retry_policy=policy, timeout=(1.0, 0.05))
+    with pytest.raises(LogilessTimeoutError):
+        with deadline(1.0):
+            client.article.list(delay=0.3)
+    assert slept == []
+
+
+def test_rate_limiter_wait_respects_deadline():
+    now = [0.0]
+    limiter = RateLimiter(rate=1.0, burst=1.0, clock=lambda: now[0], sleep=lambda seconds: now.__setitem__(0, now[0] + seconds))
+    limiter.acquire()
+    with pytest.raises(LogilessDeadlineExceeded):
+        limiter.acquire(max_wait=0.1)
+    assert limiter.acquire(max_wait=5.0) > 0
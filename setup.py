@@ -29,6 +29,12 @@ setup(
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "numpy": ["numpy>=1.17"],
+        "fast": ["orjson>=3.6"],
+        "parquet": ["pyarrow>=7.0"],
+    },
     keywords="logiless, api, logistics, inventory, warehouse",
     project_urls={
         "Bug Tracker": "https://github.com/logiless/pylogiless/issues",